@@ -1,22 +1,12 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from Services.lifecycle import get_milvus_service
+from Services.logger_config import get_milvus_logger
+from Services.responses import NumpyORJSONResponse
 
 router = APIRouter(prefix="/collection", tags=["collection"])
-
-# Lazy loading for milvus_service
-_milvus_service = None
-
-def get_milvus_service():
-    global _milvus_service
-    if _milvus_service is None:
-        try:
-            from Services.milvus_service import milvus_service
-            _milvus_service = milvus_service
-        except Exception as e:
-            print(f"Milvus service 초기화 실패: {e}")
-            raise HTTPException(status_code=500, detail="Milvus 서비스 초기화 실패")
-    return _milvus_service
+logger = get_milvus_logger()
 
 
 class CreateCollectionRequest(BaseModel):
@@ -35,11 +25,14 @@ class BulkDeleteCollectionsRequest(BaseModel):
     collection_names: List[str]
 
 
+class FlushCollectionRequest(BaseModel):
+    collection_name: str
+
+
 @router.post("/create")
-async def create_collection(request: CreateCollectionRequest):
+async def create_collection(request: CreateCollectionRequest, milvus_service=Depends(get_milvus_service)):
     """컬렉션 생성 API"""
     try:
-        milvus_service = get_milvus_service()
         result = await milvus_service.create_collection(
             collection_name=request.collection_name,
             dimension=request.dimension,
@@ -57,10 +50,9 @@ async def create_collection(request: CreateCollectionRequest):
 
 
 @router.post("/delete")
-async def delete_collection(request: DeleteCollectionRequest):
+async def delete_collection(request: DeleteCollectionRequest, milvus_service=Depends(get_milvus_service)):
     """컬렉션 삭제 API"""
     try:
-        milvus_service = get_milvus_service()
         result = await milvus_service.delete_collection(
             collection_name=request.collection_name
         )
@@ -74,10 +66,9 @@ async def delete_collection(request: DeleteCollectionRequest):
 
 
 @router.post("/bulk_delete")
-async def bulk_delete_collections(request: BulkDeleteCollectionsRequest):
+async def bulk_delete_collections(request: BulkDeleteCollectionsRequest, milvus_service=Depends(get_milvus_service)):
     """여러 컬렉션 일괄 삭제 API"""
     try:
-        milvus_service = get_milvus_service()
         result = await milvus_service.bulk_delete_collections(
             collection_names=request.collection_names
         )
@@ -90,64 +81,57 @@ async def bulk_delete_collections(request: BulkDeleteCollectionsRequest):
         raise HTTPException(status_code=500, detail=f"컬렉션 일괄 삭제 중 오류 발생: {str(e)}")
 
 
-@router.get("/collections")
-async def get_collections():
+@router.get("/collections", response_class=NumpyORJSONResponse)
+async def get_collections(milvus_service=Depends(get_milvus_service)):
     """모든 컬렉션 조회 API"""
     try:
-        milvus_service = get_milvus_service()
         result = await milvus_service.get_collections()
         
         if result["success"]:
-            return {
+            return NumpyORJSONResponse({
                 "status": "success",
                 "collections": result["collections"],
                 "count": len(result["collections"])
-            }
+            })
         else:
             raise HTTPException(status_code=400, detail=result["message"])
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        error_detail = f"컬렉션 조회 중 오류 발생: {str(e)}\n{traceback.format_exc()}"
-        print(error_detail)  # 서버 로그에 출력
+        # traceback 포맷팅은 로그 리스너 스레드에서 수행
+        logger.error(f"💥 [ROUTER] 컬렉션 조회 중 오류 발생: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"컬렉션 조회 중 오류 발생: {str(e)}")
 
 
 @router.get("/info/{collection_name}")
-async def get_collection_info(collection_name: str):
+async def get_collection_info(collection_name: str, milvus_service=Depends(get_milvus_service)):
     """컬렉션 정보 조회 API (metric_type 포함)"""
     try:
-        print(f"📋 [ROUTER] 컬렉션 정보 조회 API 호출됨")
-        print(f"📋 [ROUTER] 요청 데이터: collection_name={collection_name}")
+        logger.debug(f"📋 [ROUTER] 컬렉션 정보 조회 API 호출됨 - collection_name={collection_name}")
         
-        milvus_service = get_milvus_service()
-        print(f"📋 [ROUTER] MilvusService.get_collection_info 호출 시작")
         result = await milvus_service.get_collection_info(collection_name)
-        print(f"📋 [ROUTER] MilvusService.get_collection_info 호출 완료")
         
         if result["success"]:
-            print(f"✅ [ROUTER] 컬렉션 정보 조회 성공")
+            logger.debug(f"✅ [ROUTER] 컬렉션 정보 조회 성공")
             return {
                 "status": "success",
                 "collection_info": result
             }
         else:
-            print(f"❌ [ROUTER] 컬렉션 정보 조회 실패 - 에러 메시지: {result['message']}")
-            if "error_traceback" in result:
-                print(f"❌ [ROUTER] 상세 에러: {result['error_traceback']}")
+            # 상세 에러(traceback)는 서비스 로그에 이미 기록됨
+            logger.warning(f"❌ [ROUTER] 컬렉션 정보 조회 실패 - 에러 메시지: {result['message']}")
             raise HTTPException(status_code=400, detail=result["message"])
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        error_traceback = traceback.format_exc()
-        print(f"💥 [ROUTER] 예상치 못한 오류 발생: {str(e)}")
-        print(f"💥 [ROUTER] 상세 에러: {error_traceback}")
+        logger.error(f"💥 [ROUTER] 예상치 못한 오류 발생: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"컬렉션 정보 조회 중 오류 발생: {str(e)}")
 
 
 @router.post("/reset_ids")
-async def reset_collection_ids(request: DeleteCollectionRequest):
+async def reset_collection_ids(request: DeleteCollectionRequest, milvus_service=Depends(get_milvus_service)):
     """컬렉션 ID를 0부터 시작하도록 리셋 API"""
     try:
-        milvus_service = get_milvus_service()
         result = await milvus_service.reset_collection_ids(
             collection_name=request.collection_name
         )
@@ -157,4 +141,20 @@ async def reset_collection_ids(request: DeleteCollectionRequest):
         else:
             raise HTTPException(status_code=400, detail=result["message"])
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"ID 리셋 중 오류 발생: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"ID 리셋 중 오류 발생: {str(e)}") 
+
+
+@router.post("/flush")
+async def flush_collection(request: FlushCollectionRequest, milvus_service=Depends(get_milvus_service)):
+    """컬렉션 flush API - 대기 중인 삽입/삭제를 즉시 영구 반영"""
+    try:
+        result = await milvus_service.flush_collection(
+            collection_name=request.collection_name
+        )
+        
+        if result["success"]:
+            return {"status": "success", "message": result["message"], "durable": result["durable"]}
+        else:
+            raise HTTPException(status_code=400, detail=result["message"])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"컬렉션 flush 중 오류 발생: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import uuid
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
+from pydantic import BaseModel
+from typing import Optional
+from Services.lifecycle import get_milvus_service
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+def _remove_upload(path: str):
+    """작업으로 등록되지 못한 업로드 파일 삭제"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ImportJobRequest(BaseModel):
+    collection_name: str
+    source_path: str
+    format: Optional[str] = None  # jsonl, npy, parquet (생략 시 확장자로 판별)
+    mode: str = "insert"  # insert, bulk_insert
+
+
+@router.post("/import")
+async def create_import_job(request: ImportJobRequest, milvus_service=Depends(get_milvus_service)):
+    """서버 경로의 파일을 가져오는 백그라운드 작업 등록 API"""
+    try:
+        job = milvus_service.import_jobs.submit(
+            collection_name=request.collection_name,
+            source_path=request.source_path,
+            fmt=request.format,
+            mode=request.mode
+        )
+        return {"status": "accepted", "job": job}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"가져오기 작업 등록 중 오류 발생: {str(e)}")
+
+
+@router.post("/import/upload")
+async def create_import_job_from_upload(collection_name: str, format: Optional[str] = None,
+                                        file: UploadFile = File(...),
+                                        milvus_service=Depends(get_milvus_service)):
+    """파일 업로드 후 가져오기 작업 등록 API (multipart/form-data, 필드명: file)"""
+    import_jobs = milvus_service.import_jobs
+    extension = os.path.splitext(file.filename or "")[1].lower()
+    os.makedirs(import_jobs.uploads_dir, exist_ok=True)
+    upload_path = os.path.join(import_jobs.uploads_dir, f"{uuid.uuid4().hex}{extension}")
+
+    try:
+        # 업로드 파일을 청크 단위로 디스크에 기록 (전체를 메모리에 올리지 않음)
+        with open(upload_path, "wb") as f:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                await asyncio.to_thread(f.write, chunk)
+
+        # 등록된 작업은 끝날 때 업로드 파일을 직접 삭제
+        job = import_jobs.submit(collection_name=collection_name, source_path=upload_path, fmt=format,
+                                 delete_source=True)
+        return {"status": "accepted", "job": job}
+    except ValueError as e:
+        _remove_upload(upload_path)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        _remove_upload(upload_path)
+        raise HTTPException(status_code=500, detail=f"가져오기 작업 등록 중 오류 발생: {str(e)}")
+
+
+@router.get("")
+async def list_jobs(milvus_service=Depends(get_milvus_service)):
+    """가져오기 작업 목록 조회 API"""
+    jobs = milvus_service.import_jobs.list_jobs()
+    return {"status": "success", "jobs": jobs, "count": len(jobs)}
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, milvus_service=Depends(get_milvus_service)):
+    """가져오기 작업 진행률/처리량/오류 조회 API"""
+    job = milvus_service.import_jobs.describe(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업 '{job_id}'을 찾을 수 없습니다.")
+    return {"status": "success", "job": job}
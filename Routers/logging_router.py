@@ -0,0 +1,30 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from typing import Optional
+from Services.logger_config import get_log_levels, set_log_level
+
+router = APIRouter(prefix="/logging", tags=["logging"])
+
+
+class LogLevelUpdateRequest(BaseModel):
+    logger: str  # MilvusService, UserActivity
+    level: Optional[str] = None  # DEBUG, INFO, WARNING, ERROR
+    sample_rate: Optional[float] = None  # 핫 패스 INFO 로그 통과 비율 (0~1)
+
+
+@router.get("/levels")
+async def get_levels():
+    """로거별 레벨, 핫 패스 샘플링 비율, 로그 큐 상태 조회"""
+    return {"status": "success", "loggers": get_log_levels()}
+
+
+@router.put("/levels")
+async def update_level(request: LogLevelUpdateRequest):
+    """로거 레벨/샘플링 비율을 재시작 없이 변경"""
+    try:
+        updated = set_log_level(request.logger, request.level, request.sample_rate)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", "logger": request.logger, **updated}
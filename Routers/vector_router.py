@@ -1,27 +1,27 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, Depends, Request, UploadFile, File, Query, Header
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from Services.lifecycle import get_milvus_service
+from Services.logger_config import get_milvus_logger
+from Services.ndjson_reader import BufferedChunkReader, LineTooLongError
+from Services.request_context import stage
+from Services.vector_codec import decode_float32_buffer, decode_npy_buffer
+from Services.responses import NumpyORJSONResponse
+from Services.binary_formats import (
+    FormatUnavailableError, check_available, encode_columns, negotiate, row_columns, search_columns
+)
 
 router = APIRouter(prefix="/vector", tags=["vector"])
-
-# Lazy loading for milvus_service
-_milvus_service = None
-
-def get_milvus_service():
-    global _milvus_service
-    if _milvus_service is None:
-        try:
-            from Services.milvus_service import milvus_service
-            _milvus_service = milvus_service
-        except Exception as e:
-            print(f"Milvus service 초기화 실패: {e}")
-            raise HTTPException(status_code=500, detail="Milvus 서비스 초기화 실패")
-    return _milvus_service
+logger = get_milvus_logger()
 
 
 class VectorData(BaseModel):
     text: Optional[str] = None
     vector: Optional[List[float]] = None
+    vector_b64: Optional[str] = None  # base64 인코딩된 little-endian float32 벡터
     # 추가 필드들은 동적으로 처리
 
 
@@ -47,104 +47,312 @@ class SearchParams(BaseModel):
 
 class VectorSearchRequest(BaseModel):
     collection_name: str
-    query_text: str
+    # 쿼리는 아래 세 가지 중 하나로 지정
+    query_text: Optional[str] = None
+    query_vector: Optional[List[float]] = None  # 사전 계산된 쿼리 벡터 (모델 추론 생략)
+    ids: Optional[List[int]] = None  # 저장된 벡터를 쿼리로 사용 ("이 항목과 비슷한 항목")
+    search_params: SearchParams
+    limit: Optional[int] = 10
+    output_fields: Optional[List[str]] = None  # 결과에 포함할 필드 (기본: id/distance만)
+    include_vectors: bool = False  # 결과에 벡터 포함 여부
+
+
+class BatchVectorSearchRequest(BaseModel):
+    collection_name: str
+    query_texts: List[str] = []
+    query_vectors: List[List[float]] = []  # 사전 계산된 쿼리 벡터
     search_params: SearchParams
     limit: Optional[int] = 10
+    output_fields: Optional[List[str]] = None  # 결과에 포함할 필드 (기본: id/distance만)
+    include_vectors: bool = False  # 결과에 벡터 포함 여부
+
+
+def _raise_insert_failure(result: Dict[str, Any]):
+    """삽입 실패 결과를 HTTP 오류로 변환"""
+    if result.get("inserted_count"):
+        # 일부 배치는 이미 삽입됨 - 클라이언트가 실패 범위부터 재시도할 수 있도록 진행 정보 전달
+        raise HTTPException(status_code=500, detail={
+            "message": result["message"],
+            "inserted_count": result["inserted_count"],
+            "failed_batch": result.get("failed_batch")
+        })
+    raise HTTPException(status_code=400, detail=result["message"])
 
 
 @router.post("/insert")
-async def insert_vectors(request: InsertVectorRequest):
+async def insert_vectors(request: InsertVectorRequest, milvus_service=Depends(get_milvus_service)):
     """벡터 데이터 삽입 API"""
     try:
-        milvus_service = get_milvus_service()
         result = await milvus_service.insert_vectors(
             collection_name=request.collection_name,
             data=request.data
         )
         
         if result["success"]:
-            return {"status": "success", "message": result["message"]}
+            return {"status": "success", "message": result["message"], "durable": result["durable"]}
+        _raise_insert_failure(result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"벡터 삽입 중 오류 발생: {str(e)}")
+
+
+class _BodyAwareStreamingResponse(StreamingResponse):
+    """요청 본문을 끝까지 읽은 뒤에만 연결 종료를 감시하는 StreamingResponse
+
+    기본 listen_for_disconnect는 receive 채널의 http.request 메시지를 소비하므로,
+    본문을 읽는 BufferedChunkReader가 끝나기 전에는 감시를 시작하지 않음
+    """
+
+    def __init__(self, content, body_done: asyncio.Event, **kwargs):
+        super().__init__(content, **kwargs)
+        self.body_done = body_done
+
+    async def listen_for_disconnect(self, receive):
+        await self.body_done.wait()
+        await super().listen_for_disconnect(receive)
+
+
+@router.post("/insert/stream")
+async def insert_vectors_stream(request: Request, collection_name: str, batch_size: int = 256,
+                                milvus_service=Depends(get_milvus_service)):
+    """NDJSON 스트리밍 벡터 삽입 API
+
+    요청 본문은 한 줄에 하나의 {"text": ...} 또는 {"vector": [...]} 객체 (chunked 업로드 가능).
+    배치마다 진행 상황을 NDJSON으로 스트리밍 응답.
+    첫 배치 처리 전에 한 줄이 NDJSON_MAX_LINE_BYTES를 넘으면 413, 이후면 실패 요약 레코드로 응답.
+    """
+    if batch_size <= 0:
+        raise HTTPException(status_code=400, detail="batch_size는 1 이상이어야 합니다.")
+    
+    # 본문은 생산자 태스크가 제한된 큐로 읽어 들이고, 응답 생성기는 큐에서만 읽음
+    body = BufferedChunkReader(request.stream())
+    body.start()
+    records = milvus_service.insert_vectors_stream(
+        collection_name=collection_name,
+        chunks=body,
+        batch_size=batch_size
+    )
+    # 첫 레코드를 응답 시작 전에 받아 두어야 줄 길이 초과를 상태 코드로 알릴 수 있음
+    try:
+        first_record = await records.__anext__()
+    except StopAsyncIteration:
+        first_record = None
+    except LineTooLongError as e:
+        await body.aclose()
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception:
+        await body.aclose()
+        raise
+    
+    async def progress_stream():
+        try:
+            if first_record is not None:
+                yield json.dumps(first_record, ensure_ascii=False) + "\n"
+            async for record in records:
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+        except LineTooLongError as e:
+            yield json.dumps({"type": "summary", "success": False, "status_code": 413,
+                              "message": str(e)}, ensure_ascii=False) + "\n"
+        finally:
+            await body.aclose()
+    
+    return _BodyAwareStreamingResponse(progress_stream(), body_done=body.done, media_type="application/x-ndjson")
+
+
+async def _insert_vector_array(milvus_service, collection_name: str, vectors):
+    result = await milvus_service.insert_vector_array(
+        collection_name=collection_name,
+        vectors=vectors
+    )
+    if not result["success"]:
+        _raise_insert_failure(result)
+    return {"status": "success", "message": result["message"], "durable": result["durable"]}
+
+
+@router.post("/insert/binary")
+async def insert_vectors_binary(request: Request, collection_name: str,
+                                milvus_service=Depends(get_milvus_service)):
+    """바이너리 벡터 삽입 API
+
+    Content-Type: application/octet-stream 이면 little-endian float32 원시 버퍼(N x dim),
+    application/x-npy 이면 .npy 파일 본문으로 해석 (모두 np.frombuffer로 복사 없이 디코딩)
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+    try:
+        if "npy" in content_type:
+            vectors = decode_npy_buffer(body)
         else:
-            raise HTTPException(status_code=400, detail=result["message"])
+            vectors = decode_float32_buffer(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"벡터 버퍼 디코딩 실패: {str(e)}")
+    
+    try:
+        return await _insert_vector_array(milvus_service, collection_name, vectors)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"벡터 삽입 중 오류 발생: {str(e)}")
+
+
+@router.post("/insert/npy")
+async def insert_vectors_npy(collection_name: str, file: UploadFile = File(...),
+                             milvus_service=Depends(get_milvus_service)):
+    """.npy 파일 업로드 벡터 삽입 API (multipart/form-data, 필드명: file)"""
+    try:
+        vectors = decode_npy_buffer(await file.read())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f".npy 파일 디코딩 실패: {str(e)}")
+    
+    try:
+        return await _insert_vector_array(milvus_service, collection_name, vectors)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"벡터 삽입 중 오류 발생: {str(e)}")
 
 
 @router.post("/delete")
-async def delete_vectors(request: DeleteVectorRequest):
+async def delete_vectors(request: DeleteVectorRequest, milvus_service=Depends(get_milvus_service)):
     """벡터 데이터 삭제 API"""
     try:
-        milvus_service = get_milvus_service()
         result = await milvus_service.delete_vectors(
             collection_name=request.collection_name,
             ids=request.ids
         )
         
         if result["success"]:
-            return {"status": "success", "message": result["message"]}
+            return {"status": "success", "message": result["message"], "durable": result["durable"]}
         else:
             raise HTTPException(status_code=400, detail=result["message"])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"벡터 삭제 중 오류 발생: {str(e)}")
 
 
-@router.get("/vectors")
-async def get_vectors(collection_name: str, limit: int = 100):
-    """벡터 데이터 조회 API"""
+def _binary_response(media_type: str, to_columns, rows) -> Response:
+    """결과 행을 열로 변환해 협상된 바이너리 형식(MessagePack/Arrow IPC)으로 응답"""
+    try:
+        with stage("serialize"):
+            content = encode_columns(media_type, to_columns(rows))
+    except FormatUnavailableError as e:
+        raise HTTPException(status_code=406, detail=str(e))
+    return Response(content=content, media_type=media_type)
+
+
+def _negotiate_binary(accept: Optional[str]) -> Optional[str]:
+    """Accept 헤더로 응답 형식 협상 - 바이너리 형식 패키지가 없으면 Milvus 쿼리 실행 전에 406"""
+    media_type = negotiate(accept)
+    if media_type:
+        try:
+            check_available(media_type)
+        except FormatUnavailableError as e:
+            raise HTTPException(status_code=406, detail=str(e))
+    return media_type
+
+
+@router.get("/vectors", response_class=NumpyORJSONResponse)
+async def get_vectors(collection_name: str, limit: int = 100,
+                      output_fields: Optional[List[str]] = Query(None), include_vectors: bool = False,
+                      accept: Optional[str] = Header(None), milvus_service=Depends(get_milvus_service)):
+    """벡터 데이터 조회 API - 기본은 id만 반환 (벡터는 include_vectors=true)
+
+    Accept: application/msgpack 또는 application/vnd.apache.arrow.stream이면 id/vector 열을 바이너리로 반환
+    """
     try:
-        milvus_service = get_milvus_service()
+        media_type = _negotiate_binary(accept)
         result = await milvus_service.get_vectors(
             collection_name=collection_name,
-            limit=limit
+            limit=limit,
+            output_fields=output_fields,
+            include_vectors=include_vectors
         )
         
         if result["success"]:
-            return {
+            if media_type:
+                return _binary_response(media_type, row_columns, result["vectors"])
+            return NumpyORJSONResponse({
                 "status": "success",
                 "vectors": result["vectors"],
                 "count": len(result["vectors"])
-            }
+            })
         else:
             raise HTTPException(status_code=400, detail=result["message"])
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"벡터 조회 중 오류 발생: {str(e)}")
 
 
-@router.post("/search")
-async def search_vectors(request: VectorSearchRequest):
-    """벡터 검색 API"""
+@router.post("/search", response_class=NumpyORJSONResponse)
+async def search_vectors(request: VectorSearchRequest, accept: Optional[str] = Header(None),
+                         milvus_service=Depends(get_milvus_service)):
+    """벡터 검색 API
+
+    Accept: application/msgpack 또는 application/vnd.apache.arrow.stream이면
+    id/distance/(query_id)/(vector) 열을 바이너리로 반환
+    """
     try:
-        print(f"🔍 [ROUTER] 벡터 검색 API 호출됨")
-        print(f"📋 [ROUTER] 요청 데이터: collection_name={request.collection_name}, query_text='{request.query_text}', limit={request.limit}")
+        logger.debug(f"🔍 [ROUTER] 벡터 검색 API 호출됨 - collection_name={request.collection_name}, "
+                     f"query_text='{request.query_text}', limit={request.limit}")
         
-        milvus_service = get_milvus_service()
+        media_type = _negotiate_binary(accept)
         search_params = request.search_params.dict()
-        print(f"📋 [ROUTER] 검색 파라미터: {search_params}")
         
-        print(f"📋 [ROUTER] MilvusService.search_vectors 호출 시작")
         result = await milvus_service.search_vectors(
             collection_name=request.collection_name,
             query_text=request.query_text,
             search_params=search_params,
-            limit=request.limit
+            limit=request.limit,
+            query_vector=request.query_vector,
+            ids=request.ids,
+            output_fields=request.output_fields,
+            include_vectors=request.include_vectors
+        )
+        
+        if result["success"]:
+            if media_type:
+                return _binary_response(media_type, search_columns, result["results"])
+            return NumpyORJSONResponse({
+                "status": "success",
+                "results": result["results"],
+                "count": len(result["results"])
+            })
+        else:
+            # 상세 에러(traceback)는 서비스 로그에 이미 기록됨
+            logger.warning(f"❌ [ROUTER] 검색 실패 - 에러 메시지: {result['message']}")
+            raise HTTPException(status_code=400, detail=result["message"])
+    except HTTPException:
+        raise
+    except Exception as e:
+        # traceback 포맷팅은 로그 리스너 스레드에서 수행
+        logger.error(f"💥 [ROUTER] 예상치 못한 오류 발생: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"벡터 검색 중 오류 발생: {str(e)}")
+
+
+@router.post("/search/batch", response_class=NumpyORJSONResponse)
+async def search_vectors_batch(request: BatchVectorSearchRequest, milvus_service=Depends(get_milvus_service)):
+    """다중 쿼리 벡터 검색 API - 텍스트/벡터 쿼리를 한 번의 검색으로 처리하고 쿼리별로 결과 반환"""
+    try:
+        result = await milvus_service.search_vectors_batch(
+            collection_name=request.collection_name,
+            query_texts=request.query_texts,
+            search_params=request.search_params.dict(),
+            limit=request.limit,
+            query_vectors=request.query_vectors,
+            output_fields=request.output_fields,
+            include_vectors=request.include_vectors
         )
-        print(f"📋 [ROUTER] MilvusService.search_vectors 호출 완료")
         
         if result["success"]:
-            print(f"✅ [ROUTER] 검색 성공 - 결과 개수: {len(result['results'])}")
-            return {
+            return NumpyORJSONResponse({
                 "status": "success",
                 "results": result["results"],
                 "count": len(result["results"])
-            }
+            })
         else:
-            print(f"❌ [ROUTER] 검색 실패 - 에러 메시지: {result['message']}")
-            if "error_traceback" in result:
-                print(f"❌ [ROUTER] 상세 에러: {result['error_traceback']}")
             raise HTTPException(status_code=400, detail=result["message"])
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        error_traceback = traceback.format_exc()
-        print(f"💥 [ROUTER] 예상치 못한 오류 발생: {str(e)}")
-        print(f"💥 [ROUTER] 상세 에러: {error_traceback}")
-        raise HTTPException(status_code=500, detail=f"벡터 검색 중 오류 발생: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"다중 벡터 검색 중 오류 발생: {str(e)}")
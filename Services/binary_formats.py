@@ -0,0 +1,147 @@
+import importlib
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+BINARY_MEDIA_TYPES = [MSGPACK_MEDIA_TYPE, ARROW_STREAM_MEDIA_TYPE]
+
+# Accept 헤더 미디어 타입 -> 응답 형식 (None은 기본 JSON 응답)
+_ACCEPT_MEDIA_TYPES = {
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE: MSGPACK_MEDIA_TYPE,
+    ARROW_STREAM_MEDIA_TYPE: ARROW_STREAM_MEDIA_TYPE,
+    "application/json": None,
+    "application/*": None,
+    "*/*": None,
+}
+
+# 바이너리 형식별 인코딩 패키지
+_FORMAT_PACKAGES = {
+    MSGPACK_MEDIA_TYPE: ("msgpack", "MessagePack 응답을 사용하려면 msgpack 패키지를 설치해야 합니다."),
+    ARROW_STREAM_MEDIA_TYPE: ("pyarrow", "Arrow 응답을 사용하려면 pyarrow 패키지를 설치해야 합니다."),
+}
+
+
+class FormatUnavailableError(Exception):
+    """요청한 바이너리 형식의 인코딩 패키지가 설치되지 않았을 때 발생"""
+
+
+def _parse_accept(accept: str) -> List[Tuple[str, float]]:
+    """Accept 헤더를 (미디어 타입, q 값) 목록으로 분리 - q가 없으면 1, 잘못된 q는 0으로 간주"""
+    entries = []
+    for part in accept.split(","):
+        params = part.split(";")
+        media_type = params[0].strip().lower()
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        entries.append((media_type, quality))
+    return entries
+
+
+def negotiate(accept: Optional[str]) -> Optional[str]:
+    """Accept 헤더에서 지원하는 바이너리 형식 선택 - 없으면 None (JSON 응답)
+
+    q 값이 가장 높은 형식을 고르고(같으면 먼저 나온 쪽), q=0인 형식은 제외.
+    JSON이나 와일드카드가 바이너리 형식보다 선호되면 None
+    """
+    if not accept:
+        return None
+    selected = None
+    selected_quality = 0.0
+    for media_type, quality in _parse_accept(accept):
+        if media_type not in _ACCEPT_MEDIA_TYPES or quality <= selected_quality:
+            continue
+        selected = _ACCEPT_MEDIA_TYPES[media_type]
+        selected_quality = quality
+    return selected
+
+
+def check_available(media_type: str):
+    """바이너리 형식의 인코딩 패키지 설치 여부 확인 - 쿼리 실행 전에 호출해 406을 먼저 반환하기 위함"""
+    package, message = _FORMAT_PACKAGES[media_type]
+    try:
+        importlib.import_module(package)
+    except ImportError as e:
+        raise FormatUnavailableError(message) from e
+
+
+def _vector_matrix(vectors: List[Any]) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError(f"벡터 열의 shape이 올바르지 않습니다: {matrix.shape}")
+    return np.ascontiguousarray(matrix)
+
+
+def search_columns(hits: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """검색 결과 행을 열(numpy 배열)로 변환 - id, distance, (query_id), (vector)"""
+    columns = {
+        "id": np.fromiter((hit["id"] for hit in hits), dtype=np.int64, count=len(hits)),
+        "distance": np.fromiter((hit["distance"] for hit in hits), dtype=np.float32, count=len(hits))
+    }
+    if hits and "query_id" in hits[0]:
+        columns["query_id"] = np.fromiter((hit["query_id"] for hit in hits), dtype=np.int64, count=len(hits))
+    if hits and "vector" in hits[0].get("entity", {}):
+        columns["vector"] = _vector_matrix([hit["entity"]["vector"] for hit in hits])
+    return columns
+
+
+def row_columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """조회 결과 행을 열(numpy 배열)로 변환 - id, (vector)"""
+    columns = {"id": np.fromiter((row["id"] for row in rows), dtype=np.int64, count=len(rows))}
+    if rows and "vector" in rows[0]:
+        columns["vector"] = _vector_matrix([row["vector"] for row in rows])
+    return columns
+
+
+def encode_msgpack(columns: Dict[str, np.ndarray]) -> bytes:
+    """MessagePack 인코딩 - 각 열은 little-endian 원시 버퍼(bin)로 담음
+
+    {"count": N, "columns": {name: {"dtype": "<i8", "shape": [...], "data": bytes}}}
+    클라이언트는 np.frombuffer(data, dtype).reshape(shape)로 복사 없이 읽을 수 있음
+    """
+    check_available(MSGPACK_MEDIA_TYPE)
+    import msgpack
+
+    payload_columns = {}
+    for name, array in columns.items():
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+        payload_columns[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "data": array.tobytes()}
+    count = len(next(iter(columns.values()))) if columns else 0
+    return msgpack.packb({"count": count, "columns": payload_columns}, use_bin_type=True)
+
+
+def encode_arrow_stream(columns: Dict[str, np.ndarray]) -> bytes:
+    """Arrow IPC 스트림 인코딩 - 벡터 열은 FixedSizeList<float32>로 담아 to_numpy()로 복사 없이 읽을 수 있음"""
+    check_available(ARROW_STREAM_MEDIA_TYPE)
+    import pyarrow as pa
+
+    arrays = {}
+    for name, array in columns.items():
+        if array.ndim == 2:
+            arrays[name] = pa.FixedSizeListArray.from_arrays(pa.array(array.reshape(-1)), array.shape[1])
+        else:
+            arrays[name] = pa.array(array)
+    table = pa.table(arrays)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_columns(media_type: str, columns: Dict[str, np.ndarray]) -> bytes:
+    """협상된 형식으로 열 인코딩"""
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return encode_msgpack(columns)
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        return encode_arrow_stream(columns)
+    raise ValueError(f"지원하지 않는 형식입니다: {media_type}")
@@ -0,0 +1,122 @@
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from pymilvus import Collection, utility
+from Services.logger_config import get_milvus_logger
+from Services.metrics import get_counter
+from Services.request_context import annotate, stage
+
+
+class CollectionMetadata:
+    """캐시되는 컬렉션 메타데이터 - 컬렉션 핸들, 벡터 차원, 스칼라 필드, metric/인덱스 타입, 로드 여부"""
+
+    def __init__(self, name: str, collection: Collection, dimension: Optional[int], scalar_fields: List[str],
+                 metric_type: Optional[str], index_type: Optional[str], loaded: bool):
+        self.name = name
+        self.collection = collection
+        self.dimension = dimension
+        self.scalar_fields = scalar_fields
+        self.metric_type = metric_type
+        self.index_type = index_type
+        self.loaded = loaded
+
+
+def _index_params(collection: Collection) -> Tuple[Optional[str], Optional[str]]:
+    """컬렉션 인덱스에서 (metric_type, index_type) 조회 - 인덱스가 없으면 (None, None)"""
+    try:
+        # 인덱스가 없는 컬렉션이면 pymilvus가 빈 값 대신 예외를 발생시킴
+        index_info = collection.index()
+    except Exception as e:
+        get_milvus_logger().debug(f"📋 [CACHE] 컬렉션 '{collection.name}' 인덱스 정보 없음: {e}")
+        return None, None
+    if not index_info:
+        return None, None
+    params = getattr(index_info, 'params', None) or {}
+    metric_type = getattr(index_info, 'metric_type', None)
+    if metric_type is None and isinstance(params, dict):
+        metric_type = params.get('metric_type', "UNKNOWN")
+    index_type = params.get('index_type') if isinstance(params, dict) else None
+    return metric_type, index_type
+
+
+class CollectionMetadataCache:
+    """컬렉션별 메타데이터 캐시
+
+    요청마다 has_collection / Collection() / load() / index() / schema 조회를 반복하지 않도록
+    처음 한 번만 Milvus에서 읽어 COLLECTION_CACHE_TTL_SECONDS 동안 재사용.
+    컬렉션 생성/삭제/ID 리셋 시 invalidate()로 즉시 무효화.
+    존재하지 않는 컬렉션은 캐시하지 않음 (다른 프로세스가 생성할 수 있으므로).
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('COLLECTION_CACHE_TTL_SECONDS', '60'))
+        self.logger = get_milvus_logger()
+        self._entries: Dict[str, Tuple[CollectionMetadata, float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._hits = get_counter("collection_cache_hits")
+        self._misses = get_counter("collection_cache_misses")
+
+    def _load(self, collection_name: str) -> Optional[CollectionMetadata]:
+        """Milvus에서 메타데이터 조회 (스레드에서 실행)"""
+        with stage("exists"):
+            if not utility.has_collection(collection_name):
+                return None
+        with stage("load"):
+            collection = Collection(collection_name)
+            collection.load()
+        with stage("metadata"):
+            dimension = None
+            scalar_fields = []
+            for field in collection.schema.fields:
+                if field.name == "vector":
+                    dimension = field.params.get("dim")
+                else:
+                    scalar_fields.append(field.name)
+            metric_type, index_type = _index_params(collection)
+        return CollectionMetadata(collection_name, collection, dimension, scalar_fields,
+                                  metric_type, index_type, loaded=True)
+
+    def _cached(self, collection_name: str) -> Optional[CollectionMetadata]:
+        entry = self._entries.get(collection_name)
+        if entry is None:
+            return None
+        metadata, loaded_at = entry
+        if self.ttl_seconds and time.monotonic() - loaded_at > self.ttl_seconds:
+            self._entries.pop(collection_name, None)
+            return None
+        return metadata
+
+    async def get(self, collection_name: str) -> Optional[CollectionMetadata]:
+        """컬렉션 메타데이터 반환 - 컬렉션이 없으면 None"""
+        metadata = self._cached(collection_name)
+        if metadata is not None:
+            self._hits.inc()
+            annotate("collection_cache", "hit")
+            return metadata
+
+        # 같은 컬렉션에 대한 동시 미스는 한 번만 Milvus 조회
+        lock = self._locks.setdefault(collection_name, asyncio.Lock())
+        async with lock:
+            metadata = self._cached(collection_name)
+            if metadata is not None:
+                self._hits.inc()
+                annotate("collection_cache", "hit")
+                return metadata
+            self._misses.inc()
+            annotate("collection_cache", "miss")
+            metadata = await asyncio.to_thread(self._load, collection_name)
+            if metadata is not None:
+                self._entries[collection_name] = (metadata, time.monotonic())
+                self.logger.info(f"🗂️ [COLLECTION_CACHE] 메타데이터 캐시 - 컬렉션: {collection_name}, "
+                                 f"차원: {metadata.dimension}, metric: {metadata.metric_type}, 인덱스: {metadata.index_type}")
+            return metadata
+
+    def invalidate(self, collection_name: str):
+        """컬렉션 생성/삭제/리셋 또는 Milvus 오류 시 캐시 항목 제거"""
+        self._entries.pop(collection_name, None)
+        self._locks.pop(collection_name, None)
+
+    def clear(self):
+        self._entries.clear()
+        self._locks.clear()
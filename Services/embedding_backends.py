@@ -0,0 +1,194 @@
+import os
+import re
+from abc import ABC, abstractmethod
+import numpy as np
+from typing import Dict, List, Optional, Type
+from transformers import AutoModel
+import torch
+from Services.logger_config import get_milvus_logger
+
+
+# 백엔드 간 출력 비교(parity)에 사용하는 샘플 문장
+PARITY_SAMPLE_TEXTS = [
+    "Milvus is a vector database built for scalable similarity search.",
+    "오늘 날씨가 맑고 화창합니다.",
+    "A quick brown fox jumps over the lazy dog.",
+    "Embedding models map sentences to dense vectors.",
+    "short",
+]
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def configure_threads():
+    """워커별 torch 스레드 수 설정 - 여러 uvicorn 워커가 코어를 과다 점유하지 않도록 제한
+
+    set_num_interop_threads는 병렬 작업 시작 전에 한 번만 호출 가능하므로 모델 로드 전에 호출
+    """
+    logger = get_milvus_logger()
+    num_threads = _env_int('EMBEDDING_NUM_THREADS')
+    interop_threads = _env_int('EMBEDDING_INTEROP_THREADS')
+    if num_threads:
+        torch.set_num_threads(num_threads)
+    if interop_threads:
+        try:
+            torch.set_num_interop_threads(interop_threads)
+        except RuntimeError as e:
+            logger.warning(f"⚠️ [BACKEND] interop 스레드 수 설정 실패 (이미 병렬 작업이 시작됨): {e}")
+    logger.info(f"⚙️ [BACKEND] torch 스레드 설정 - intra-op: {torch.get_num_threads()}, "
+                f"inter-op: {torch.get_num_interop_threads()}")
+
+
+class EmbeddingBackend(ABC):
+    """임베딩 추론 백엔드 인터페이스 - 토큰 입력을 받아 last_hidden_state 반환"""
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.logger = get_milvus_logger()
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """출력 hidden 차원"""
+
+    @abstractmethod
+    def forward(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """(batch, seq) 토큰 입력 -> (batch, seq, hidden) float32 배열"""
+
+
+class TorchBackend(EmbeddingBackend):
+    """PyTorch eager fp32 백엔드 (기본값)"""
+
+    name = "torch"
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        self.model = AutoModel.from_pretrained(model_name)
+        self.model.eval()
+
+    @property
+    def dimension(self) -> int:
+        return self.model.config.hidden_size
+
+    def forward(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        with torch.no_grad():
+            outputs = self.model(input_ids=torch.from_numpy(input_ids),
+                                 attention_mask=torch.from_numpy(attention_mask))
+        return outputs.last_hidden_state.numpy()
+
+
+class QuantizedTorchBackend(TorchBackend):
+    """PyTorch 동적 int8 양자화 백엔드 - Linear 레이어를 qint8로 변환"""
+
+    name = "torch_int8"
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.logger.info(f"🤖 [BACKEND] 동적 int8 양자화 적용 완료: {model_name}")
+
+
+class _HiddenStateWrapper(torch.nn.Module):
+    """ONNX 내보내기용 래퍼 - last_hidden_state만 출력"""
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask)[0]
+
+
+class OnnxBackend(EmbeddingBackend):
+    """ONNX Runtime CPU 백엔드 - 모델 파일이 없으면 처음 한 번 내보낸 뒤 재사용"""
+
+    name = "onnx"
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise RuntimeError("onnx 백엔드를 사용하려면 onnxruntime 패키지를 설치해야 합니다.") from e
+
+        default_path = os.path.join("models", f"{re.sub(r'[^A-Za-z0-9_.-]', '_', model_name)}.onnx")
+        self.onnx_path = os.getenv('EMBEDDING_ONNX_PATH', default_path)
+        torch_model = AutoModel.from_pretrained(model_name)
+        self._dimension = torch_model.config.hidden_size
+        if not os.path.exists(self.onnx_path):
+            self._export(torch_model)
+        del torch_model
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if _env_int('EMBEDDING_NUM_THREADS'):
+            options.intra_op_num_threads = _env_int('EMBEDDING_NUM_THREADS')
+        if _env_int('EMBEDDING_INTEROP_THREADS'):
+            options.inter_op_num_threads = _env_int('EMBEDDING_INTEROP_THREADS')
+        self.session = onnxruntime.InferenceSession(self.onnx_path, options, providers=["CPUExecutionProvider"])
+        self.logger.info(f"🤖 [BACKEND] ONNX Runtime 세션 생성 완료: {self.onnx_path}")
+
+    def _export(self, torch_model):
+        """PyTorch 모델을 ONNX로 내보내기"""
+        os.makedirs(os.path.dirname(self.onnx_path) or ".", exist_ok=True)
+        torch_model.eval()
+        dummy_ids = torch.ones((1, 8), dtype=torch.long)
+        dummy_mask = torch.ones((1, 8), dtype=torch.long)
+        torch.onnx.export(
+            _HiddenStateWrapper(torch_model),
+            (dummy_ids, dummy_mask),
+            self.onnx_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            opset_version=14,
+        )
+        self.logger.info(f"🤖 [BACKEND] ONNX 모델 내보내기 완료: {self.onnx_path}")
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def forward(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        outputs = self.session.run(
+            ["last_hidden_state"],
+            {"input_ids": input_ids.astype(np.int64), "attention_mask": attention_mask.astype(np.int64)}
+        )
+        return outputs[0].astype(np.float32, copy=False)
+
+
+BACKENDS: Dict[str, Type[EmbeddingBackend]] = {
+    TorchBackend.name: TorchBackend,
+    QuantizedTorchBackend.name: QuantizedTorchBackend,
+    OnnxBackend.name: OnnxBackend,
+}
+
+
+def create_backend(name: str, model_name: str) -> EmbeddingBackend:
+    """이름으로 임베딩 백엔드 생성"""
+    backend_cls = BACKENDS.get(name.lower())
+    if backend_cls is None:
+        raise ValueError(f"지원하지 않는 임베딩 백엔드입니다: {name} (지원: {', '.join(BACKENDS)})")
+    return backend_cls(model_name)
+
+
+def compare_vectors(vectors: np.ndarray, reference: np.ndarray) -> Dict[str, float]:
+    """fp32 기준 벡터 대비 코사인 유사도/최대 절대 오차 계산"""
+    dot = (vectors * reference).sum(axis=1)
+    norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(reference, axis=1)
+    cosine = dot / np.clip(norms, 1e-12, None)
+    return {
+        "min_cosine": float(cosine.min()),
+        "mean_cosine": float(cosine.mean()),
+        "max_abs_diff": float(np.abs(vectors - reference).max()),
+        "samples": int(len(vectors)),
+    }
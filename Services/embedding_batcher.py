@@ -0,0 +1,80 @@
+import asyncio
+import os
+import time
+import numpy as np
+from typing import Awaitable, Callable, List, Optional, Tuple
+from Services.logger_config import get_milvus_logger
+from Services.metrics import get_histogram, BATCH_SIZE_BUCKETS
+
+
+class EmbeddingBatcher:
+    """동시 검색 쿼리 병합 스케줄러 - 짧은 시간 창 안에 도착한 쿼리를 모아 한 번의 배치 추론으로 처리"""
+
+    def __init__(self, encode_fn: Callable[[List[str]], Awaitable[np.ndarray]],
+                 window_ms: Optional[float] = None, max_batch_size: Optional[int] = None):
+        self.encode_fn = encode_fn
+        self.window_ms = window_ms if window_ms is not None else float(os.getenv('EMBEDDING_BATCH_WINDOW_MS', '5'))
+        self.max_batch_size = max_batch_size or int(os.getenv('EMBEDDING_MAX_QUERY_BATCH', '32'))
+        self.logger = get_milvus_logger()
+        self._pending: List[Tuple[str, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+        self._queue_wait_ms = get_histogram("embedding_batcher_queue_wait_ms")
+        self._batch_size = get_histogram("embedding_batcher_batch_size", BATCH_SIZE_BUCKETS)
+
+    async def submit(self, text: str) -> np.ndarray:
+        """단일 텍스트를 대기열에 넣고 배치 추론 결과 벡터를 기다림"""
+        # 시간 창이 0이면 병합 없이 바로 추론
+        if self.window_ms <= 0:
+            return (await self.encode_fn([text]))[0]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch(flush_all=False)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_ms / 1000.0, self._dispatch)
+
+        return await future
+
+    def _dispatch(self, flush_all: bool = True):
+        """대기 중인 쿼리를 최대 배치 크기 단위로 꺼내 배치 추론 시작
+
+        flush_all=False이면 배치 크기를 채운 묶음만 보내고 나머지는 다음 시간 창을 기다림
+        """
+        now = time.perf_counter()
+        while self._pending and (flush_all or len(self._pending) >= self.max_batch_size):
+            batch = self._pending[:self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size:]
+
+            for _, _, enqueued_at in batch:
+                self._queue_wait_ms.observe((now - enqueued_at) * 1000)
+            self._batch_size.observe(len(batch))
+
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        if self._timer is not None and (flush_all or not self._pending):
+            self._timer.cancel()
+            self._timer = None
+        if self._pending and self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.window_ms / 1000.0, self._dispatch)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future, float]]):
+        """배치 추론 실행 후 각 대기 코루틴에 결과 전달"""
+        try:
+            vectors = await self.encode_fn([text for text, _, _ in batch])
+        except Exception as e:
+            self.logger.error(f"❌ [BATCHER] 배치 추론 실패 - 배치 크기: {len(batch)}, 오류: {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future, _), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
@@ -0,0 +1,90 @@
+import os
+import threading
+import time
+import numpy as np
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+from Services.metrics import get_counter, get_gauge
+
+
+class EmbeddingCache:
+    """쿼리 임베딩 캐시 - 메모리 예산 기반 LRU 제거 + TTL 만료
+
+    키는 (모델명, 텍스트, target_dimension) 형태로 구성하여
+    차원이 다른 컬렉션끼리 잘못된 벡터를 공유하지 않도록 함
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('EMBEDDING_CACHE_MAX_MB', '64')) * 1024 * 1024)
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv('EMBEDDING_CACHE_TTL_SECONDS', '3600'))
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[np.ndarray, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = get_counter("embedding_cache_hits")
+        self._misses = get_counter("embedding_cache_misses")
+        self._evictions = get_counter("embedding_cache_evictions")
+        self._expirations = get_counter("embedding_cache_expirations")
+        self._bytes_gauge = get_gauge("embedding_cache_bytes")
+        self._entries_gauge = get_gauge("embedding_cache_entries")
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """캐시 조회 - 만료된 항목은 제거 후 miss로 처리"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses.inc()
+                return None
+            vector, expires_at = entry
+            if self.ttl_seconds > 0 and expires_at < time.monotonic():
+                self._remove(key)
+                self._expirations.inc()
+                self._misses.inc()
+                return None
+            self._entries.move_to_end(key)
+            self._hits.inc()
+            return vector
+
+    def put(self, key: Hashable, vector: np.ndarray):
+        """캐시 저장 - float32 배열로 보관하고 메모리 예산 초과 시 오래된 항목부터 제거"""
+        if not self.enabled:
+            return
+        vector = np.array(vector, dtype=np.float32)
+        vector.setflags(write=False)
+        if vector.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (vector, time.monotonic() + self.ttl_seconds)
+            self._bytes += vector.nbytes
+            while self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions.inc()
+            self._update_gauges()
+
+    def clear(self):
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._update_gauges()
+
+    def _remove(self, key: Hashable):
+        vector, _ = self._entries.pop(key)
+        self._bytes -= vector.nbytes
+        self._update_gauges()
+
+    def _update_gauges(self):
+        self._bytes_gauge.set(self._bytes)
+        self._entries_gauge.set(len(self._entries))
@@ -0,0 +1,175 @@
+import os
+import time
+import numpy as np
+from typing import Any, Dict, List, Optional
+from transformers import AutoConfig, AutoTokenizer
+from Services.logger_config import get_milvus_logger
+from Services.embedding_backends import (
+    EmbeddingBackend, TorchBackend, create_backend, compare_vectors, configure_threads, PARITY_SAMPLE_TEXTS
+)
+from Services.metrics import get_counter, get_gauge
+
+
+DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def mean_pooling(last_hidden_state: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """attention mask를 고려한 평균 풀링 - 패딩 토큰은 평균에서 제외"""
+    mask = attention_mask[..., np.newaxis].astype(np.float32)
+    summed = (last_hidden_state * mask).sum(axis=1)
+    counts = np.clip(mask.sum(axis=1), 1e-9, None)
+    return (summed / counts).astype(np.float32, copy=False)
+
+
+def adjust_dimension(vectors: np.ndarray, target_dimension: Optional[int]) -> np.ndarray:
+    """(N, dim) 벡터 배열을 목표 차원에 맞게 자르거나 0으로 패딩"""
+    if target_dimension is None or vectors.shape[1] == target_dimension:
+        return vectors
+    if vectors.shape[1] > target_dimension:
+        # 차원이 큰 경우: 앞쪽부터 잘라내기
+        return np.ascontiguousarray(vectors[:, :target_dimension])
+    # 차원이 작은 경우: 0으로 패딩
+    padded = np.zeros((vectors.shape[0], target_dimension), dtype=np.float32)
+    padded[:, :vectors.shape[1]] = vectors
+    return padded
+
+
+class EmbeddingModelInfo:
+    """워커 풀 사용 시 부모 프로세스가 보유하는 모델 메타데이터 - 토크나이저와 차원만 로드하고 모델 가중치는 올리지 않음"""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, backend: Optional[str] = None):
+        self.model_name = model_name
+        self.backend_name = (backend or os.getenv('EMBEDDING_BACKEND', 'torch')).lower()
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.dimension = AutoConfig.from_pretrained(model_name).hidden_size
+        self.model = None
+
+
+class EmbeddingEngine:
+    """문장 임베딩 엔진 - 토크나이저와 추론 백엔드를 감싸 마이크로 배치 단위로 벡터 생성"""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, batch_size: Optional[int] = None,
+                 max_length: int = 512, backend: Optional[str] = None):
+        self.model_name = model_name
+        self.batch_size = batch_size or int(os.getenv('EMBEDDING_BATCH_SIZE', '32'))
+        self.max_batch_tokens = int(os.getenv('EMBEDDING_MAX_BATCH_TOKENS', '8192'))
+        self.max_length = max_length
+        self.logger = get_milvus_logger()
+        configure_threads()
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.backend_name = (backend or os.getenv('EMBEDDING_BACKEND', 'torch')).lower()
+        self.backend: EmbeddingBackend = create_backend(self.backend_name, model_name)
+        # torch 계열 백엔드만 torch 모델 객체를 가짐 (onnx는 None)
+        self.model = getattr(self.backend, 'model', None)
+        self.dimension = self.backend.dimension
+        self.parity: Optional[Dict[str, Any]] = None
+        self._real_tokens = get_counter("embedding_real_tokens")
+        self._padded_tokens = get_counter("embedding_padded_tokens")
+        self._padding_ratio = get_gauge("embedding_padding_ratio")
+        self.logger.info(f"🤖 [EMBEDDING] 임베딩 엔진 준비 완료 - 모델: {model_name}, 백엔드: {self.backend_name}, 배치 크기: {self.batch_size}")
+
+        if os.getenv('EMBEDDING_PARITY_CHECK', 'false').lower() == 'true':
+            self.check_parity()
+
+    def _encode_batch(self, texts: List[str], backend: Optional[EmbeddingBackend] = None) -> np.ndarray:
+        """단일 마이크로 배치 추론"""
+        inputs = self.tokenizer(texts, return_tensors="np", padding=True, truncation=True,
+                                max_length=self.max_length)
+        hidden = (backend or self.backend).forward(inputs["input_ids"], inputs["attention_mask"])
+        return mean_pooling(hidden, inputs["attention_mask"])
+
+    def _plan_batches(self, order: List[int], lengths: List[int]) -> List[List[int]]:
+        """길이 순으로 정렬된 인덱스를 배치 크기/토큰 예산 안에서 묶음
+
+        배치의 패딩 후 토큰 수(가장 긴 길이 x 개수)가 max_batch_tokens를 넘지 않도록 구성
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        for index in order:
+            width = lengths[index]  # 오름차순 정렬이므로 새 항목이 배치 내 최장 길이
+            if current and (len(current) >= self.batch_size
+                            or width * (len(current) + 1) > self.max_batch_tokens):
+                batches.append(current)
+                current = []
+            current.append(index)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _forward_token_batch(self, token_lists: List[List[int]]) -> np.ndarray:
+        """토큰 ID 목록을 배치 내 최장 길이로만 패딩하여 추론"""
+        width = max(len(tokens) for tokens in token_lists)
+        pad_id = self.tokenizer.pad_token_id or 0
+        input_ids = np.full((len(token_lists), width), pad_id, dtype=np.int64)
+        attention_mask = np.zeros((len(token_lists), width), dtype=np.int64)
+        for row, tokens in enumerate(token_lists):
+            input_ids[row, :len(tokens)] = tokens
+            attention_mask[row, :len(tokens)] = 1
+        hidden = self.backend.forward(input_ids, attention_mask)
+        return mean_pooling(hidden, attention_mask)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """텍스트 목록을 (N, dim) float32 배열로 변환
+
+        토큰 길이로 정렬해 비슷한 길이끼리 배치를 구성(패딩 낭비 감소)한 뒤 원래 순서로 복원
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        token_ids = self.tokenizer(list(texts), truncation=True, max_length=self.max_length)["input_ids"]
+        lengths = [len(tokens) for tokens in token_ids]
+        order = sorted(range(len(texts)), key=lengths.__getitem__)
+
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        real_tokens = 0
+        padded_tokens = 0
+        for batch in self._plan_batches(order, lengths):
+            vectors[batch] = self._forward_token_batch([token_ids[i] for i in batch])
+            batch_real = sum(lengths[i] for i in batch)
+            real_tokens += batch_real
+            padded_tokens += lengths[batch[-1]] * len(batch) - batch_real
+
+        self._real_tokens.inc(real_tokens)
+        self._padded_tokens.inc(padded_tokens)
+        self._padding_ratio.set(padded_tokens / (real_tokens + padded_tokens) if real_tokens else 0.0)
+        return vectors
+
+    def warmup(self, batch_sizes: Optional[List[int]] = None, seq_lengths: Optional[List[int]] = None) -> float:
+        """대표적인 배치 크기/시퀀스 길이로 미리 추론하여 커널 초기화, 메모리 할당, 토크나이저 첫 사용 비용을 선지불
+
+        Returns:
+            워밍업 소요 시간(초)
+        """
+        if batch_sizes is None:
+            batch_sizes = [int(v) for v in os.getenv('EMBEDDING_WARMUP_BATCH_SIZES', '1,8,32').split(',') if v.strip()]
+        if seq_lengths is None:
+            seq_lengths = [int(v) for v in os.getenv('EMBEDDING_WARMUP_SEQ_LENGTHS', '16,64,256').split(',') if v.strip()]
+
+        started_at = time.perf_counter()
+        # 토크나이저 첫 사용 비용
+        self.tokenizer(PARITY_SAMPLE_TEXTS, truncation=True, max_length=self.max_length)
+
+        filler_id = self.tokenizer.unk_token_id or 100
+        for seq_length in seq_lengths:
+            seq_length = min(seq_length, self.max_length)
+            for batch_size in batch_sizes:
+                self._forward_token_batch([[filler_id] * seq_length] * batch_size)
+
+        elapsed = time.perf_counter() - started_at
+        get_gauge("embedding_warmup_seconds").set(elapsed)
+        self.logger.info(f"🔥 [EMBEDDING] 워밍업 완료 - 배치 크기: {batch_sizes}, 시퀀스 길이: {seq_lengths}, 소요: {elapsed:.2f}초")
+        return elapsed
+
+    def check_parity(self, texts: Optional[List[str]] = None) -> Dict[str, Any]:
+        """현재 백엔드 출력을 fp32 torch 기준 벡터와 비교"""
+        texts = texts or PARITY_SAMPLE_TEXTS
+        vectors = self._encode_batch(texts)
+        if self.backend_name == TorchBackend.name:
+            reference = vectors
+        else:
+            reference = self._encode_batch(texts, backend=TorchBackend(self.model_name))
+
+        self.parity = {"backend": self.backend_name, **compare_vectors(vectors, reference)}
+        get_gauge("embedding_backend_parity_min_cosine").set(self.parity["min_cosine"])
+        self.logger.info(f"🤖 [EMBEDDING] 백엔드 parity - {self.parity}")
+        return self.parity
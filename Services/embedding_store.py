@@ -0,0 +1,161 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import numpy as np
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from Services.logger_config import get_milvus_logger
+from Services.metrics import get_counter
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 잠금 없이 단일 프로세스 쓰기만 지원
+    fcntl = None
+
+
+def content_hash(text: str) -> str:
+    """텍스트 내용 해시 (저장소 키)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PersistentEmbeddingStore:
+    """영구 임베딩 저장소 - SQLite 인덱스 + 메모리 맵 float32 벡터 파일
+
+    - 벡터는 `<모델>_<차원>.f32` 파일에 행 단위로 append 되고, SQLite 인덱스가 내용 해시 -> 행 번호를 기록
+    - 재시작 후에도 유지되며, 여러 uvicorn 워커 프로세스가 읽기 전용으로 공유 가능
+    - 쓰기는 파일 잠금으로 직렬화 (데이터 파일 기록 후 인덱스 커밋)
+    """
+
+    def __init__(self, directory: str, model_name: str, dimension: int, read_only: bool = False):
+        self.directory = directory
+        self.model_name = model_name
+        self.dimension = dimension
+        self.read_only = read_only
+        self.row_bytes = dimension * 4
+        self.logger = get_milvus_logger()
+
+        base_name = f"{re.sub(r'[^A-Za-z0-9_.-]', '_', model_name)}_{dimension}"
+        self.data_path = os.path.join(directory, f"{base_name}.f32")
+        self.index_path = os.path.join(directory, f"{base_name}.sqlite")
+        self.lock_path = os.path.join(directory, f"{base_name}.lock")
+
+        if read_only:
+            self._conn = sqlite3.connect(f"file:{self.index_path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.index_path, check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, row INTEGER NOT NULL)")
+            self._conn.commit()
+            open(self.data_path, "ab").close()
+
+        self._lock = threading.Lock()
+        self._mmap: Optional[np.ndarray] = None
+        self._hits = get_counter("embedding_store_hits")
+        self._misses = get_counter("embedding_store_misses")
+        self._writes = get_counter("embedding_store_writes")
+        self.logger.info(f"💾 [STORE] 영구 임베딩 저장소 열기 - 경로: {self.data_path}, 읽기 전용: {read_only}")
+
+    @classmethod
+    def from_env(cls, model_name: str, dimension: int) -> Optional["PersistentEmbeddingStore"]:
+        """EMBEDDING_STORE_DIR이 설정된 경우에만 저장소 생성"""
+        directory = os.getenv('EMBEDDING_STORE_DIR')
+        if not directory:
+            return None
+        read_only = os.getenv('EMBEDDING_STORE_READONLY', 'false').lower() == 'true'
+        return cls(directory, model_name, dimension, read_only=read_only)
+
+    def _rows_view(self, min_rows: int) -> np.ndarray:
+        """벡터 파일의 메모리 맵 뷰 - 다른 프로세스가 파일을 늘렸으면 다시 매핑"""
+        if self._mmap is None or self._mmap.shape[0] < min_rows:
+            rows = os.path.getsize(self.data_path) // self.row_bytes
+            if rows == 0:
+                return np.empty((0, self.dimension), dtype=np.float32)
+            self._mmap = np.memmap(self.data_path, dtype=np.float32, mode="r", shape=(rows, self.dimension))
+        return self._mmap
+
+    def get_many(self, texts: List[str]) -> Dict[int, np.ndarray]:
+        """저장된 벡터 조회 - {입력 인덱스: 벡터} 반환 (없는 항목은 제외)"""
+        keys = [content_hash(text) for text in texts]
+        key_to_row: Dict[str, int] = {}
+        with self._lock:
+            unique_keys = list(set(keys))
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._conn.execute(
+                    f"SELECT key, row FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                key_to_row.update(cursor.fetchall())
+
+            found: Dict[int, np.ndarray] = {}
+            if key_to_row:
+                rows_view = self._rows_view(max(key_to_row.values()) + 1)
+                for i, key in enumerate(keys):
+                    row = key_to_row.get(key)
+                    if row is not None and row < rows_view.shape[0]:
+                        found[i] = np.array(rows_view[row])
+
+        self._hits.inc(len(found))
+        self._misses.inc(len(texts) - len(found))
+        return found
+
+    @contextmanager
+    def _write_lock(self):
+        """프로세스 간 쓰기 잠금"""
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def put_many(self, texts: List[str], vectors: np.ndarray):
+        """벡터 저장 - 이미 저장된 내용 해시는 건너뜀"""
+        if self.read_only or not texts:
+            return
+        pending: Dict[str, np.ndarray] = {}
+        for text, vector in zip(texts, vectors):
+            pending.setdefault(content_hash(text), vector)
+
+        with self._lock, self._write_lock():
+            keys = list(pending.keys())
+            existing = set()
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._conn.execute(f"SELECT key FROM embeddings WHERE key IN ({placeholders})", chunk)
+                existing.update(row[0] for row in cursor.fetchall())
+            new_keys = [key for key in keys if key not in existing]
+            if not new_keys:
+                return
+
+            with open(self.data_path, "r+b") as data_file:
+                # 중간에 끊긴 쓰기가 있으면 행 경계로 잘라냄
+                size = os.path.getsize(self.data_path)
+                first_row = size // self.row_bytes
+                if size % self.row_bytes:
+                    data_file.truncate(first_row * self.row_bytes)
+                data_file.seek(first_row * self.row_bytes)
+                block = np.ascontiguousarray(np.stack([pending[key] for key in new_keys]), dtype=np.float32)
+                data_file.write(block.tobytes())
+                data_file.flush()
+                os.fsync(data_file.fileno())
+
+            # 데이터 기록이 끝난 뒤 인덱스 커밋 - 읽는 쪽은 항상 완전한 행만 보게 됨
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, row) VALUES (?, ?)",
+                [(key, first_row + i) for i, key in enumerate(new_keys)]
+            )
+            self._conn.commit()
+            self._writes.inc(len(new_keys))
+
+    def close(self):
+        """저장소 닫기"""
+        with self._lock:
+            self._mmap = None
+            self._conn.close()
@@ -0,0 +1,105 @@
+import multiprocessing
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+from Services.logger_config import get_milvus_logger
+
+
+# 워커 프로세스마다 하나씩 보유하는 임베딩 엔진
+_worker_engine = None
+
+
+def _init_worker(model_name: str, backend_name: str, processes: int):
+    """워커 프로세스 초기화 - 자체 모델 사본 로드 및 워밍업
+
+    EMBEDDING_NUM_THREADS가 없으면 워커마다 코어 수 / 워커 수만큼만 intra-op 스레드를 사용
+    (각 워커가 torch 기본값인 전체 코어 수만큼 스레드를 띄우면 서로 코어를 빼앗음)
+    """
+    global _worker_engine
+    if not os.getenv('EMBEDDING_NUM_THREADS'):
+        # spawn된 워커 자신의 환경만 바뀜 - configure_threads()와 ONNX 세션 옵션이 모두 이 값을 사용
+        os.environ['EMBEDDING_NUM_THREADS'] = str(max(1, (os.cpu_count() or 1) // processes))
+    from Services.embedding_engine import EmbeddingEngine
+    _worker_engine = EmbeddingEngine(model_name, backend=backend_name)
+    if os.getenv('EMBEDDING_WARMUP', 'true').lower() == 'true':
+        _worker_engine.warmup()
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _encode_to_shared_memory(texts: List[str]) -> Tuple[str, Tuple[int, int]]:
+    """워커에서 임베딩 후 결과를 공유 메모리에 기록 - 벡터는 pickle 대신 공유 메모리 이름과 shape만 반환"""
+    vectors = _worker_engine.encode(texts)
+    shm = SharedMemory(create=True, size=max(vectors.nbytes, 1))
+    np.ndarray(vectors.shape, dtype=np.float32, buffer=shm.buf)[:] = vectors
+    # 세그먼트 해제(unlink)는 결과를 읽은 부모 프로세스가 담당
+    resource_tracker.unregister(shm._name, "shared_memory")
+    shm.close()
+    return shm.name, vectors.shape
+
+
+def _read_shared_memory(name: str, shape: Tuple[int, int]) -> np.ndarray:
+    """공유 메모리에서 결과를 복사해 오고 세그먼트 해제"""
+    shm = SharedMemory(name=name)
+    try:
+        return np.ndarray(shape, dtype=np.float32, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+class EmbeddingWorkerPool:
+    """멀티 프로세스 임베딩 워커 풀 - 프로세스마다 모델 사본을 두어 토크나이저/풀링까지 코어 수만큼 병렬화"""
+
+    def __init__(self, processes: int, model_name: str, backend_name: str, chunk_size: Optional[int] = None):
+        self.processes = processes
+        self.chunk_size = chunk_size or int(os.getenv('EMBEDDING_WORKER_CHUNK_SIZE', '64'))
+        self.logger = get_milvus_logger()
+        # torch는 fork 이후 안전하지 않으므로 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_name, backend_name, processes)
+        )
+
+    @classmethod
+    def from_env(cls, model_name: str, backend_name: str) -> Optional["EmbeddingWorkerPool"]:
+        """EMBEDDING_PROCESS_WORKERS가 1 이상인 경우에만 워커 풀 생성"""
+        processes = int(os.getenv('EMBEDDING_PROCESS_WORKERS', '0'))
+        if processes <= 0:
+            return None
+        return cls(processes, model_name, backend_name)
+
+    def start(self):
+        """모든 워커 프로세스를 미리 띄우고 모델 로드가 끝날 때까지 대기"""
+        futures = [self._executor.submit(_worker_ready) for _ in range(self.processes)]
+        pids = {future.result() for future in futures}
+        self.logger.info(f"⚙️ [WORKER_POOL] 임베딩 워커 풀 준비 완료 - 프로세스: {self.processes}, PID: {sorted(pids)}")
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """텍스트를 청크로 나눠 워커들에 분배하고 결과를 원래 순서로 합침 (호출 스레드는 결과를 기다리며 블록)"""
+        chunks = [texts[start:start + self.chunk_size] for start in range(0, len(texts), self.chunk_size)]
+        futures = [self._executor.submit(_encode_to_shared_memory, chunk) for chunk in chunks]
+
+        # 일부 청크가 실패해도 성공한 청크의 공유 메모리는 모두 해제
+        results = []
+        error = None
+        for future in futures:
+            try:
+                results.append(_read_shared_memory(*future.result()))
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+        return np.concatenate(results, axis=0)
+
+    def shutdown(self, wait: bool = True):
+        """워커 프로세스 종료"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self.logger.info(f"⚙️ [WORKER_POOL] 임베딩 워커 풀 종료")
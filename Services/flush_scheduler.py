@@ -0,0 +1,133 @@
+import asyncio
+import os
+import time
+from typing import Callable, Dict, Optional
+from Services.logger_config import get_milvus_logger
+from Services.metrics import get_counter, get_histogram
+
+
+FLUSH_POLICIES = ["always", "rows", "interval", "explicit", "never"]
+
+
+class FlushScheduler:
+    """쓰기 지연(write-behind) flush 관리자
+
+    요청마다 collection.flush()를 호출하면 작은 세그먼트가 대량으로 봉인되므로,
+    정책에 따라 컬렉션별 flush를 모아서 백그라운드에서 수행
+
+    - always: 요청마다 즉시 flush (기존 동작)
+    - rows: 마지막 flush 이후 누적 행 수가 MILVUS_FLUSH_ROWS 이상이면 flush
+    - interval: 변경된 컬렉션을 MILVUS_FLUSH_INTERVAL_SECONDS 간격으로 flush
+    - explicit: 자동 flush 없음, POST /collection/flush 요청 시에만 flush
+    - never: flush를 전혀 호출하지 않고 Milvus 자체 세그먼트 봉인에 맡김 (/collection/flush도 무시)
+    """
+
+    def __init__(self, flush_fn: Callable[[str], None], policy: Optional[str] = None,
+                 flush_rows: Optional[int] = None, interval_seconds: Optional[float] = None):
+        self.flush_fn = flush_fn
+        self.policy = (policy or os.getenv('MILVUS_FLUSH_POLICY', 'interval')).lower()
+        if self.policy not in FLUSH_POLICIES:
+            raise ValueError(f"지원하지 않는 flush 정책입니다: {self.policy} (지원: {', '.join(FLUSH_POLICIES)})")
+        self.flush_rows = flush_rows or int(os.getenv('MILVUS_FLUSH_ROWS', '10000'))
+        self.interval_seconds = interval_seconds or float(os.getenv('MILVUS_FLUSH_INTERVAL_SECONDS', '5'))
+        self.logger = get_milvus_logger()
+        # 컬렉션별 마지막 flush 이후 누적 변경 행 수와 최초 변경 시각
+        self._pending_rows: Dict[str, int] = {}
+        self._dirty_since: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_count = get_counter("milvus_flush_count")
+        self._flush_ms = get_histogram("milvus_flush_ms")
+
+    def start(self):
+        """백그라운드 flush 작업 시작"""
+        if self._task is None and self.policy in ("rows", "interval"):
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+            self.logger.info(f"💾 [FLUSH] 백그라운드 flush 시작 - 정책: {self.policy}")
+
+    async def stop(self):
+        """백그라운드 작업 종료 - 남은 변경분은 모두 flush"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.policy in ("rows", "interval"):
+            for collection_name in list(self._pending_rows):
+                await self.flush(collection_name)
+
+    async def record_write(self, collection_name: str, rows: int) -> bool:
+        """쓰기(삽입/삭제) 기록 - 요청 시점에 데이터가 flush(영구 봉인)되었으면 True 반환"""
+        if self.policy == "always":
+            await self.flush(collection_name, force=True)
+            return True
+
+        self._pending_rows[collection_name] = self._pending_rows.get(collection_name, 0) + rows
+        self._dirty_since.setdefault(collection_name, time.monotonic())
+        if self.policy == "rows" and self._pending_rows[collection_name] >= self.flush_rows and self._wakeup:
+            self._wakeup.set()
+        return False
+
+    def is_durable(self, collection_name: str) -> bool:
+        """마지막 쓰기까지 flush 되었는지 여부"""
+        return collection_name not in self._pending_rows
+
+    def forget(self, collection_name: str):
+        """삭제된 컬렉션의 대기 상태 제거"""
+        self._pending_rows.pop(collection_name, None)
+        self._dirty_since.pop(collection_name, None)
+        self._locks.pop(collection_name, None)
+
+    async def flush(self, collection_name: str, force: bool = False):
+        """컬렉션 flush - 같은 컬렉션의 flush는 한 번에 하나만 실행하고, 대기 중 들어온 변경은 다음 flush로 합침"""
+        lock = self._locks.setdefault(collection_name, asyncio.Lock())
+        async with lock:
+            if not force and collection_name not in self._pending_rows:
+                return
+            # flush 도중 들어온 쓰기는 다시 pending으로 남도록 먼저 상태를 비움
+            rows = self._pending_rows.pop(collection_name, 0)
+            self._dirty_since.pop(collection_name, None)
+            started_at = time.perf_counter()
+            try:
+                await asyncio.to_thread(self.flush_fn, collection_name)
+            except Exception:
+                self._pending_rows[collection_name] = self._pending_rows.get(collection_name, 0) + rows
+                self._dirty_since.setdefault(collection_name, time.monotonic())
+                raise
+            self._flush_count.inc()
+            self._flush_ms.observe((time.perf_counter() - started_at) * 1000)
+            self.logger.info(f"💾 [FLUSH] 컬렉션 '{collection_name}' flush 완료 - 반영 행 수: {rows}")
+
+    def _due_collections(self):
+        now = time.monotonic()
+        for collection_name, rows in list(self._pending_rows.items()):
+            if self.policy == "rows" and rows >= self.flush_rows:
+                yield collection_name
+            elif self.policy == "interval" and now - self._dirty_since.get(collection_name, now) >= self.interval_seconds:
+                yield collection_name
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            for collection_name in list(self._due_collections()):
+                try:
+                    await self.flush(collection_name)
+                except Exception as e:
+                    self.logger.error(f"❌ [FLUSH] 컬렉션 '{collection_name}' flush 실패: {e}")
+
+    def status(self) -> Dict[str, object]:
+        """정책과 컬렉션별 대기 행 수"""
+        return {
+            "policy": self.policy,
+            "flush_rows": self.flush_rows,
+            "interval_seconds": self.interval_seconds,
+            "pending_rows": dict(self._pending_rows)
+        }
@@ -0,0 +1,75 @@
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, Optional, Tuple
+from Services.logger_config import get_milvus_logger
+
+
+class IdAllocator:
+    """컬렉션별 기본키(ID) 범위 할당기
+
+    - SQLite 사이드 스토어에 컬렉션별 high-water mark(다음에 할당할 ID)를 저장
+    - 각 프로세스는 블록 단위(ID_ALLOCATOR_BLOCK_SIZE)로 범위를 예약한 뒤 메모리에서 O(1)로 나눠줌
+    - 예약은 SQLite 쓰기 트랜잭션(BEGIN IMMEDIATE)으로 직렬화되므로 여러 워커 프로세스에서도 ID가 겹치지 않음
+    - 삭제 후에도 high-water mark는 줄어들지 않아 기존 행과 충돌하지 않음 (사용되지 않은 ID 구간은 건너뜀)
+    - 컬렉션 삭제/ID 리셋 후에도 high-water mark를 낮추지 않음 - 다른 워커가 이미 예약해 둔 블록과 겹치지 않도록
+    """
+
+    def __init__(self, path: Optional[str] = None, block_size: Optional[int] = None):
+        self.path = path or os.getenv('ID_ALLOCATOR_PATH', os.path.join("data", "id_allocator.sqlite"))
+        self.block_size = block_size or int(os.getenv('ID_ALLOCATOR_BLOCK_SIZE', '10000'))
+        self.logger = get_milvus_logger()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # isolation_level=None: 트랜잭션을 직접 BEGIN IMMEDIATE로 제어
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS id_high_water (collection TEXT PRIMARY KEY, next_id INTEGER NOT NULL)")
+        self._lock = threading.Lock()
+        # 컬렉션별 예약된 로컬 블록 [next, end)
+        self._blocks: Dict[str, Tuple[int, int]] = {}
+
+    def allocate(self, collection_name: str, count: int, seed_fn: Callable[[], int]) -> int:
+        """연속된 ID count개를 할당하고 시작 ID 반환
+
+        Args:
+            collection_name: 컬렉션명
+            count: 필요한 ID 개수
+            seed_fn: 사이드 스토어에 기록이 없을 때 한 번 호출되어 시작 ID(기존 최대 ID + 1)를 반환
+        """
+        with self._lock:
+            next_id, end = self._blocks.get(collection_name, (0, 0))
+            if end - next_id < count:
+                next_id, end = self._reserve(collection_name, max(self.block_size, count), seed_fn)
+            self._blocks[collection_name] = (next_id + count, end)
+            return next_id
+
+    def _high_water(self, collection_name: str) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT next_id FROM id_high_water WHERE collection = ?", (collection_name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _reserve(self, collection_name: str, size: int, seed_fn: Callable[[], int]) -> Tuple[int, int]:
+        """사이드 스토어에서 블록 예약 (프로세스 간 직렬화)
+
+        seed 계산(Milvus 전체 ID 스캔)은 쓰기 잠금을 잡기 전에 수행하여 다른 워커가 스캔 동안 멈추지 않게 함
+        """
+        seed = seed_fn() if self._high_water(collection_name) is None else None
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            start = self._high_water(collection_name)
+            if start is None:
+                start = seed
+            self._conn.execute(
+                "INSERT INTO id_high_water (collection, next_id) VALUES (?, ?) "
+                "ON CONFLICT(collection) DO UPDATE SET next_id = excluded.next_id",
+                (collection_name, start + size)
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self.logger.info(f"🔢 [ID_ALLOCATOR] ID 블록 예약 - 컬렉션: {collection_name}, 범위: {start} ~ {start + size - 1}")
+        return start, start + size
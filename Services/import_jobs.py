@@ -0,0 +1,411 @@
+import asyncio
+import functools
+import json
+import os
+import time
+import uuid
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional
+from pymilvus import utility
+from Services.logger_config import get_milvus_logger, get_user_activity_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 작업 잠금 없이 단일 프로세스 실행만 지원
+    fcntl = None
+
+
+IMPORT_FORMATS = ["jsonl", "npy", "parquet"]
+IMPORT_MODES = ["insert", "bulk_insert"]
+FINISHED_STATUSES = ["completed", "failed"]
+# 작업 상태에 기록하는 JSON 파싱 실패 줄 번호 최대 개수
+MAX_INVALID_LINES = 1000
+
+
+def detect_format(path: str) -> str:
+    """파일 확장자로 가져오기 형식 판별"""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension in ("jsonl", "ndjson"):
+        return "jsonl"
+    if extension in ("npy", "parquet"):
+        return extension
+    raise ValueError(f"형식을 판별할 수 없는 파일입니다: {path} (지원: {', '.join(IMPORT_FORMATS)})")
+
+
+def _read_jsonl(path: str, start_row: int, chunk_size: int,
+                invalid_lines: Optional[List[int]] = None) -> Iterator[List[Dict[str, Any]]]:
+    """JSON 객체로 파싱되는 줄만 행으로 셈 - 파싱 실패 줄은 건너뛰고 줄 번호를 invalid_lines에 추가
+
+    행 번호에 실패 줄이 포함되지 않으므로 체크포인트(start_row)에서 재개해도 같은 행이 다시 삽입되지 않음
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        chunk: List[Dict[str, Any]] = []
+        row = 0
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                if not isinstance(item, dict):
+                    raise ValueError("JSON 객체가 아닙니다")
+            except ValueError:
+                # 체크포인트 이전의 실패 줄은 이미 기록됨
+                if row >= start_row and invalid_lines is not None:
+                    invalid_lines.append(line_number)
+                continue
+            row += 1
+            if row <= start_row:
+                continue
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _read_npy(path: str, start_row: int, chunk_size: int) -> Iterator[np.ndarray]:
+    # 메모리 맵으로 열어 청크 단위로만 읽음
+    vectors = np.load(path, mmap_mode="r")
+    for start in range(start_row, len(vectors), chunk_size):
+        yield np.ascontiguousarray(vectors[start:start + chunk_size], dtype=np.float32)
+
+
+def _read_parquet(path: str, start_row: int, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("Parquet 가져오기를 사용하려면 pyarrow 패키지를 설치해야 합니다.") from e
+
+    parquet_file = pq.ParquetFile(path)
+    columns = [name for name in ("text", "vector") if name in parquet_file.schema_arrow.names]
+    if not columns:
+        raise ValueError("Parquet 파일에 text 또는 vector 컬럼이 없습니다.")
+    row = 0
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+        rows = batch.to_pylist()
+        if row + len(rows) <= start_row:
+            row += len(rows)
+            continue
+        skip = max(0, start_row - row)
+        row += len(rows)
+        yield rows[skip:]
+
+
+def _count_rows(path: str, fmt: str) -> Optional[int]:
+    """진행률 계산용 전체 행 수 (빠르게 알 수 있는 형식만)"""
+    if fmt == "npy":
+        return int(np.load(path, mmap_mode="r").shape[0])
+    if fmt == "parquet":
+        try:
+            import pyarrow.parquet as pq
+            return pq.ParquetFile(path).metadata.num_rows
+        except ImportError:
+            return None
+    return None
+
+
+class ImportJobManager:
+    """비동기 대량 가져오기 작업 관리자
+
+    - 파일을 청크 단위로 읽어 MilvusService의 삽입 경로(임베딩 + ID 할당 + 삽입 + flush 정책)로 처리
+    - 청크마다 체크포인트(처리한 행 수)를 JSON 파일로 기록하여 프로세스가 죽어도 이어서 재개
+      (체크포인트 기록 직전에 중단된 청크는 재개 시 한 번 더 삽입될 수 있음 - at-least-once)
+    - mode=bulk_insert이면 Milvus 서버의 bulk insert(do_bulk_insert)를 사용하며,
+      이때 source_path는 Milvus가 접근 가능한 오브젝트 스토리지 경로여야 함
+    - 작업마다 파일 잠금(<job_id>.lock)을 잡은 프로세스만 실행하므로 여러 uvicorn 워커가
+      동시에 시작해도 미완료 작업은 한 번만 재개됨
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self.jobs_dir = os.getenv('IMPORT_JOBS_DIR', os.path.join("data", "import_jobs"))
+        self.chunk_size = int(os.getenv('IMPORT_CHUNK_SIZE', '1000'))
+        # /jobs/import가 읽을 수 있는 전용 디렉토리 - 서버 프로세스가 읽을 수 있는 임의 경로(/etc, 비밀 파일 등)를
+        # 컬렉션으로 가져오지 못하도록 기본적으로 이 디렉토리(와 업로드 디렉토리) 하위로 제한
+        self.source_root = os.getenv('IMPORT_SOURCE_ROOT', os.path.join(self.jobs_dir, "sources"))
+        self.allow_any_source = os.getenv('IMPORT_ALLOW_ANY_SOURCE_PATH', 'false').lower() == 'true'
+        self.logger = get_milvus_logger()
+        self.user_logger = get_user_activity_logger()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        # 이 프로세스가 잡고 있는 작업별 잠금 파일
+        self._claims: Dict[str, Any] = {}
+        self._slots = asyncio.Semaphore(int(os.getenv('IMPORT_MAX_CONCURRENT_JOBS', '1')))
+
+    @property
+    def uploads_dir(self) -> str:
+        return os.path.join(self.jobs_dir, "uploads")
+
+    def _job_path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def _lock_path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.lock")
+
+    def _load(self, job_id: str) -> Dict[str, Any]:
+        with open(self._job_path(job_id), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _claim(self, job_id: str) -> bool:
+        """작업 잠금 획득 (비차단) - 다른 워커 프로세스가 이미 실행 중이면 False"""
+        if fcntl is None:
+            return True
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        lock_file = open(self._lock_path(job_id), "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._claims[job_id] = lock_file
+        return True
+
+    def _release(self, job_id: str, finished: bool):
+        """작업 잠금 해제 - 끝난 작업은 잠금 파일도 삭제"""
+        lock_file = self._claims.pop(job_id, None)
+        if lock_file is None:
+            return
+        if finished:
+            try:
+                os.remove(self._lock_path(job_id))
+            except FileNotFoundError:
+                pass
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
+
+    def _save(self, job: Dict[str, Any]):
+        """작업 상태/체크포인트 저장 (임시 파일에 쓴 뒤 교체하여 원자적으로 기록)"""
+        job["updated_at"] = time.time()
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        tmp_path = self._job_path(job["job_id"]) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(tmp_path, self._job_path(job["job_id"]))
+
+    def _resolve_source(self, source_path: str, mode: str) -> str:
+        """source_path를 실제 경로로 변환하고 허용된 디렉토리(IMPORT_SOURCE_ROOT, 업로드 디렉토리) 하위인지 확인
+
+        상대 경로는 IMPORT_SOURCE_ROOT 기준으로 해석하고, 심볼릭 링크/..은 realpath로 풀어서 비교.
+        IMPORT_ALLOW_ANY_SOURCE_PATH=true일 때만 임의 경로 허용. bulk_insert는 Milvus 쪽 경로이므로 그대로 사용
+        """
+        if mode == "bulk_insert":
+            return source_path
+        resolved = os.path.realpath(os.path.join(self.source_root, source_path))
+        if not self.allow_any_source:
+            roots = [os.path.realpath(self.source_root), os.path.realpath(self.uploads_dir)]
+            if not any(os.path.commonpath([root, resolved]) == root for root in roots):
+                raise ValueError(f"허용되지 않은 경로입니다: {source_path} (IMPORT_SOURCE_ROOT: {self.source_root})")
+        if not os.path.isfile(resolved):
+            raise ValueError(f"파일이 존재하지 않습니다: {source_path}")
+        return resolved
+
+    def submit(self, collection_name: str, source_path: str, fmt: Optional[str] = None,
+               mode: str = "insert", delete_source: bool = False) -> Dict[str, Any]:
+        """가져오기 작업 등록 후 백그라운드 실행 - delete_source이면 작업이 끝날 때 원본 파일 삭제 (업로드 파일용)"""
+        fmt = (fmt or detect_format(source_path)).lower()
+        if fmt not in IMPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {fmt} (지원: {', '.join(IMPORT_FORMATS)})")
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"지원하지 않는 모드입니다: {mode} (지원: {', '.join(IMPORT_MODES)})")
+        source_path = self._resolve_source(source_path, mode)
+
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "collection_name": collection_name,
+            "source_path": source_path,
+            "format": fmt,
+            "mode": mode,
+            "status": "pending",
+            "total_rows": _count_rows(source_path, fmt) if mode == "insert" else None,
+            "processed_rows": 0,
+            "inserted_rows": 0,
+            "skipped_rows": 0,
+            "invalid_lines": [],
+            "elapsed_seconds": 0.0,
+            "errors": [],
+            "delete_source": delete_source,
+            "created_at": time.time(),
+            "finished_at": None
+        }
+        self._jobs[job["job_id"]] = job
+        self._save(job)
+        self._claim(job["job_id"])
+        self.user_logger.info(f"📦 [USER_ACTION] 가져오기 작업 등록 - 작업: {job['job_id']}, 컬렉션: {collection_name}, 파일: {source_path}")
+        self._start(job)
+        return self.describe(job["job_id"])
+
+    def _start(self, job: Dict[str, Any]):
+        self._tasks[job["job_id"]] = asyncio.create_task(self._run(job))
+
+    def resume_incomplete(self):
+        """이전 실행에서 끝나지 않은 작업을 체크포인트부터 재개"""
+        if not os.path.isdir(self.jobs_dir):
+            return
+        for file_name in os.listdir(self.jobs_dir):
+            if not file_name.endswith(".json"):
+                continue
+            job = self._load(file_name[:-len(".json")])
+            self._jobs[job["job_id"]] = job
+            if job["status"] in FINISHED_STATUSES or job["job_id"] in self._tasks:
+                continue
+            if not self._claim(job["job_id"]):
+                self.logger.info(f"📦 [IMPORT] 다른 워커가 실행 중인 작업 - 작업: {job['job_id']}")
+                continue
+            # 잠금을 얻기 전에 다른 워커가 끝냈을 수 있으므로 최신 상태를 다시 읽음
+            job = self._jobs[job["job_id"]] = self._load(job["job_id"])
+            if job["status"] in FINISHED_STATUSES:
+                self._release(job["job_id"], finished=True)
+                continue
+            self.logger.info(f"📦 [IMPORT] 작업 재개 - 작업: {job['job_id']}, 체크포인트: {job['processed_rows']}행")
+            self._start(job)
+
+    def describe(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 + 진행률/처리량"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job_id not in self._tasks and job["status"] not in FINISHED_STATUSES and os.path.exists(self._job_path(job_id)):
+            # 다른 워커 프로세스가 실행 중인 작업은 체크포인트 파일에서 진행 상황을 읽음
+            job = self._jobs[job_id] = self._load(job_id)
+        info = dict(job)
+        total = job.get("total_rows")
+        info["progress"] = round(job["processed_rows"] / total, 4) if total else None
+        elapsed = job.get("elapsed_seconds") or 0.0
+        info["rows_per_second"] = round(job["inserted_rows"] / elapsed, 2) if elapsed else 0.0
+        return info
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        return [self.describe(job_id) for job_id in sorted(self._jobs, key=lambda j: self._jobs[j]["created_at"])]
+
+    def _record_error(self, job: Dict[str, Any], message: str):
+        # 최근 오류만 보관
+        job["errors"] = (job["errors"] + [message])[-20:]
+
+    def _delete_source(self, job: Dict[str, Any]):
+        """업로드로 만든 원본 파일 삭제"""
+        if not job.get("delete_source"):
+            return
+        try:
+            os.remove(job["source_path"])
+        except FileNotFoundError:
+            pass
+
+    async def _run(self, job: Dict[str, Any]):
+        finished = False
+        try:
+            await self._run_claimed(job)
+            finished = True
+        finally:
+            self._release(job["job_id"], finished)
+
+    async def _run_claimed(self, job: Dict[str, Any]):
+        async with self._slots:
+            job["status"] = "running"
+            self._save(job)
+            try:
+                if job["mode"] == "bulk_insert":
+                    await self._run_bulk_insert(job)
+                else:
+                    await self._run_chunked_insert(job)
+                job["status"] = "completed"
+                self.user_logger.info(f"✅ [USER_SUCCESS] 가져오기 작업 완료 - 작업: {job['job_id']}, 삽입: {job['inserted_rows']}행")
+            except asyncio.CancelledError:
+                # 서버 종료 - 상태를 running으로 남겨 다음 시작 시 재개
+                self._save(job)
+                raise
+            except Exception as e:
+                job["status"] = "failed"
+                self._record_error(job, str(e))
+                self.user_logger.error(f"❌ [USER_FAILURE] 가져오기 작업 실패 - 작업: {job['job_id']}, 오류: {str(e)}")
+                self.logger.error(f"❌ [IMPORT] 가져오기 작업 실패 - 작업: {job['job_id']}, 오류: {str(e)}")
+            finally:
+                self._tasks.pop(job["job_id"], None)
+            job["finished_at"] = time.time()
+            self._save(job)
+            self._delete_source(job)
+
+    async def _run_chunked_insert(self, job: Dict[str, Any]):
+        collection_name = job["collection_name"]
+        metadata = await self.service.collection_cache.get(collection_name)
+        if metadata is None:
+            raise ValueError(f"컬렉션 '{collection_name}'이 존재하지 않습니다.")
+        collection = metadata.collection
+        vector_dimension = metadata.dimension
+
+        invalid_lines: List[int] = []
+        readers = {"jsonl": functools.partial(_read_jsonl, invalid_lines=invalid_lines),
+                   "npy": _read_npy, "parquet": _read_parquet}
+        chunks = readers[job["format"]](job["source_path"], job["processed_rows"], self.chunk_size)
+
+        async def read_chunks():
+            offset = job["processed_rows"]
+            while True:
+                # 파일 읽기는 이벤트 루프 밖에서 수행
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    return
+                if isinstance(chunk, np.ndarray) and (chunk.ndim != 2 or chunk.shape[1] != vector_dimension):
+                    raise ValueError(f"벡터 shape 불일치: {chunk.shape}, 컬렉션 차원: {vector_dimension}")
+                yield chunk, offset
+                offset += len(chunk)
+
+        # 읽기/임베딩과 삽입을 파이프라인으로 겹쳐 실행 - 결과는 입력 순서대로 나오므로 체크포인트는 그대로 유효
+        pipeline = self.service._ingest_pipeline(collection_name, collection, vector_dimension)
+        started_at = time.perf_counter()
+        async for chunk, vectors, _ in pipeline.run(read_chunks()):
+            job["processed_rows"] += len(chunk)
+            job["inserted_rows"] += len(vectors)
+            job["skipped_rows"] += len(chunk) - len(vectors)
+            now = time.perf_counter()
+            job["elapsed_seconds"] += now - started_at
+            started_at = now
+            if len(chunk) != len(vectors):
+                self._record_error(job, f"{len(chunk) - len(vectors)}개 행을 처리하지 못함 (행 {job['processed_rows'] - len(chunk) + 1} ~ {job['processed_rows']})")
+            self._record_invalid_lines(job, invalid_lines)
+            # 청크마다 체크포인트 기록
+            self._save(job)
+        # 마지막 청크 뒤에 있던 실패 줄
+        self._record_invalid_lines(job, invalid_lines)
+
+    def _record_invalid_lines(self, job: Dict[str, Any], invalid_lines: List[int]):
+        """리더가 모은 JSON 파싱 실패 줄 번호를 작업 상태로 옮김
+
+        리더 스레드가 계속 뒤에 추가하므로 앞에서부터 읽은 만큼만 잘라냄.
+        리더가 앞서 읽은 줄이 포함될 수 있어 재개 시 중복 기록되지 않도록 합집합으로 보관
+        """
+        count = len(invalid_lines)
+        if not count:
+            return
+        lines = invalid_lines[:count]
+        del invalid_lines[:count]
+        self._record_error(job, f"JSON 파싱 실패로 {count}개 줄을 건너뜀 (줄 {lines[0]} ~ {lines[-1]})")
+        job["invalid_lines"] = sorted(set(job.get("invalid_lines", [])) | set(lines))[:MAX_INVALID_LINES]
+
+    async def _run_bulk_insert(self, job: Dict[str, Any]):
+        """Milvus 서버 bulk insert 사용 - 서버가 파일을 직접 읽어 적재"""
+        started_at = time.perf_counter()
+        if not job.get("bulk_task_id"):
+            job["bulk_task_id"] = await asyncio.to_thread(
+                utility.do_bulk_insert, collection_name=job["collection_name"], files=[job["source_path"]]
+            )
+            self._save(job)
+
+        while True:
+            state = await asyncio.to_thread(utility.get_bulk_insert_state, task_id=job["bulk_task_id"])
+            job["inserted_rows"] = job["processed_rows"] = int(getattr(state, "row_count", 0) or 0)
+            job["elapsed_seconds"] = time.perf_counter() - started_at
+            state_name = str(getattr(state, "state_name", "")).lower()
+            if state_name == "completed":
+                break
+            if state_name in ("failed", "failedandcleanup"):
+                raise RuntimeError(f"bulk insert 실패: {getattr(state, 'failed_reason', state_name)}")
+            self._save(job)
+            await asyncio.sleep(2)
+
+    async def shutdown(self):
+        """실행 중인 작업 중단 - 체크포인트가 남아 다음 시작 시 재개됨"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,32 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from Services.logger_config import get_milvus_logger
+
+
+class InferenceExecutor:
+    """모델 추론 전용 실행기 - 이벤트 루프를 막지 않도록 별도 스레드 풀에서 추론 실행"""
+
+    def __init__(self, max_workers: Optional[int] = None, queue_depth: Optional[int] = None,
+                 default_workers: int = 1):
+        """default_workers: EMBEDDING_WORKERS가 설정되지 않았을 때의 워커 수"""
+        self.max_workers = max_workers or int(os.getenv('EMBEDDING_WORKERS', str(default_workers)))
+        self.queue_depth = queue_depth if queue_depth is not None else int(os.getenv('EMBEDDING_QUEUE_DEPTH', '64'))
+        self.logger = get_milvus_logger()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="embedding")
+        # 실행 중 + 대기 중인 작업 수 상한 (초과 시 호출자는 슬롯이 빌 때까지 대기)
+        self._slots = asyncio.Semaphore(self.max_workers + self.queue_depth)
+        self.logger.info(f"⚙️ [EXECUTOR] 추론 실행기 준비 완료 - 워커: {self.max_workers}, 큐 깊이: {self.queue_depth}")
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """동기 추론 함수를 실행기에서 실행하고 결과를 기다림"""
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        """실행기 종료"""
+        self._executor.shutdown(wait=wait)
+        self.logger.info(f"⚙️ [EXECUTOR] 추론 실행기 종료")
@@ -0,0 +1,88 @@
+import asyncio
+import os
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
+from Services.metrics import get_gauge, get_histogram
+from Services.request_context import record_stage
+
+
+async def iterate_batches(items: list, batch_size: int) -> AsyncIterator[Tuple[list, int]]:
+    """리스트를 (배치, 시작 인덱스) 단위로 나눠 비동기 순회"""
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size], start
+
+
+class IngestPipeline:
+    """임베딩과 Milvus 쓰기를 겹쳐 실행하는 2단계 수집 파이프라인
+
+    임베딩 단계가 배치 k+1을 추론하는 동안 쓰기 단계가 배치 k를 삽입하므로,
+    전체 수집 시간이 두 단계의 합이 아니라 느린 쪽 단계 시간에 가까워짐.
+    단계 사이의 큐는 INGEST_PIPELINE_DEPTH개로 제한되어 쓰기가 밀리면 임베딩도 대기(backpressure).
+    """
+
+    def __init__(self, embed_fn: Callable[[Any, int], Awaitable[Any]],
+                 write_fn: Callable[[Any], Awaitable[Any]], depth: Optional[int] = None):
+        self.embed_fn = embed_fn
+        self.write_fn = write_fn
+        self.depth = depth or int(os.getenv('INGEST_PIPELINE_DEPTH', '2'))
+        self._embed_ms = get_histogram("ingest_embed_stage_ms")
+        self._write_ms = get_histogram("ingest_write_stage_ms")
+        self._write_wait_ms = get_histogram("ingest_write_wait_ms")
+        self._embed_utilization = get_gauge("ingest_embed_utilization")
+        self._write_utilization = get_gauge("ingest_write_utilization")
+
+    async def run(self, batches: AsyncIterator[Tuple[Any, int]]) -> AsyncIterator[Tuple[Any, Any, Any]]:
+        """(배치, 시작 인덱스)를 받아 배치마다 (배치, 벡터, 쓰기 결과)를 입력 순서대로 yield
+
+        embed_fn(batch, offset)는 삽입할 벡터 목록을, write_fn(vectors)는 쓰기 결과를 반환.
+        어느 단계에서든 예외가 나면 나머지 단계를 중단하고 예외를 그대로 전달.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.depth)
+        embed_busy = 0.0
+        write_busy = 0.0
+        started_at = time.perf_counter()
+
+        async def embed_stage():
+            nonlocal embed_busy
+            try:
+                async for batch, offset in batches:
+                    stage_start = time.perf_counter()
+                    vectors = await self.embed_fn(batch, offset)
+                    elapsed = time.perf_counter() - stage_start
+                    embed_busy += elapsed
+                    self._embed_ms.observe(elapsed * 1000)
+                    record_stage("embed", elapsed * 1000)
+                    # 큐가 가득 차면 쓰기 단계가 따라올 때까지 대기
+                    await queue.put((batch, vectors, None))
+                await queue.put((None, None, None))
+            except Exception as e:
+                await queue.put((None, None, e))
+
+        producer = asyncio.create_task(embed_stage())
+        try:
+            while True:
+                wait_start = time.perf_counter()
+                batch, vectors, error = await queue.get()
+                self._write_wait_ms.observe((time.perf_counter() - wait_start) * 1000)
+                if error is not None:
+                    raise error
+                if batch is None:
+                    break
+
+                result = None
+                if len(vectors):
+                    stage_start = time.perf_counter()
+                    result = await self.write_fn(vectors)
+                    elapsed = time.perf_counter() - stage_start
+                    write_busy += elapsed
+                    self._write_ms.observe(elapsed * 1000)
+                    record_stage("write", elapsed * 1000)
+                yield batch, vectors, result
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            # 단계별 가동률 = 실제 작업 시간 / 파이프라인 전체 시간
+            wall = time.perf_counter() - started_at
+            if wall > 0:
+                self._embed_utilization.set(round(embed_busy / wall, 4))
+                self._write_utilization.set(round(write_busy / wall, 4))
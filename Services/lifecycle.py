@@ -0,0 +1,170 @@
+import asyncio
+import importlib
+import os
+from typing import Any, Dict, Optional
+from fastapi import HTTPException
+from Services.logger_config import get_milvus_logger
+
+
+class ServiceNotReadyError(Exception):
+    """서비스가 아직 준비되지 않았을 때 발생"""
+
+
+class ServiceLifecycle:
+    """MilvusService 지연 초기화 관리자
+
+    무거운 모듈 import(torch/transformers), 모델 로드, Milvus 연결을 백그라운드에서 수행하여
+    서버는 즉시 기동하고, 준비 상태는 /health/ready로 보고함. Milvus 연결은 성공할 때까지 재시도하고,
+    모델 로드는 MODEL_LOAD_RETRIES회까지 재시도한 뒤 실패로 확정(나머지 초기화 작업도 취소).
+    오류는 구성 요소별(model_error, milvus_error)로 따로 보관하여 한쪽 성공이 다른 쪽 오류를 덮지 않음.
+    """
+
+    def __init__(self):
+        self.logger = get_milvus_logger()
+        self.service = None
+        self.model_loaded = False
+        self.model_warmed = False
+        self.warmup_enabled = os.getenv('EMBEDDING_WARMUP', 'true').lower() == 'true'
+        self.milvus_connected = False
+        self.init_error: Optional[str] = None
+        self.model_error: Optional[str] = None
+        self.milvus_error: Optional[str] = None
+        self.connect_attempts = 0
+        self.model_load_attempts = 0
+        self.retry_interval = float(os.getenv('MILVUS_CONNECT_RETRY_SECONDS', '5'))
+        self.model_load_retries = int(os.getenv('MODEL_LOAD_RETRIES', '3'))
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """가장 우선하는 오류 - 초기화 실패 > 모델 오류 > Milvus 연결 오류"""
+        return self.init_error or self.model_error or self.milvus_error
+
+    @property
+    def is_ready(self) -> bool:
+        return (self.service is not None and self.model_loaded and self.milvus_connected
+                and (self.model_warmed or not self.warmup_enabled))
+
+    def start(self):
+        """백그라운드 초기화 시작 (이벤트 루프를 막지 않음)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._initialize())
+
+    async def _initialize(self):
+        try:
+            module = await asyncio.to_thread(importlib.import_module, "Services.milvus_service")
+            self.service = module.milvus_service
+        except Exception as e:
+            self.init_error = f"서비스 모듈 로드 실패: {e}"
+            self.logger.error(f"❌ [LIFECYCLE] 서비스 모듈 로드 실패: {e}")
+            return
+
+        # 모델 로드와 Milvus 연결은 서로 독립적이므로 동시에 진행 - 한쪽이 실패로 확정되면 다른 쪽도 취소
+        tasks = [asyncio.create_task(self._load_model()), asyncio.create_task(self._connect_with_retry())]
+        try:
+            await asyncio.gather(*tasks)
+            # 이전 실행에서 끝나지 않은 가져오기 작업 재개
+            self.service.import_jobs.resume_incomplete()
+            self.logger.info(f"✅ [LIFECYCLE] 서비스 준비 완료")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self.model_error is None:
+                self.init_error = f"서비스 초기화 실패: {e}"
+            self.logger.error(f"❌ [LIFECYCLE] 서비스 초기화 실패: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _load_model(self):
+        """모델 로드 - 실패하면 MODEL_LOAD_RETRIES회까지 재시도하고, 그래도 실패하면 model_error를 남기고 예외 전달"""
+        while True:
+            self.model_load_attempts += 1
+            try:
+                await asyncio.to_thread(self.service._initialize_transformer)
+                self.model_error = None
+                break
+            except Exception as e:
+                self.model_error = f"모델 로드 실패: {e}"
+                if self.model_load_attempts >= self.model_load_retries:
+                    self.logger.error(f"❌ [LIFECYCLE] 모델 로드 실패 ({self.model_load_attempts}회차), 재시도 중단: {e}")
+                    raise
+                self.logger.warning(f"⚠️ [LIFECYCLE] 모델 로드 실패 ({self.model_load_attempts}회차), "
+                                    f"{self.retry_interval}초 후 재시도: {e}")
+                await asyncio.sleep(self.retry_interval)
+        self.model_loaded = True
+        if self.warmup_enabled:
+            if self.service.worker_pool is None:
+                # 실제 추론이 실행될 실행기 스레드에서 워밍업해야 준비 완료 직후 요청도 정상 속도로 처리됨
+                try:
+                    await self.service.inference.run(self.service.embedder.warmup)
+                except Exception as e:
+                    self.model_error = f"모델 워밍업 실패: {e}"
+                    raise
+            # 워커 풀은 각 워커가 초기화 중에 워밍업을 마친 뒤에야 worker_pool.start()가 반환됨
+            self.model_warmed = True
+
+    async def _connect_with_retry(self):
+        """Milvus 연결 - 실패하면 일정 간격으로 계속 재시도"""
+        while True:
+            self.connect_attempts += 1
+            try:
+                await asyncio.to_thread(self.service._initialize_connection)
+                self.milvus_connected = True
+                self.service.flush_scheduler.start()
+                self.milvus_error = None
+                return
+            except Exception as e:
+                self.milvus_error = f"Milvus 연결 실패: {e}"
+                self.logger.warning(f"⚠️ [LIFECYCLE] Milvus 연결 실패 ({self.connect_attempts}회차), "
+                                    f"{self.retry_interval}초 후 재시도: {e}")
+                await asyncio.sleep(self.retry_interval)
+
+    def get_service(self):
+        """준비된 MilvusService 반환 - 준비 전이면 ServiceNotReadyError"""
+        if not self.is_ready:
+            raise ServiceNotReadyError(self.last_error or "서비스 초기화 진행 중")
+        return self.service
+
+    def status(self) -> Dict[str, Any]:
+        """준비 상태 상세 정보"""
+        return {
+            "ready": self.is_ready,
+            "model_loaded": self.model_loaded,
+            "model_warmed": self.model_warmed,
+            "milvus_connected": self.milvus_connected,
+            "connect_attempts": self.connect_attempts,
+            "model_load_attempts": self.model_load_attempts,
+            "model_error": self.model_error,
+            "milvus_error": self.milvus_error,
+            "last_error": self.last_error
+        }
+
+    async def shutdown(self):
+        """백그라운드 초기화 취소 및 자원 정리"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self.service is not None:
+            # 가져오기 작업은 체크포인트를 남기고 중단 - 다음 시작 시 재개
+            await self.service.import_jobs.shutdown()
+            if self.milvus_connected:
+                # 종료 전 대기 중인 변경분 flush
+                await self.service.flush_scheduler.stop()
+            self.service.shutdown()
+
+
+# 싱글톤 인스턴스
+lifecycle = ServiceLifecycle()
+
+
+def get_milvus_service():
+    """라우터 의존성 - 준비된 MilvusService 반환, 모델 로드/Milvus 연결이 끝나기 전이면 503"""
+    try:
+        return lifecycle.get_service()
+    except ServiceNotReadyError as e:
+        raise HTTPException(status_code=503, detail=f"Milvus 서비스 준비 중: {e}")
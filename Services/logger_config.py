@@ -1,65 +1,212 @@
+import copy
 import logging
 import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
+from typing import Any, Dict, Optional
 import pytz
 
-def setup_logger(name: str, log_file: str = None, level: int = logging.INFO):
+# 핫 패스(요청마다 반복되는) INFO 로그 표시 - logger.info(..., extra=HOT_PATH)
+HOT_PATH = {"hot_path": True}
+
+_LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+_DEFAULT_SAMPLE_RATE = float(os.getenv('LOG_HOT_PATH_SAMPLE_RATE', '0.1'))
+
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_queue_handlers: Dict[str, "AsyncQueueHandler"] = {}
+_sampling_filters: Dict[str, "SamplingFilter"] = {}
+_registry_lock = threading.Lock()
+
+
+class SamplingFilter(logging.Filter):
+    """hot_path로 표시된 INFO 이하 레코드를 sample_rate 비율만 통과시키는 로거별 필터
+
+    WARNING 이상과 표시되지 않은 레코드는 항상 통과.
+    무작위가 아니라 누적 방식이라 sample_rate=0.1이면 정확히 10개 중 1개가 남음.
+    """
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self._credit = 0.0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or not getattr(record, "hot_path", False):
+            return True
+        rate = self.sample_rate
+        if rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        with self._lock:
+            self._credit += rate
+            # 부동소수점 누적 오차 허용
+            if self._credit >= 1 - 1e-9:
+                self._credit -= 1
+                return True
+            return False
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 큐에 넣기만 하는 핸들러 - 콘솔/파일 I/O와 포맷팅은 QueueListener 스레드에서 수행
+
+    기본 QueueHandler.prepare()는 호출 스레드에서 traceback까지 포맷팅하므로,
+    메시지 인자만 병합하고 exc_info는 그대로 넘겨 리스너 스레드에서 포맷팅되도록 함.
+    큐가 가득 차면 요청을 막지 않고 레코드를 버림 (dropped로 집계).
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _sample_rate_for(name: str) -> float:
+    """로거별 샘플링 비율 - LOG_SAMPLE_RATE_<로거명 대문자>로 개별 지정 가능"""
+    return float(os.getenv(f'LOG_SAMPLE_RATE_{name.upper()}', str(_DEFAULT_SAMPLE_RATE)))
+
+
+def setup_logger(name: str, log_file: str = None, level: int = logging.INFO, fmt: str = None):
     """
     로거 설정 함수
+
+    콘솔/파일 핸들러는 QueueListener 백그라운드 스레드에서 실행되고,
+    로거에는 큐에 넣기만 하는 AsyncQueueHandler와 핫 패스 샘플링 필터만 붙음.
     
     Args:
         name: 로거 이름
         log_file: 로그 파일 경로 (None이면 콘솔만 출력)
-        level: 로그 레벨
+        level: 로그 레벨 (LOG_LEVEL_<로거명 대문자> 환경변수가 있으면 우선)
+        fmt: 로그 포맷 (None이면 시간/레벨/로거명 포함 기본 포맷)
     
     Returns:
         설정된 로거 객체
     """
     # 로거 생성
     logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
-    # 이미 핸들러가 설정되어 있다면 중복 설정 방지
-    if logger.handlers:
-        return logger
-    
-    # 한국 시간대 설정
-    korea_tz = pytz.timezone('Asia/Seoul')
-    
-    # 로그 포맷 설정 (한국 시간 포함)
-    formatter = logging.Formatter(
-        fmt='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S %Z'
-    )
-    
-    # 콘솔 핸들러 (항상 출력)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # 파일 핸들러 (log_file이 지정된 경우)
-    if log_file:
-        # 로그 디렉토리 생성
-        log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        # 로그 파일 핸들러 (일별 로테이션)
-        file_handler = logging.handlers.TimedRotatingFileHandler(
-            filename=log_file,
-            when='midnight',
-            interval=1,
-            backupCount=30,  # 30일간 보관
-            encoding='utf-8'
+
+    with _registry_lock:
+        # 이미 핸들러가 설정되어 있다면 중복 설정 방지 (런타임에 변경된 레벨 유지)
+        if logger.handlers:
+            return logger
+
+        logger.setLevel(os.getenv(f'LOG_LEVEL_{name.upper()}', logging.getLevelName(level)).upper())
+
+        # 로그 포맷 설정 (한국 시간 포함)
+        formatter = logging.Formatter(
+            fmt=fmt or '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S %Z'
         )
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        # 콘솔 핸들러 (항상 출력) - 레벨은 로거에서만 판단하므로 핸들러는 NOTSET
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers = [console_handler]
+
+        # 파일 핸들러 (log_file이 지정된 경우)
+        if log_file:
+            # 로그 디렉토리 생성
+            log_dir = os.path.dirname(log_file)
+            if log_dir and not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+
+            # 로그 파일 핸들러 (일별 로테이션)
+            file_handler = logging.handlers.TimedRotatingFileHandler(
+                filename=log_file,
+                when='midnight',
+                interval=1,
+                backupCount=30,  # 30일간 보관
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        log_queue: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+
+        queue_handler = AsyncQueueHandler(log_queue)
+        sampling_filter = SamplingFilter(_sample_rate_for(name))
+        logger.addHandler(queue_handler)
+        logger.addFilter(sampling_filter)
+
+        _listeners[name] = listener
+        _queue_handlers[name] = queue_handler
+        _sampling_filters[name] = sampling_filter
     
     return logger
 
+
+def get_log_levels() -> Dict[str, Dict[str, Any]]:
+    """설정된 로거별 레벨/샘플링 비율/큐 상태 조회"""
+    levels = {}
+    for name, sampling_filter in _sampling_filters.items():
+        queue_handler = _queue_handlers[name]
+        levels[name] = {
+            "level": logging.getLevelName(logging.getLogger(name).level),
+            "sample_rate": sampling_filter.sample_rate,
+            "queue_size": queue_handler.queue.qsize(),
+            "dropped": queue_handler.dropped
+        }
+    return levels
+
+
+def set_log_level(name: str, level: Optional[str] = None, sample_rate: Optional[float] = None) -> Dict[str, Any]:
+    """로거 레벨/핫 패스 샘플링 비율을 런타임에 변경 (재시작 불필요)"""
+    if name not in _sampling_filters:
+        raise KeyError(f"설정되지 않은 로거입니다: {name}")
+    if level is not None:
+        level_value = logging.getLevelName(level.upper())
+        if not isinstance(level_value, int):
+            raise ValueError(f"지원하지 않는 로그 레벨입니다: {level}")
+        logging.getLogger(name).setLevel(level_value)
+    if sample_rate is not None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"sample_rate는 0~1 사이여야 합니다: {sample_rate}")
+        _sampling_filters[name].sample_rate = sample_rate
+    return get_log_levels()[name]
+
+
+def shutdown_logging():
+    """큐에 남은 레코드를 모두 기록하고 리스너 스레드 종료
+
+    로거에서 큐 핸들러/샘플링 필터도 떼어 내므로, 같은 프로세스에서 다시 시작(reload, 테스트에서 앱 재사용)하면
+    setup_logger가 새 큐와 리스너를 만듦 - 그렇지 않으면 아무도 비우지 않는 큐에 레코드가 쌓였다 버려짐
+    """
+    with _registry_lock:
+        for listener in _listeners.values():
+            listener.stop()
+        for name, queue_handler in _queue_handlers.items():
+            logger = logging.getLogger(name)
+            logger.removeHandler(queue_handler)
+            logger.removeFilter(_sampling_filters[name])
+            queue_handler.close()
+        _listeners.clear()
+        _queue_handlers.clear()
+        _sampling_filters.clear()
+
+
+def start_logging():
+    """서비스 로거들의 큐 핸들러/리스너 설정 - shutdown_logging() 이후 다시 시작할 때도 호출"""
+    get_milvus_logger()
+    get_user_activity_logger()
+    get_request_logger()
+
+
 def get_milvus_logger():
     """
     Milvus 서비스용 로거 반환
@@ -81,6 +228,17 @@ def get_user_activity_logger():
     
     return setup_logger("UserActivity", log_file, logging.INFO)
 
+
+def get_request_logger():
+    """
+    요청별 단계 타이밍 로거 반환 - 한 줄에 JSON 객체 하나 (JSON Lines)
+    """
+    # 로그 파일 경로 설정
+    log_dir = "logs"
+    log_file = os.path.join(log_dir, "request_timing.log")
+    
+    return setup_logger("RequestTiming", log_file, logging.INFO, fmt='%(message)s')
+
 # 한국 시간대 설정을 위한 유틸리티 함수
 def get_korea_time():
     """현재 한국 시간을 반환"""
@@ -0,0 +1,118 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional
+
+
+# 대기 시간(ms)용 기본 버킷
+LATENCY_BUCKETS_MS = [0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000]
+# 배치 크기용 기본 버킷
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": "counter", "value": self._value}
+
+
+class Gauge:
+    """임의 값으로 설정 가능한 게이지"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0.0
+
+    def set(self, value: float):
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": "gauge", "value": self._value}
+
+
+class Histogram:
+    """고정 버킷 히스토그램 - 버킷별 개수, 합계, 최솟값/최댓값 기록"""
+
+    def __init__(self, name: str, buckets: List[float]):
+        self.name = name
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self._count = 0
+        self._sum = 0.0
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._count += 1
+            self._sum += value
+            self._min = value if self._min is None else min(self._min, value)
+            self._max = value if self._max is None else max(self._max, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            bucket_counts = {f"le_{bound}": count for bound, count in zip(self.buckets, self._counts)}
+            bucket_counts["le_inf"] = self._counts[-1]
+            return {
+                "type": "histogram",
+                "count": self._count,
+                "sum": self._sum,
+                "avg": self._sum / self._count if self._count else 0.0,
+                "min": self._min,
+                "max": self._max,
+                "buckets": bucket_counts
+            }
+
+
+_registry: Dict[str, Any] = {}
+_registry_lock = threading.Lock()
+
+
+def _get_or_create(name: str, factory):
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = factory()
+            _registry[name] = metric
+        return metric
+
+
+def get_counter(name: str) -> Counter:
+    """이름으로 카운터 조회 (없으면 생성)"""
+    return _get_or_create(name, lambda: Counter(name))
+
+
+def get_gauge(name: str) -> Gauge:
+    """이름으로 게이지 조회 (없으면 생성)"""
+    return _get_or_create(name, lambda: Gauge(name))
+
+
+def get_histogram(name: str, buckets: List[float] = LATENCY_BUCKETS_MS) -> Histogram:
+    """이름으로 히스토그램 조회 (없으면 생성)"""
+    return _get_or_create(name, lambda: Histogram(name, buckets))
+
+
+def get_metrics_snapshot() -> Dict[str, Any]:
+    """등록된 모든 지표의 현재 값 반환"""
+    with _registry_lock:
+        metrics = dict(_registry)
+    return {name: metric.snapshot() for name, metric in sorted(metrics.items())}
@@ -1,77 +1,27 @@
 import asyncio
+import base64
+import json
 import httpx
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from pymilvus import connections, Collection, CollectionSchema, FieldSchema, DataType, utility
-from transformers import AutoTokenizer, AutoModel
-import torch
 import os
-from Services.logger_config import get_milvus_logger, get_user_activity_logger
-
-
-def convert_numpy_types(obj):
-    """numpy 타입을 Python 기본 타입으로 변환"""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    else:
-        return obj
-
-
-def convert_milvus_hit_entity(hit):
-    """Milvus Hit Entity를 JSON 직렬화 가능한 형태로 변환"""
-    logger = get_milvus_logger()
-    try:
-        # hit.entity를 안전하게 변환
-        entity_dict = {}
-        if hasattr(hit, 'entity') and hit.entity:
-            logger.info(f"📋 [ENTITY] hit.entity 타입: {type(hit.entity)}")
-            
-            # entity가 딕셔너리인 경우
-            if isinstance(hit.entity, dict):
-                logger.info(f"📋 [ENTITY] hit.entity 키들: {list(hit.entity.keys())}")
-                for key, value in hit.entity.items():
-                    try:
-                        entity_dict[key] = convert_numpy_types(value)
-                    except Exception as key_error:
-                        logger.warning(f"⚠️ [ENTITY] 키 '{key}' 변환 실패: {str(key_error)}")
-                        entity_dict[key] = str(value)  # 문자열로 변환
-            # entity가 다른 타입인 경우 (Hit 객체 등)
-            else:
-                logger.warning(f"⚠️ [ENTITY] hit.entity가 딕셔너리가 아님: {type(hit.entity)}")
-                # Hit 객체의 속성들을 직접 확인
-                if hasattr(hit.entity, '__dict__'):
-                    for attr_name, attr_value in hit.entity.__dict__.items():
-                        if not attr_name.startswith('_'):  # private 속성 제외
-                            try:
-                                entity_dict[attr_name] = convert_numpy_types(attr_value)
-                            except Exception as attr_error:
-                                logger.warning(f"⚠️ [ENTITY] 속성 '{attr_name}' 변환 실패: {str(attr_error)}")
-                                entity_dict[attr_name] = str(attr_value)
-                else:
-                    entity_dict = {"raw_entity": str(hit.entity)}
-        
-        return {
-            "id": hit.id,
-            "distance": convert_numpy_types(hit.distance),
-            "entity": entity_dict
-        }
-    except Exception as e:
-        # 변환 실패 시 기본 정보만 반환
-        logger.error(f"❌ [ENTITY] Entity 변환 중 오류: {str(e)}")
-        return {
-            "id": getattr(hit, 'id', None),
-            "distance": getattr(hit, 'distance', None),
-            "entity": {},
-            "error": f"Entity 변환 실패: {str(e)}"
-        }
+from Services.logger_config import HOT_PATH, get_milvus_logger, get_user_activity_logger
+from Services.embedding_engine import EmbeddingEngine, EmbeddingModelInfo, DEFAULT_MODEL_NAME, adjust_dimension
+from Services.inference_executor import InferenceExecutor
+from Services.embedding_batcher import EmbeddingBatcher
+from Services.embedding_cache import EmbeddingCache
+from Services.embedding_store import PersistentEmbeddingStore
+from Services.embedding_worker_pool import EmbeddingWorkerPool
+from Services.flush_scheduler import FlushScheduler
+from Services.id_allocator import IdAllocator
+from Services.import_jobs import ImportJobManager
+from Services.ingest_pipeline import IngestPipeline, iterate_batches
+from Services.ndjson_reader import LineTooLongError, iter_lines
+from Services.collection_cache import CollectionMetadataCache
+from Services.vector_codec import decode_float32_buffer
+from Services.result_encoder import encode_search_result
+from Services.request_context import annotate, stage
 
 
 class MilvusService:
@@ -79,10 +29,19 @@ class MilvusService:
         self.connection = None
         self.tokenizer = None
         self.model = None
+        self.embedder = None
+        self.inference = None
+        self.worker_pool = None
         self.logger = get_milvus_logger()
         self.user_logger = get_user_activity_logger()
-        self._initialize_connection()
-        self._initialize_transformer()
+        self.flush_scheduler = FlushScheduler(self._flush_collection_sync)
+        self.id_allocator = IdAllocator()
+        self.import_jobs = ImportJobManager(self)
+        # 컬렉션 핸들/차원/metric 등 메타데이터 캐시 - 요청마다 반복되는 Milvus 조회 제거
+        self.collection_cache = CollectionMetadataCache()
+        # 대량 삽입 시 임베딩/쓰기 파이프라인에 넣는 배치 크기
+        self.ingest_batch_size = int(os.getenv('INGEST_BATCH_SIZE', '256'))
+        # 모델 로드와 Milvus 연결은 import 시점이 아니라 Services.lifecycle에서 백그라운드로 수행
     
     def _initialize_connection(self):
         """Milvus 연결 초기화"""
@@ -102,48 +61,146 @@ class MilvusService:
             self.logger.error(f"❌ [CONNECTION] Milvus 연결 실패: {e}")
             raise
     
+    def _flush_collection_sync(self, collection_name: str):
+        """컬렉션 flush (FlushScheduler가 스레드에서 호출)"""
+        Collection(collection_name).flush()
+    
+    def shutdown(self):
+        """추론 실행기와 Milvus 연결 정리"""
+        if self.inference is not None:
+            self.inference.shutdown(wait=False)
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown(wait=False)
+        if self.connection is not None:
+            connections.disconnect("default")
+            self.connection = None
+    
     def _initialize_transformer(self):
         """Transformer 모델 초기화"""
         try:
-            model_name = "sentence-transformers/all-MiniLM-L6-v2"
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModel.from_pretrained(model_name)
+            model_name = DEFAULT_MODEL_NAME
+            backend_name = os.getenv('EMBEDDING_BACKEND', 'torch').lower()
+            # EMBEDDING_PROCESS_WORKERS가 설정되면 추론은 프로세스별 모델 사본을 가진 워커 풀에서 수행
+            self.worker_pool = EmbeddingWorkerPool.from_env(model_name, backend_name)
+            if self.worker_pool is not None:
+                # 부모 프로세스는 추론하지 않으므로 토크나이저/차원 정보만 로드 (모델 사본과 워밍업은 워커가 담당)
+                self.embedder = EmbeddingModelInfo(model_name, backend=backend_name)
+                self.worker_pool.start()
+            else:
+                self.embedder = EmbeddingEngine(model_name, backend=backend_name)
+            self.tokenizer = self.embedder.tokenizer
+            self.model = self.embedder.model
+            # 워커 풀 사용 시 실행기 스레드는 풀에 작업을 넘기고 기다리기만 하므로, 스레드가 하나뿐이면 동시 요청이
+            # 한 번에 하나씩만 풀에 도달함 - 기본값을 프로세스 수로 맞춰 작은 배치들도 여러 워커에 분산
+            self.inference = InferenceExecutor(
+                default_workers=self.worker_pool.processes if self.worker_pool is not None else 1
+            )
+            self.batcher = EmbeddingBatcher(self._encode_raw)
+            self.embedding_cache = EmbeddingCache()
+            # 백엔드마다 출력이 조금씩 다르므로 저장소는 백엔드별로 분리
+            self.embedding_store = PersistentEmbeddingStore.from_env(
+                f"{model_name}_{self.embedder.backend_name}", self.embedder.dimension
+            )
             self.logger.info(f"🤖 [TRANSFORMER] 모델 로드 성공: {model_name}")
         except Exception as e:
             self.logger.error(f"❌ [TRANSFORMER] 모델 로드 실패: {e}")
+            # 재시도 전에 일부만 만들어진 실행기/워커 풀 정리
+            if self.worker_pool is not None:
+                self.worker_pool.shutdown(wait=False)
+                self.worker_pool = None
+            if self.inference is not None:
+                self.inference.shutdown(wait=False)
+                self.inference = None
             raise
     
+    def _encode_model(self, texts: List[str]) -> np.ndarray:
+        """모델 추론 - 워커 풀이 있으면 워커 프로세스로, 없으면 현재 프로세스에서 실행"""
+        if not texts:
+            return np.empty((0, self.embedder.dimension), dtype=np.float32)
+        if self.worker_pool is not None:
+            return self.worker_pool.encode(texts)
+        return self.embedder.encode(texts)
+    
+    def _encode_with_store(self, texts: List[str], persist: bool = False) -> np.ndarray:
+        """영구 임베딩 저장소에 있는 텍스트는 모델을 건너뛰고, 나머지만 추론
+
+        persist=True(삽입 경로)일 때만 새로 추론한 벡터를 저장 - 쿼리 경로는 읽기 전용이라
+        검색 지연 중에 파일 잠금/fsync가 끼어들지 않음
+        """
+        if self.embedding_store is None:
+            return self._encode_model(texts)
+        
+        found = self.embedding_store.get_many(texts)
+        if len(found) == len(texts):
+            return np.stack([found[i] for i in range(len(texts))])
+        
+        missing_indices = [i for i in range(len(texts)) if i not in found]
+        missing_texts = [texts[i] for i in missing_indices]
+        missing_vectors = self._encode_model(missing_texts)
+        if persist:
+            self.embedding_store.put_many(missing_texts, missing_vectors)
+        
+        vectors = np.empty((len(texts), self.embedder.dimension), dtype=np.float32)
+        for i, vector in found.items():
+            vectors[i] = vector
+        vectors[missing_indices] = missing_vectors
+        return vectors
+    
+    async def _encode_raw(self, texts: List[str], persist: bool = False) -> np.ndarray:
+        """모델 원본 차원의 벡터 배치 생성 - torch 추론은 이벤트 루프 밖의 전용 실행기에서 수행"""
+        return await self.inference.run(self._encode_with_store, texts, persist)
+    
     async def text_to_vector(self, text: str, target_dimension: Optional[int] = None) -> List[float]:
-        """텍스트를 벡터로 변환"""
+        """텍스트를 벡터로 변환 - 동시에 들어온 쿼리는 배치 스케줄러에서 병합되어 한 번에 추론"""
         try:
-            inputs = self.tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
-            
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                embeddings = outputs.last_hidden_state.mean(dim=1)
-                vector = embeddings.squeeze().numpy().tolist()
-            
-            self.logger.info(f"📊 [VECTOR] 원본 벡터 차원: {len(vector)}")
+            # 캐시 키에 모델명과 목표 차원을 포함하여 차원이 다른 컬렉션 간 벡터 공유 방지
+            cache_key = (self.embedder.model_name, text, target_dimension)
+            vector = self.embedding_cache.get(cache_key)
+            if vector is None:
+                raw_vector = await self.batcher.submit(text)
+                vector = adjust_dimension(raw_vector[np.newaxis, :], target_dimension)[0]
+                self.embedding_cache.put(cache_key, vector)
+            return vector.tolist()
+        except Exception as e:
+            self.logger.error(f"❌ [VECTOR] 텍스트 벡터화 실패: {e}")
+            raise
+    
+    async def texts_to_vectors(self, texts: List[str], target_dimension: Optional[int] = None,
+                               persist: bool = False) -> np.ndarray:
+        """여러 텍스트를 배치로 벡터 변환 - (N, dim) float32 배열 반환 (persist=True이면 영구 저장소에 기록)"""
+        try:
+            vectors = await self._encode_raw(texts, persist)
+            self.logger.info(f"📊 [VECTOR] 배치 벡터 변환 - 개수: {len(texts)}, 원본 차원: {vectors.shape[1]}", extra=HOT_PATH)
             
             # target_dimension이 지정된 경우 벡터 차원 조정
-            if target_dimension is not None:
-                self.logger.info(f"📊 [VECTOR] 목표 차원: {target_dimension}")
-                if len(vector) > target_dimension:
-                    # 차원이 큰 경우: 앞쪽부터 잘라내기
-                    vector = vector[:target_dimension]
-                    self.logger.info(f"📊 [VECTOR] 벡터 차원 축소: {len(vector)}")
-                elif len(vector) < target_dimension:
-                    # 차원이 작은 경우: 0으로 패딩
-                    vector.extend([0.0] * (target_dimension - len(vector)))
-                    self.logger.info(f"📊 [VECTOR] 벡터 차원 확장: {len(vector)}")
-                else:
-                    self.logger.info(f"📊 [VECTOR] 벡터 차원 일치: {len(vector)}")
+            if target_dimension is not None and vectors.shape[1] != target_dimension:
+                self.logger.info(f"📊 [VECTOR] 벡터 차원 조정: {vectors.shape[1]} -> {target_dimension}", extra=HOT_PATH)
+                vectors = adjust_dimension(vectors, target_dimension)
             
-            return vector
+            return vectors
         except Exception as e:
             self.logger.error(f"❌ [VECTOR] 텍스트 벡터화 실패: {e}")
             raise
     
+    def _next_primary_key(self, collection: Collection) -> int:
+        """기존 최대 ID + 1 계산 - ID 할당기에 기록이 없는 컬렉션에서 한 번만 호출"""
+        try:
+            max_id = -1
+            iterator = collection.query_iterator(batch_size=16384, expr="id >= 0", output_fields=["id"])
+            try:
+                while True:
+                    batch = iterator.next()
+                    if not batch:
+                        break
+                    max_id = max(max_id, max(row["id"] for row in batch))
+            finally:
+                iterator.close()
+            return max_id + 1
+        except Exception as e:
+            # num_entities는 flush된 행만 세므로 대체값으로 쓰면 ID가 충돌함 - 삽입을 실패시킴
+            self.logger.error(f"❌ [ID_ALLOCATOR] 최대 ID 조회 실패: {e}")
+            raise
+    
     async def create_collection(self, collection_name: str, dimension: int, 
                                metric_type: str = "COSINE", index_type: str = "IVF_FLAT", 
                                index_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -241,6 +298,9 @@ class MilvusService:
                 # 로드 실패해도 컬렉션은 생성됨
                 self.logger.warning(f"⚠️ [CREATE] 컬렉션 로드 실패했지만 컬렉션은 생성됨")
             
+            # 같은 이름으로 이전에 캐시된 메타데이터 제거
+            self.collection_cache.invalidate(collection_name)
+            
             # 사용자 행위 성공 로깅
             self.user_logger.info(f"✅ [USER_SUCCESS] 컬렉션 생성 완료 - 컬렉션명: {collection_name}, 차원: {dimension}, 메트릭: {metric_type}")
             
@@ -263,6 +323,8 @@ class MilvusService:
                 return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
             
             utility.drop_collection(collection_name)
+            self.collection_cache.invalidate(collection_name)
+            self.flush_scheduler.forget(collection_name)
             return {"success": True, "message": f"컬렉션 '{collection_name}' 삭제 완료"}
         except Exception as e:
             return {"success": False, "message": f"컬렉션 삭제 실패: {e}"}
@@ -299,6 +361,8 @@ class MilvusService:
             for collection_name in existing_collections:
                 try:
                     utility.drop_collection(collection_name)
+                    self.collection_cache.invalidate(collection_name)
+                    self.flush_scheduler.forget(collection_name)
                     deleted_collections.append(collection_name)
                 except Exception as e:
                     failed_collections.append({"name": collection_name, "error": str(e)})
@@ -358,7 +422,7 @@ class MilvusService:
             collections_info = []
             for collection_name in collection_names:
                 try:
-                    print(f"📋 [COLLECTIONS] 컬렉션 '{collection_name}' 정보 수집 중...")
+                    self.logger.debug(f"📋 [COLLECTIONS] 컬렉션 '{collection_name}' 정보 수집 중...")
                     
                     # 컬렉션 객체 생성
                     collection = Collection(collection_name)
@@ -382,7 +446,7 @@ class MilvusService:
                                 collection_info["metric_type"] = index_info.params.get('metric_type', 'UNKNOWN')
                                 collection_info["index_type"] = index_info.params.get('index_type', 'UNKNOWN')
                     except Exception as e:
-                        print(f"⚠️ [COLLECTIONS] 컬렉션 '{collection_name}' 인덱스 정보 조회 실패: {str(e)}")
+                        self.logger.warning(f"⚠️ [COLLECTIONS] 컬렉션 '{collection_name}' 인덱스 정보 조회 실패: {str(e)}")
                     
                     # 벡터 차원 정보 조회
                     try:
@@ -391,13 +455,13 @@ class MilvusService:
                                 collection_info["dimension"] = field.params.get("dim")
                                 break
                     except Exception as e:
-                        print(f"⚠️ [COLLECTIONS] 컬렉션 '{collection_name}' 차원 정보 조회 실패: {str(e)}")
+                        self.logger.warning(f"⚠️ [COLLECTIONS] 컬렉션 '{collection_name}' 차원 정보 조회 실패: {str(e)}")
                     
                     collections_info.append(collection_info)
-                    print(f"✅ [COLLECTIONS] 컬렉션 '{collection_name}' 정보 수집 완료")
+                    self.logger.debug(f"✅ [COLLECTIONS] 컬렉션 '{collection_name}' 정보 수집 완료")
                     
                 except Exception as e:
-                    print(f"❌ [COLLECTIONS] 컬렉션 '{collection_name}' 정보 수집 실패: {str(e)}")
+                    self.logger.error(f"❌ [COLLECTIONS] 컬렉션 '{collection_name}' 정보 수집 실패: {str(e)}")
                     # 기본 정보라도 포함
                     collections_info.append({
                         "name": collection_name,
@@ -407,70 +471,70 @@ class MilvusService:
                         "dimension": None
                     })
             
-            print(f"🎉 [COLLECTIONS] 컬렉션 목록 조회 완료: {len(collections_info)}개")
+            self.logger.debug(f"🎉 [COLLECTIONS] 컬렉션 목록 조회 완료: {len(collections_info)}개")
             return {"success": True, "collections": collections_info}
             
         except Exception as e:
-            print(f"❌ [COLLECTIONS] 컬렉션 목록 조회 실패: {str(e)}")
+            self.logger.error(f"❌ [COLLECTIONS] 컬렉션 목록 조회 실패: {str(e)}", exc_info=True)
             return {"success": False, "message": f"컬렉션 조회 실패: {str(e)}"}
     
     async def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
         """컬렉션 정보 조회 (metric_type 포함)"""
         try:
-            print(f"📋 [INFO] 컬렉션 정보 조회 시작 - 컬렉션: {collection_name}")
+            self.logger.debug(f"📋 [INFO] 컬렉션 정보 조회 시작 - 컬렉션: {collection_name}")
             
             # 1단계: 컬렉션 존재 확인
-            print(f"📋 [INFO] 1단계: 컬렉션 존재 확인")
+            self.logger.debug(f"📋 [INFO] 1단계: 컬렉션 존재 확인")
             if not utility.has_collection(collection_name):
-                print(f"❌ [INFO] 컬렉션 '{collection_name}'이 존재하지 않음")
+                self.logger.error(f"❌ [INFO] 컬렉션 '{collection_name}'이 존재하지 않음")
                 return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
-            print(f"✅ [INFO] 컬렉션 '{collection_name}' 존재 확인됨")
+            self.logger.debug(f"✅ [INFO] 컬렉션 '{collection_name}' 존재 확인됨")
             
             # 2단계: 컬렉션 객체 생성
-            print(f"📋 [INFO] 2단계: 컬렉션 객체 생성")
+            self.logger.debug(f"📋 [INFO] 2단계: 컬렉션 객체 생성")
             try:
                 collection = Collection(collection_name)
-                print(f"✅ [INFO] 컬렉션 객체 생성 성공")
+                self.logger.debug(f"✅ [INFO] 컬렉션 객체 생성 성공")
             except Exception as e:
-                print(f"❌ [INFO] 컬렉션 객체 생성 실패: {str(e)}")
+                self.logger.error(f"❌ [INFO] 컬렉션 객체 생성 실패: {str(e)}")
                 return {"success": False, "message": f"컬렉션 객체 생성 실패: {str(e)}"}
             
             # 3단계: 인덱스 정보 조회
-            print(f"📋 [INFO] 3단계: 인덱스 정보 조회")
+            self.logger.debug(f"📋 [INFO] 3단계: 인덱스 정보 조회")
             try:
                 index_info = collection.index()
                 metric_type = None
                 if index_info:
                     # Index 객체의 속성들을 확인
-                    print(f"📋 [INFO] 인덱스 객체 타입: {type(index_info)}")
-                    print(f"📋 [INFO] 인덱스 객체 속성들: {dir(index_info)}")
+                    self.logger.debug(f"📋 [INFO] 인덱스 객체 타입: {type(index_info)}")
+                    self.logger.debug(f"📋 [INFO] 인덱스 객체 속성들: {dir(index_info)}")
                     
                     # metric_type을 안전하게 추출
                     if hasattr(index_info, 'metric_type'):
                         metric_type = index_info.metric_type
                     elif hasattr(index_info, 'params'):
-                        print(f"📋 [INFO] index_info.params 타입: {type(index_info.params)}")
-                        print(f"📋 [INFO] index_info.params 내용: {index_info.params}")
+                        self.logger.debug(f"📋 [INFO] index_info.params 타입: {type(index_info.params)}")
+                        self.logger.debug(f"📋 [INFO] index_info.params 내용: {index_info.params}")
                         if hasattr(index_info.params, 'metric_type'):
                             metric_type = index_info.params.metric_type
                         elif isinstance(index_info.params, dict) and 'metric_type' in index_info.params:
                             metric_type = index_info.params['metric_type']
                         else:
                             metric_type = "UNKNOWN"
-                            print(f"⚠️ [INFO] params에서 metric_type을 찾을 수 없음")
+                            self.logger.warning(f"⚠️ [INFO] params에서 metric_type을 찾을 수 없음")
                     else:
                         metric_type = "UNKNOWN"
-                        print(f"⚠️ [INFO] metric_type을 찾을 수 없음")
+                        self.logger.warning(f"⚠️ [INFO] metric_type을 찾을 수 없음")
                     
-                    print(f"✅ [INFO] 인덱스 정보 조회 성공 - metric_type: {metric_type}")
+                    self.logger.debug(f"✅ [INFO] 인덱스 정보 조회 성공 - metric_type: {metric_type}")
                 else:
-                    print(f"⚠️ [INFO] 인덱스 정보가 없음")
+                    self.logger.warning(f"⚠️ [INFO] 인덱스 정보가 없음")
             except Exception as e:
-                print(f"❌ [INFO] 인덱스 정보 조회 실패: {str(e)}")
+                self.logger.error(f"❌ [INFO] 인덱스 정보 조회 실패: {str(e)}")
                 return {"success": False, "message": f"인덱스 정보 조회 실패: {str(e)}"}
             
             # 4단계: 스키마 정보 조회
-            print(f"📋 [INFO] 4단계: 스키마 정보 조회")
+            self.logger.debug(f"📋 [INFO] 4단계: 스키마 정보 조회")
             try:
                 schema_info = {
                     "fields": [],
@@ -488,12 +552,12 @@ class MilvusService:
                         field_info["params"] = field.params
                     schema_info["fields"].append(field_info)
                 
-                print(f"✅ [INFO] 스키마 정보 조회 성공 - 필드 개수: {len(schema_info['fields'])}")
+                self.logger.debug(f"✅ [INFO] 스키마 정보 조회 성공 - 필드 개수: {len(schema_info['fields'])}")
             except Exception as e:
-                print(f"❌ [INFO] 스키마 정보 조회 실패: {str(e)}")
+                self.logger.error(f"❌ [INFO] 스키마 정보 조회 실패: {str(e)}")
                 return {"success": False, "message": f"스키마 정보 조회 실패: {str(e)}"}
             
-            print(f"🎉 [INFO] 컬렉션 정보 조회 완료 성공!")
+            self.logger.debug(f"🎉 [INFO] 컬렉션 정보 조회 완료 성공!")
             
             # dimension 정보 추출
             dimension = None
@@ -519,8 +583,8 @@ class MilvusService:
             import traceback
             error_message = str(e)
             error_traceback = traceback.format_exc()
-            print(f"💥 [INFO] 예상치 못한 오류 발생: {error_message}")
-            print(f"💥 [INFO] 상세 에러: {error_traceback}")
+            # traceback은 로그 리스너 스레드에서 포맷팅
+            self.logger.error(f"💥 [INFO] 예상치 못한 오류 발생: {error_message}", exc_info=True)
             return {
                 "success": False, 
                 "message": f"컬렉션 정보 조회 실패: {error_message}",
@@ -528,34 +592,142 @@ class MilvusService:
                 "error_traceback": error_traceback
             }
     
+    async def _prepare_insert_vectors(self, data: List[Dict], vector_dimension: int,
+                                      index_offset: int = 0) -> List[Any]:
+        """삽입 데이터 전처리 - text는 배치 벡터 변환, vector/vector_b64는 차원 검증 후 그대로 사용
+
+        처리할 수 없는 항목(필드 누락, 차원 불일치, 변환 실패)은 로그를 남기고 제외
+        """
+        processed_data = []
+        text_items = []
+        
+        for i, item in enumerate(data, start=index_offset):
+            # text가 있으면 배치 벡터 변환 대상으로 수집
+            if "text" in item:
+                # 시스템 필드만 포함 (vector만) - 벡터는 배치 변환 후 채움
+                cleaned_item = {"vector": None}
+                
+                # 추가 메타데이터 필드들 로깅 (무시됨)
+                extra_fields = [key for key in item.keys() if key not in ["text", "vector"]]
+                if extra_fields:
+                    self.logger.warning(f"⚠️ [INSERT] 데이터 {i+1} 추가 메타데이터 필드 무시: {extra_fields}")
+                
+                text_items.append((cleaned_item, item["text"]))
+                processed_data.append(cleaned_item)
+            
+            # base64 인코딩된 little-endian float32 벡터
+            elif "vector_b64" in item:
+                try:
+                    vector = decode_float32_buffer(base64.b64decode(item["vector_b64"]))
+                except Exception as e:
+                    self.logger.error(f"❌ [INSERT] 데이터 {i+1} vector_b64 디코딩 실패: {str(e)}")
+                    continue
+                if len(vector) != vector_dimension:
+                    self.logger.error(f"❌ [INSERT] 데이터 {i+1} 벡터 차원 불일치: {len(vector)} != {vector_dimension}")
+                    continue
+                processed_data.append({"vector": vector})
+            
+            # vector가 직접 제공된 경우
+            elif "vector" in item:
+                vector = item["vector"]
+                if len(vector) != vector_dimension:
+                    self.logger.error(f"❌ [INSERT] 데이터 {i+1} 벡터 차원 불일치: {len(vector)} != {vector_dimension}")
+                    continue
+                
+                cleaned_item = {"vector": vector}
+                processed_data.append(cleaned_item)
+            
+            else:
+                self.logger.error(f"❌ [INSERT] 데이터 {i+1}에 text 또는 vector 필드가 없음")
+                continue
+        
+        # 텍스트 항목은 한 번에 배치 벡터 변환 (내부에서 마이크로 배치 단위로 추론)
+        if text_items:
+            try:
+                # 재수집 시 다시 임베딩하지 않도록 삽입 경로에서만 영구 저장소에 기록
+                vectors = await self.texts_to_vectors([text for _, text in text_items],
+                                                      target_dimension=vector_dimension, persist=True)
+                for (cleaned_item, _), vector in zip(text_items, vectors):
+                    cleaned_item["vector"] = vector
+                self.logger.info(f"📋 [INSERT] 텍스트 -> 벡터 배치 변환 성공 - 개수: {len(text_items)}")
+            except Exception as e:
+                self.logger.error(f"❌ [INSERT] 텍스트 -> 벡터 배치 변환 실패: {str(e)}")
+                processed_data = [item for item in processed_data if item["vector"] is not None]
+        
+        return [item["vector"] for item in processed_data]
+    
+    async def _write_vectors(self, collection_name: str, collection: Collection, vector_values: List[Any]) -> bool:
+        """ID 범위 할당 후 [id, vector] 형식으로 삽입 - flush 여부(durable) 반환"""
+        # ID 할당기에서 연속 ID 범위 할당 (count 조회 없음, 동시 요청/삭제 후에도 중복 없음)
+        start_id = await asyncio.to_thread(
+            self.id_allocator.allocate, collection_name, len(vector_values),
+            lambda: self._next_primary_key(collection)
+        )
+        id_values = list(range(start_id, start_id + len(vector_values)))
+        
+        # PyMilvus 형식으로 데이터 구성 [id, vector]
+        insert_data = [id_values, vector_values]
+        
+        self.logger.info(f"📋 [INSERT] 삽입할 벡터 개수: {len(vector_values)}, 할당된 ID 범위: {id_values[0]} ~ {id_values[-1]}",
+                         extra=HOT_PATH)
+        # 네트워크 쓰기 동안 이벤트 루프(다음 배치 임베딩 등)가 멈추지 않도록 스레드에서 실행
+        await asyncio.to_thread(collection.insert, insert_data)
+        # flush는 정책에 따라 백그라운드에서 모아서 수행
+        return await self.flush_scheduler.record_write(collection_name, len(vector_values))
+    
+    def _ingest_pipeline(self, collection_name: str, collection: Collection, vector_dimension: int) -> IngestPipeline:
+        """배치 k+1 임베딩과 배치 k 삽입을 겹쳐 실행하는 파이프라인 생성"""
+        async def embed(batch, offset: int):
+            # 사전 계산된 벡터 배열은 임베딩 없이 그대로 전달
+            if isinstance(batch, np.ndarray):
+                return batch
+            return await self._prepare_insert_vectors(batch, vector_dimension, index_offset=offset)
+        
+        async def write(vectors) -> bool:
+            return await self._write_vectors(collection_name, collection, vectors)
+        
+        return IngestPipeline(embed, write)
+    
+    def _insert_failure(self, error: Exception, inserted: int, processed_rows: Optional[int], total_rows: int) -> Dict[str, Any]:
+        """배치 삽입 실패 결과 - 이미 삽입된 개수(inserted_count)와 실패한 배치의 입력 범위(failed_batch) 포함
+
+        processed_rows는 쓰기까지 끝난 입력 행 수 (파이프라인 시작 전 실패면 None)
+        """
+        result = {"success": False, "message": f"벡터 삽입 실패: {str(error)}", "inserted_count": inserted}
+        if processed_rows is not None:
+            # 실패한 배치의 입력 인덱스 범위 [start, end) - 이후 배치는 시도하지 않음
+            result["failed_batch"] = {
+                "start": processed_rows,
+                "end": min(processed_rows + self.ingest_batch_size, total_rows)
+            }
+            if inserted:
+                self.logger.warning(f"⚠️ [INSERT] 부분 삽입 - 앞선 배치 {inserted}개는 이미 삽입됨, "
+                                    f"실패 배치 범위: {result['failed_batch']}")
+        return result
+    
     async def insert_vectors(self, collection_name: str, data: List[Dict]) -> Dict[str, Any]:
-        """벡터 데이터 삽입 - 시스템 필드만 사용 (id, vector)"""
+        """벡터 데이터 삽입 - 시스템 필드만 사용 (id, vector)
+
+        배치 단위로 나눠 쓰므로 중간 배치가 실패하면 앞선 배치는 이미 Milvus에 남아 있음.
+        실패 응답에는 이미 삽입된 개수(inserted_count)와 실패한 배치의 입력 범위(failed_batch)를 포함
+        """
+        inserted = 0
+        # 쓰기까지 끝난 입력 행 수 - 파이프라인은 입력 순서대로 진행하므로 다음 배치의 시작 인덱스와 같음
+        processed_rows = 0
+        pipeline_started = False
         try:
             # 사용자 행위 로깅
             self.user_logger.info(f"📥 [USER_ACTION] 벡터 삽입 요청 - 컬렉션: {collection_name}, 데이터 개수: {len(data)}")
             
             self.logger.info(f"📋 [INSERT] 벡터 삽입 시작 - 컬렉션: {collection_name}")
             
-            # 1단계: 컬렉션 존재 확인
-            self.logger.info(f"📋 [INSERT] 1단계: 컬렉션 존재 확인")
-            if not utility.has_collection(collection_name):
+            # 1~3단계: 컬렉션 존재 확인, 로드, 벡터 차원 확인 (메타데이터 캐시)
+            metadata = await self.collection_cache.get(collection_name)
+            if metadata is None:
                 self.logger.error(f"❌ [INSERT] 컬렉션 '{collection_name}'이 존재하지 않음")
                 return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
-            self.logger.info(f"✅ [INSERT] 컬렉션 '{collection_name}' 존재 확인됨")
-            
-            # 2단계: 컬렉션 로드
-            self.logger.info(f"📋 [INSERT] 2단계: 컬렉션 로드")
-            collection = Collection(collection_name)
-            collection.load()
-            self.logger.info(f"✅ [INSERT] 컬렉션 로드 성공")
-            
-            # 3단계: 벡터 차원 확인
-            self.logger.info(f"📋 [INSERT] 3단계: 벡터 차원 확인")
-            vector_dimension = None
-            for field in collection.schema.fields:
-                if field.name == "vector":
-                    vector_dimension = field.params.get("dim")
-                    break
+            collection = metadata.collection
+            vector_dimension = metadata.dimension
             
             if vector_dimension is None:
                 self.logger.error(f"❌ [INSERT] vector 필드의 차원을 찾을 수 없음")
@@ -563,96 +735,187 @@ class MilvusService:
             
             self.logger.info(f"✅ [INSERT] 컬렉션 '{collection_name}'의 vector 차원: {vector_dimension}")
             
-            # 4단계: 데이터 전처리 (시스템 필드만 사용)
-            self.logger.info(f"📋 [INSERT] 4단계: 데이터 전처리 (시스템 필드만 사용)")
-            
-            processed_data = []
-            
-            for i, item in enumerate(data):
-                self.logger.info(f"📋 [INSERT] 데이터 {i+1} 처리 중...")
-                
-                # text가 있으면 벡터로 변환
-                if "text" in item:
-                    try:
-                        vector = await self.text_to_vector(item["text"], target_dimension=vector_dimension)
-                        self.logger.info(f"📋 [INSERT] 데이터 {i+1} 텍스트 -> 벡터 변환 성공 (차원: {len(vector)})")
-                        
-                        # 시스템 필드만 포함 (vector만)
-                        cleaned_item = {"vector": vector}
-                        
-                        # 추가 메타데이터 필드들 로깅 (무시됨)
-                        extra_fields = [key for key in item.keys() if key not in ["text", "vector"]]
-                        if extra_fields:
-                            self.logger.warning(f"⚠️ [INSERT] 데이터 {i+1} 추가 메타데이터 필드 무시: {extra_fields}")
-                        
-                        self.logger.info(f"📋 [INSERT] 데이터 {i+1} 최종 필드: {list(cleaned_item.keys())}")
-                        processed_data.append(cleaned_item)
-                        
-                    except Exception as e:
-                        self.logger.error(f"❌ [INSERT] 데이터 {i+1} 텍스트 -> 벡터 변환 실패: {str(e)}")
-                        continue
-                
-                # vector가 직접 제공된 경우
-                elif "vector" in item:
-                    vector = item["vector"]
-                    if len(vector) != vector_dimension:
-                        self.logger.error(f"❌ [INSERT] 데이터 {i+1} 벡터 차원 불일치: {len(vector)} != {vector_dimension}")
-                        continue
-                    
-                    cleaned_item = {"vector": vector}
-                    self.logger.info(f"📋 [INSERT] 데이터 {i+1} 직접 벡터 사용 (차원: {len(vector)})")
-                    processed_data.append(cleaned_item)
-                
-                else:
-                    self.logger.error(f"❌ [INSERT] 데이터 {i+1}에 text 또는 vector 필드가 없음")
-                    continue
-            
-            if not processed_data:
+            # 4~5단계: 데이터 전처리(임베딩)와 ID 할당/삽입을 배치 단위 파이프라인으로 실행
+            self.logger.info(f"📋 [INSERT] 4단계: 데이터 전처리 및 삽입 (배치 크기: {self.ingest_batch_size})")
+            pipeline = self._ingest_pipeline(collection_name, collection, vector_dimension)
+            durable = False
+            pipeline_started = True
+            async for batch, vectors, written in pipeline.run(iterate_batches(data, self.ingest_batch_size)):
+                processed_rows += len(batch)
+                if len(vectors):
+                    inserted += len(vectors)
+                    durable = written
+            
+            if not inserted:
                 self.logger.error(f"❌ [INSERT] 처리 가능한 데이터가 없음")
                 return {"success": False, "message": "처리 가능한 데이터가 없습니다."}
             
-            # 5단계: PyMilvus 형식으로 데이터 변환
-            self.logger.info(f"📋 [INSERT] 5단계: PyMilvus 형식으로 데이터 변환")
-            
-            # 현재 컬렉션의 벡터 개수를 확인하여 다음 ID 계산
-            current_count = collection.num_entities
-            self.logger.info(f"📋 [INSERT] 현재 컬렉션 벡터 개수: {current_count}")
-            
-            # ID와 vector 필드를 별도로 처리
-            id_values = []
-            vector_values = []
-            
-            for i, item in enumerate(processed_data):
-                # 0부터 시작하는 순차 ID 할당
-                new_id = current_count + i
-                id_values.append(new_id)
-                vector_values.append(item["vector"])
-                self.logger.info(f"📋 [INSERT] 데이터 {i+1}에 ID {new_id} 할당")
-            
-            # PyMilvus 형식으로 데이터 구성 [id, vector]
-            insert_data = [id_values, vector_values]
-            
-            self.logger.info(f"📋 [INSERT] 삽입할 벡터 개수: {len(vector_values)}")
-            self.logger.info(f"📋 [INSERT] 할당된 ID 범위: {id_values[0]} ~ {id_values[-1]}")
-            
-            # 6단계: 데이터 삽입
-            self.logger.info(f"📋 [INSERT] 6단계: 데이터 삽입")
-            collection.insert(insert_data)
-            collection.flush()
-            
-            self.logger.info(f"✅ [INSERT] 벡터 삽입 완료: {len(processed_data)}개")
+            self.logger.info(f"✅ [INSERT] 벡터 삽입 완료: {inserted}개")
             
             # 사용자 행위 성공 로깅
-            self.user_logger.info(f"✅ [USER_SUCCESS] 벡터 삽입 완료 - 컬렉션: {collection_name}, 삽입된 벡터 개수: {len(processed_data)}")
+            self.user_logger.info(f"✅ [USER_SUCCESS] 벡터 삽입 완료 - 컬렉션: {collection_name}, 삽입된 벡터 개수: {inserted}")
             
-            return {"success": True, "message": f"{len(processed_data)}개의 벡터 삽입 완료"}
+            return {
+                "success": True,
+                "message": f"{inserted}개의 벡터 삽입 완료",
+                "durable": durable,
+                "flush_policy": self.flush_scheduler.policy
+            }
             
         except Exception as e:
             # 사용자 행위 실패 로깅
             self.user_logger.error(f"❌ [USER_FAILURE] 벡터 삽입 실패 - 컬렉션: {collection_name}, 오류: {str(e)}")
             
             self.logger.error(f"❌ [INSERT] 벡터 삽입 중 예외 발생: {str(e)}")
-            return {"success": False, "message": f"벡터 삽입 실패: {str(e)}"}
+            self.collection_cache.invalidate(collection_name)
+            return self._insert_failure(e, inserted, processed_rows if pipeline_started else None, len(data))
+    
+    async def insert_vector_array(self, collection_name: str, vectors: np.ndarray) -> Dict[str, Any]:
+        """사전 계산된 (N, dim) 벡터 배열 삽입 - 바이너리/.npy 업로드용, 리스트 변환 없이 연속 배열 그대로 전달
+
+        /vector/insert와 같이 INGEST_BATCH_SIZE 단위로 나눠 배치마다 ID 블록 할당과 insert 호출을 수행
+        (한 번의 RPC가 Milvus 메시지 크기 제한을 넘지 않도록). 중간 배치가 실패하면 inserted_count/failed_batch 보고
+        """
+        inserted = 0
+        processed_rows = 0
+        pipeline_started = False
+        try:
+            self.user_logger.info(f"📥 [USER_ACTION] 바이너리 벡터 삽입 요청 - 컬렉션: {collection_name}, shape: {vectors.shape}")
+            
+            metadata = await self.collection_cache.get(collection_name)
+            if metadata is None:
+                return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
+            collection = metadata.collection
+            vector_dimension = metadata.dimension
+            
+            if vectors.ndim == 1 and vector_dimension and vectors.size % vector_dimension == 0:
+                vectors = vectors.reshape(-1, vector_dimension)
+            if vectors.ndim != 2 or vectors.shape[1] != vector_dimension:
+                return {"success": False, "message": f"벡터 shape 불일치: {vectors.shape}, 컬렉션 차원: {vector_dimension}"}
+            if len(vectors) == 0:
+                return {"success": False, "message": "처리 가능한 데이터가 없습니다."}
+            
+            # float32 C-연속 배열이면 복사 없이 그대로 사용 (배치는 행 단위 슬라이스 뷰)
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            # 사전 계산된 배열은 파이프라인의 임베딩 단계를 그대로 통과
+            pipeline = self._ingest_pipeline(collection_name, collection, vector_dimension)
+            durable = False
+            pipeline_started = True
+            async for batch, _, written in pipeline.run(iterate_batches(vectors, self.ingest_batch_size)):
+                processed_rows += len(batch)
+                inserted += len(batch)
+                durable = written
+            
+            self.user_logger.info(f"✅ [USER_SUCCESS] 바이너리 벡터 삽입 완료 - 컬렉션: {collection_name}, 삽입된 벡터 개수: {inserted}")
+            return {
+                "success": True,
+                "message": f"{inserted}개의 벡터 삽입 완료",
+                "durable": durable,
+                "flush_policy": self.flush_scheduler.policy
+            }
+        except Exception as e:
+            self.user_logger.error(f"❌ [USER_FAILURE] 바이너리 벡터 삽입 실패 - 컬렉션: {collection_name}, 오류: {str(e)}")
+            self.logger.error(f"❌ [INSERT] 바이너리 벡터 삽입 중 예외 발생: {str(e)}")
+            self.collection_cache.invalidate(collection_name)
+            return self._insert_failure(e, inserted, processed_rows if pipeline_started else None, len(vectors))
+    
+    async def insert_vectors_stream(self, collection_name: str, chunks: AsyncIterator[bytes],
+                                    batch_size: int = 256) -> AsyncIterator[Dict[str, Any]]:
+        """NDJSON 스트리밍 삽입 - 업로드를 줄 단위로 파싱하며 batch_size개씩 임베딩/삽입하고 진행 상황을 yield
+
+        전체 본문을 메모리에 올리지 않으므로 업로드 크기와 무관하게 최대 메모리는 배치 하나 수준으로 유지됨.
+        한 줄이 NDJSON_MAX_LINE_BYTES를 넘으면 LineTooLongError를 그대로 전달
+        """
+        self.user_logger.info(f"📥 [USER_ACTION] 스트리밍 벡터 삽입 요청 - 컬렉션: {collection_name}, 배치 크기: {batch_size}")
+        
+        metadata = await self.collection_cache.get(collection_name)
+        if metadata is None:
+            yield {"type": "error", "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
+            return
+        
+        collection = metadata.collection
+        vector_dimension = metadata.dimension
+        if vector_dimension is None:
+            yield {"type": "error", "message": "vector 필드의 차원을 찾을 수 없습니다."}
+            return
+        
+        received = 0
+        inserted = 0
+        batch_index = 0
+        durable = False
+        # 파싱 단계에서 발생한 오류 - 다음 진행 상황 보고 전에 응답으로 내보냄
+        parse_errors: List[Dict[str, Any]] = []
+        
+        async def parsed_batches() -> AsyncIterator[Any]:
+            nonlocal received
+            batch: List[Dict] = []
+            # 한 줄 길이는 NDJSON_MAX_LINE_BYTES로 제한 - 줄바꿈 없는 업로드도 버퍼가 무한정 커지지 않음
+            async for line in iter_lines(chunks):
+                line = line.strip()
+                if not line:
+                    continue
+                received += 1
+                try:
+                    item = json.loads(line)
+                    if not isinstance(item, dict):
+                        raise ValueError("JSON 객체가 아닙니다")
+                except ValueError as e:
+                    self.logger.error(f"❌ [INSERT_STREAM] {received}번째 줄 파싱 실패: {e}")
+                    parse_errors.append({"type": "error", "line": received, "message": f"파싱 실패: {e}"})
+                    continue
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    yield batch, received - len(batch)
+                    batch = []
+            
+            if batch:
+                yield batch, received - len(batch)
+        
+        try:
+            # 파싱/임베딩 단계와 삽입 단계를 파이프라인으로 겹쳐 실행
+            pipeline = self._ingest_pipeline(collection_name, collection, vector_dimension)
+            # 파싱 단계가 앞서 읽을 수 있으므로 skipped는 삽입 단계까지 처리된 행 기준으로 계산
+            processed = 0
+            async for batch, vectors, written in pipeline.run(parsed_batches()):
+                while parse_errors:
+                    processed += 1
+                    yield parse_errors.pop(0)
+                batch_index += 1
+                processed += len(batch)
+                if len(vectors):
+                    inserted += len(vectors)
+                    durable = written
+                yield {
+                    "type": "progress",
+                    "batch": batch_index,
+                    "received": received,
+                    "inserted": inserted,
+                    "skipped": processed - inserted,
+                    "durable": durable
+                }
+            while parse_errors:
+                yield parse_errors.pop(0)
+            
+            self.user_logger.info(f"✅ [USER_SUCCESS] 스트리밍 벡터 삽입 완료 - 컬렉션: {collection_name}, 삽입된 벡터 개수: {inserted}")
+            yield {
+                "type": "summary",
+                "success": True,
+                "received": received,
+                "inserted": inserted,
+                "skipped": received - inserted,
+                "durable": durable,
+                "flush_policy": self.flush_scheduler.policy
+            }
+        except LineTooLongError as e:
+            # 라우터가 응답 시작 전이면 413, 이후면 실패 요약으로 변환
+            self.user_logger.error(f"❌ [USER_FAILURE] 스트리밍 벡터 삽입 실패 - 컬렉션: {collection_name}, 오류: {str(e)}")
+            raise
+        except Exception as e:
+            self.user_logger.error(f"❌ [USER_FAILURE] 스트리밍 벡터 삽입 실패 - 컬렉션: {collection_name}, 오류: {str(e)}")
+            self.logger.error(f"❌ [INSERT_STREAM] 스트리밍 삽입 중 예외 발생: {str(e)}")
+            self.collection_cache.invalidate(collection_name)
+            yield {"type": "summary", "success": False, "received": received, "inserted": inserted,
+                   "message": f"스트리밍 벡터 삽입 실패: {str(e)}"}
     
     async def reset_collection_ids(self, collection_name: str) -> Dict[str, Any]:
         """컬렉션의 ID를 0부터 시작하도록 리셋 (주의: 모든 데이터 재삽입 필요)"""
@@ -679,7 +942,8 @@ class MilvusService:
             
             # 3단계: 기존 컬렉션 삭제
             utility.drop_collection(collection_name)
-            print(f"✅ [RESET] 기존 컬렉션 삭제 완료")
+            self.collection_cache.invalidate(collection_name)
+            self.logger.info(f"✅ [RESET] 기존 컬렉션 삭제 완료")
             
             # 4단계: 새 컬렉션 생성 (auto_id=False)
             try:
@@ -688,11 +952,11 @@ class MilvusService:
                 port = os.getenv('MILVUS_PORT', '19530')
                 uri = f"http://{host}:{port}"
                 
-                print(f"📋 [RESET] Milvus 연결 시도: {uri}")
+                self.logger.debug(f"📋 [RESET] Milvus 연결 시도: {uri}")
                 
                 from pymilvus import AsyncMilvusClient
                 async_client = AsyncMilvusClient(uri=uri, token="")
-                print(f"✅ [RESET] AsyncMilvusClient 생성 성공")
+                self.logger.debug(f"✅ [RESET] AsyncMilvusClient 생성 성공")
                 
                 # 컬렉션 스키마 정보 복원
                 dimension = len(results[0]["vector"])
@@ -711,13 +975,10 @@ class MilvusService:
                         "params": {"nlist": 1024}
                     }
                 )
-                print(f"✅ [RESET] 새 컬렉션 생성 완료")
+                self.logger.debug(f"✅ [RESET] 새 컬렉션 생성 완료")
                 
             except Exception as e:
-                print(f"❌ [RESET] 새 컬렉션 생성 실패: {str(e)}")
-                print(f"❌ [RESET] 에러 타입: {type(e).__name__}")
-                import traceback
-                print(f"❌ [RESET] 상세 에러: {traceback.format_exc()}")
+                self.logger.error(f"❌ [RESET] 새 컬렉션 생성 실패: {type(e).__name__}: {str(e)}", exc_info=True)
                 return {"success": False, "message": f"새 컬렉션 생성 실패: {str(e)}"}
             
             # 5단계: 데이터 재삽입 (0부터 시작하는 ID)
@@ -731,127 +992,153 @@ class MilvusService:
             collection.insert(insert_data)
             collection.flush()
             
-            print(f"✅ [RESET] 데이터 재삽입 완료 - ID 범위: 0 ~ {len(results)-1}")
+            # ID 할당기의 high-water mark는 그대로 유지 - 다음 삽입은 기존 mark부터 할당되어
+            # 재삽입된 0 ~ N-1 구간이나 다른 워커가 예약해 둔 블록과 겹치지 않음
+            self.flush_scheduler.forget(collection_name)
+            self.collection_cache.invalidate(collection_name)
+            
+            self.logger.info(f"✅ [RESET] 데이터 재삽입 완료 - ID 범위: 0 ~ {len(results)-1}")
             return {"success": True, "message": f"컬렉션 ID 리셋 완료. 새로운 ID 범위: 0 ~ {len(results)-1}"}
             
         except Exception as e:
-            print(f"❌ [RESET] ID 리셋 중 예외 발생: {str(e)}")
+            self.logger.error(f"❌ [RESET] ID 리셋 중 예외 발생: {str(e)}", exc_info=True)
             return {"success": False, "message": f"ID 리셋 실패: {str(e)}"}
     
-    async def delete_vectors(self, collection_name: str, ids: List[int]) -> Dict[str, Any]:
-        """벡터 데이터 삭제"""
+    async def flush_collection(self, collection_name: str) -> Dict[str, Any]:
+        """컬렉션 명시적 flush - 대기 중인 삽입/삭제를 즉시 영구 봉인"""
         try:
+            self.user_logger.info(f"💾 [USER_ACTION] 컬렉션 flush 요청 - 컬렉션: {collection_name}")
+            
             if not utility.has_collection(collection_name):
                 return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
             
-            collection = Collection(collection_name)
-            collection.load()
+            # never 정책은 명시적 요청도 flush하지 않음 (explicit과의 차이)
+            if self.flush_scheduler.policy == "never":
+                return {"success": True, "message": f"flush 정책이 never이므로 컬렉션 '{collection_name}'을 flush하지 않았습니다.", "durable": False}
+            
+            await self.flush_scheduler.flush(collection_name, force=True)
+            return {"success": True, "message": f"컬렉션 '{collection_name}' flush 완료", "durable": True}
+        except Exception as e:
+            self.logger.error(f"❌ [FLUSH] 컬렉션 flush 실패: {str(e)}")
+            return {"success": False, "message": f"컬렉션 flush 실패: {e}"}
+    
+    async def delete_vectors(self, collection_name: str, ids: List[int]) -> Dict[str, Any]:
+        """벡터 데이터 삭제"""
+        try:
+            metadata = await self.collection_cache.get(collection_name)
+            if metadata is None:
+                return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
             
             expr = f"id in {ids}"
-            collection.delete(expr)
-            collection.flush()
+            await asyncio.to_thread(metadata.collection.delete, expr)
+            durable = await self.flush_scheduler.record_write(collection_name, len(ids))
             
-            return {"success": True, "message": f"{len(ids)}개의 벡터 삭제 완료"}
+            return {
+                "success": True,
+                "message": f"{len(ids)}개의 벡터 삭제 완료",
+                "durable": durable,
+                "flush_policy": self.flush_scheduler.policy
+            }
         except Exception as e:
+            self.collection_cache.invalidate(collection_name)
             return {"success": False, "message": f"벡터 삭제 실패: {e}"}
     
-    async def get_vectors(self, collection_name: str, limit: int = 100) -> Dict[str, Any]:
-        """벡터 데이터 조회"""
+    def _resolve_output_fields(self, metadata, output_fields: Optional[List[str]],
+                               include_vectors: bool) -> List[str]:
+        """요청된 출력 필드 결정 - 기본은 없음(id/distance만), 벡터는 include_vectors일 때만 포함
+
+        "*"는 벡터를 제외한 모든 스칼라 필드로 확장
+        """
+        fields = []
+        for name in output_fields or []:
+            if name == "*":
+                fields.extend(metadata.scalar_fields)
+            elif name != "vector":
+                fields.append(name)
+        fields = list(dict.fromkeys(fields))
+        if include_vectors:
+            fields.append("vector")
+        return fields
+    
+    async def get_vectors(self, collection_name: str, limit: int = 100,
+                          output_fields: Optional[List[str]] = None,
+                          include_vectors: bool = False) -> Dict[str, Any]:
+        """벡터 데이터 조회 - 기본은 id만 반환, 벡터는 include_vectors=True일 때만 포함"""
         try:
-            if not utility.has_collection(collection_name):
+            annotate("collection", collection_name)
+            metadata = await self.collection_cache.get(collection_name)
+            if metadata is None:
                 return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
             
-            collection = Collection(collection_name)
-            collection.load()
-            
-            results = collection.query(
-                expr="",
-                output_fields=["*"],
-                limit=limit
-            )
-            
-            # numpy 타입을 Python 기본 타입으로 변환
-            converted_results = convert_numpy_types(results)
+            with stage("query"):
+                results = await asyncio.to_thread(
+                    metadata.collection.query,
+                    expr="",
+                    output_fields=self._resolve_output_fields(metadata, output_fields, include_vectors) or ["id"],
+                    limit=limit
+                )
             
-            return {"success": True, "vectors": converted_results}
+            # numpy 값은 변환하지 않음 - 응답 클래스(NumpyORJSONResponse)가 직접 직렬화
+            return {"success": True, "vectors": results}
         except Exception as e:
+            self.collection_cache.invalidate(collection_name)
             return {"success": False, "message": f"벡터 조회 실패: {e}"}
     
-    async def search_vectors(self, collection_name: str, query_text: str, 
-                           search_params: Dict, limit: int = 10) -> Dict[str, Any]:
-        """벡터 검색"""
+    async def _fetch_vectors_by_ids(self, collection: Collection, ids: List[int]) -> Dict[int, List[float]]:
+        """기본키로 저장된 벡터 조회 - {id: vector}"""
+        rows = await asyncio.to_thread(
+            collection.query,
+            expr=f"id in {list(ids)}",
+            output_fields=["id", "vector"]
+        )
+        return {row["id"]: row["vector"] for row in rows}
+    
+    async def search_vectors(self, collection_name: str, query_text: Optional[str], 
+                           search_params: Dict, limit: int = 10,
+                           query_vector: Optional[List[float]] = None,
+                           ids: Optional[List[int]] = None,
+                           output_fields: Optional[List[str]] = None,
+                           include_vectors: bool = False) -> Dict[str, Any]:
+        """벡터 검색 - 쿼리는 query_text(임베딩), query_vector(원시 벡터), ids(저장된 벡터) 중 하나로 지정
+
+        query_vector/ids 검색은 모델 추론을 거치지 않음. ids 검색 결과의 각 항목에는 query_id가 포함되며,
+        쿼리로 사용한 자기 자신은 결과에서 제외됨.
+        결과는 기본적으로 id/distance만 포함하며, output_fields/include_vectors로 필드를 추가
+        """
+        if query_vector is not None:
+            query_desc = f"벡터({len(query_vector)}차원)"
+        elif ids:
+            query_desc = f"ids={ids}"
+        else:
+            query_desc = f"'{query_text}'"
         try:
             # 사용자 행위 로깅
-            self.user_logger.info(f"🔍 [USER_ACTION] 벡터 검색 요청 - 컬렉션: {collection_name}, 쿼리: '{query_text}', limit: {limit}")
+            self.user_logger.info(f"🔍 [USER_ACTION] 벡터 검색 요청 - 컬렉션: {collection_name}, 쿼리: {query_desc}, limit: {limit}")
             
-            self.logger.info(f"🔍 [SEARCH] 검색 시작 - 컬렉션: {collection_name}, 쿼리: '{query_text}', limit: {limit}")
+            self.logger.info(f"🔍 [SEARCH] 검색 시작 - 컬렉션: {collection_name}, 쿼리: {query_desc}, limit: {limit}", extra=HOT_PATH)
             
-            # 1단계: 컬렉션 존재 확인
-            self.logger.info(f"📋 [SEARCH] 1단계: 컬렉션 존재 확인")
-            if not utility.has_collection(collection_name):
-                self.logger.error(f"❌ [SEARCH] 컬렉션 '{collection_name}'이 존재하지 않음")
-                return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
-            self.logger.info(f"✅ [SEARCH] 컬렉션 '{collection_name}' 존재 확인됨")
-            
-            # 2단계: 컬렉션 객체 생성
-            self.logger.info(f"📋 [SEARCH] 2단계: 컬렉션 객체 생성")
-            try:
-                collection = Collection(collection_name)
-                self.logger.info(f"✅ [SEARCH] 컬렉션 객체 생성 성공")
-            except Exception as e:
-                self.logger.error(f"❌ [SEARCH] 컬렉션 객체 생성 실패: {str(e)}")
-                return {"success": False, "message": f"컬렉션 객체 생성 실패: {str(e)}"}
-            
-            # 3단계: 컬렉션 로드
-            self.logger.info(f"📋 [SEARCH] 3단계: 컬렉션 로드")
-            try:
-                collection.load()
-                self.logger.info(f"✅ [SEARCH] 컬렉션 로드 성공")
-            except Exception as e:
-                self.logger.error(f"❌ [SEARCH] 컬렉션 로드 실패: {str(e)}")
-                return {"success": False, "message": f"컬렉션 로드 실패: {str(e)}"}
+            query_modes = sum(1 for mode in (query_text, query_vector, ids) if mode)
+            if query_modes != 1:
+                return {"success": False, "message": "query_text, query_vector, ids 중 정확히 하나를 지정해야 합니다."}
             
-            # 4단계: 인덱스 정보 확인
-            print(f"📋 [SEARCH] 4단계: 인덱스 정보 확인")
+            # 1~4단계: 컬렉션 존재 확인, 컬렉션 객체/로드, 인덱스 정보 (메타데이터 캐시 - 캐시 적중 시 Milvus 조회 없음)
+            annotate("collection", collection_name)
             try:
-                index_info = collection.index()
-                collection_metric_type = None
-                if index_info:
-                    # Index 객체의 속성들을 확인
-                    print(f"📋 [SEARCH] 인덱스 객체 타입: {type(index_info)}")
-                    print(f"📋 [SEARCH] 인덱스 객체 속성들: {dir(index_info)}")
-                    
-                    # metric_type을 안전하게 추출
-                    if hasattr(index_info, 'metric_type'):
-                        collection_metric_type = index_info.metric_type
-                    elif hasattr(index_info, 'params'):
-                        print(f"📋 [SEARCH] index_info.params 타입: {type(index_info.params)}")
-                        print(f"📋 [SEARCH] index_info.params 내용: {index_info.params}")
-                        if hasattr(index_info.params, 'metric_type'):
-                            collection_metric_type = index_info.params.metric_type
-                        elif isinstance(index_info.params, dict) and 'metric_type' in index_info.params:
-                            collection_metric_type = index_info.params['metric_type']
-                        else:
-                            collection_metric_type = "UNKNOWN"
-                            print(f"⚠️ [SEARCH] params에서 metric_type을 찾을 수 없음")
-                    else:
-                        collection_metric_type = "UNKNOWN"
-                        print(f"⚠️ [SEARCH] metric_type을 찾을 수 없음")
-                    
-                    print(f"✅ [SEARCH] 인덱스 정보 확인됨 - metric_type: {collection_metric_type}")
-                else:
-                    print(f"⚠️ [SEARCH] 인덱스 정보가 없음")
+                metadata = await self.collection_cache.get(collection_name)
             except Exception as e:
-                print(f"❌ [SEARCH] 인덱스 정보 확인 실패: {str(e)}")
-                return {"success": False, "message": f"인덱스 정보 확인 실패: {str(e)}"}
+                self.logger.error(f"❌ [SEARCH] 컬렉션 메타데이터 조회 실패: {str(e)}")
+                return {"success": False, "message": f"컬렉션 메타데이터 조회 실패: {str(e)}"}
+            if metadata is None:
+                self.logger.error(f"❌ [SEARCH] 컬렉션 '{collection_name}'이 존재하지 않음")
+                return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
+            collection = metadata.collection
+            collection_metric_type = metadata.metric_type
             
             # 5단계: metric_type 검증
-            print(f"📋 [SEARCH] 5단계: metric_type 검증")
             requested_metric_type = search_params.get("metric_type", "L2")
-            print(f"📋 [SEARCH] 요청된 metric_type: {requested_metric_type}, 컬렉션 metric_type: {collection_metric_type}")
             
             if collection_metric_type and requested_metric_type.upper() != collection_metric_type.upper():
-                print(f"❌ [SEARCH] metric_type 불일치")
+                self.logger.warning(f"❌ [SEARCH] metric_type 불일치")
                 return {
                     "success": False, 
                     "message": f"Metric type 불일치: 컬렉션 '{collection_name}'은 '{collection_metric_type}' 방식으로 생성되었습니다. "
@@ -862,76 +1149,89 @@ class MilvusService:
                     "requested_metric_type": requested_metric_type,
                     "available_metric_types": ["L2", "IP", "COSINE"]
                 }
-            print(f"✅ [SEARCH] metric_type 검증 통과")
             
             # 6단계: 벡터 차원 확인
-            print(f"📋 [SEARCH] 6단계: 벡터 차원 확인")
-            try:
-                vector_dimension = None
-                for field in collection.schema.fields:
-                    if field.name == "vector":
-                        vector_dimension = field.params.get("dim")
-                        break
-                print(f"✅ [SEARCH] 벡터 차원 확인됨: {vector_dimension}")
-            except Exception as e:
-                print(f"❌ [SEARCH] 벡터 차원 확인 실패: {str(e)}")
-                return {"success": False, "message": f"벡터 차원 확인 실패: {str(e)}"}
+            vector_dimension = metadata.dimension
             
-            # 7단계: 쿼리 벡터 생성
-            print(f"📋 [SEARCH] 7단계: 쿼리 벡터 생성")
+            # 7단계: 쿼리 벡터 준비 (원시 벡터/저장된 벡터는 모델 추론 생략)
+            self.logger.debug(f"📋 [SEARCH] 7단계: 쿼리 벡터 준비")
+            query_ids: List[int] = []
             try:
-                query_vector = await self.text_to_vector(query_text, target_dimension=vector_dimension)
-                print(f"✅ [SEARCH] 쿼리 벡터 생성 성공 - 차원: {len(query_vector)}")
+                if query_vector is not None:
+                    if len(query_vector) != vector_dimension:
+                        return {"success": False, "message": f"쿼리 벡터 차원 불일치: {len(query_vector)} != {vector_dimension}"}
+                    query_vectors = [query_vector]
+                elif ids:
+                    with stage("fetch_vectors"):
+                        stored_vectors = await self._fetch_vectors_by_ids(collection, ids)
+                    query_ids = [id_value for id_value in dict.fromkeys(ids) if id_value in stored_vectors]
+                    if not query_ids:
+                        return {"success": False, "message": f"지정한 ID의 벡터를 찾을 수 없습니다: {ids}"}
+                    query_vectors = [stored_vectors[id_value] for id_value in query_ids]
+                else:
+                    with stage("embed"):
+                        query_vectors = [await self.text_to_vector(query_text, target_dimension=vector_dimension)]
+                self.logger.debug(f"✅ [SEARCH] 쿼리 벡터 준비 완료 - 쿼리 개수: {len(query_vectors)}")
             except Exception as e:
-                print(f"❌ [SEARCH] 쿼리 벡터 생성 실패: {str(e)}")
+                self.logger.error(f"❌ [SEARCH] 쿼리 벡터 준비 실패: {str(e)}")
                 return {"success": False, "message": f"쿼리 벡터 생성 실패: {str(e)}"}
             
             # 8단계: 검색 파라미터 설정
-            print(f"📋 [SEARCH] 8단계: 검색 파라미터 설정")
+            self.logger.debug(f"📋 [SEARCH] 8단계: 검색 파라미터 설정")
             try:
                 params = search_params.get("params", {"nprobe": 10})
                 search_params_final = {
                     "metric_type": requested_metric_type.upper(),
                     "params": params
                 }
-                print(f"✅ [SEARCH] 검색 파라미터 설정 완료: {search_params_final}")
+                self.logger.debug(f"✅ [SEARCH] 검색 파라미터 설정 완료: {search_params_final}")
             except Exception as e:
-                print(f"❌ [SEARCH] 검색 파라미터 설정 실패: {str(e)}")
+                self.logger.error(f"❌ [SEARCH] 검색 파라미터 설정 실패: {str(e)}")
                 return {"success": False, "message": f"검색 파라미터 설정 실패: {str(e)}"}
             
             # 9단계: Milvus 검색 실행
-            print(f"📋 [SEARCH] 9단계: Milvus 검색 실행")
+            self.logger.debug(f"📋 [SEARCH] 9단계: Milvus 검색 실행")
+            resolved_fields = self._resolve_output_fields(metadata, output_fields, include_vectors)
             try:
-                results = collection.search(
-                    data=[query_vector],
-                    anns_field="vector",
-                    param=search_params_final,
-                    limit=limit,
-                    output_fields=["*"]
-                )
-                print(f"✅ [SEARCH] Milvus 검색 실행 성공 - 결과 개수: {len(results) if results else 0}")
+                with stage("search"):
+                    # 검색 RPC 동안 이벤트 루프(마이크로 배처, 스트리밍 수집 등)가 멈추지 않도록 스레드에서 실행
+                    results = await asyncio.to_thread(
+                        collection.search,
+                        data=query_vectors,
+                        anns_field="vector",
+                        param=search_params_final,
+                        # ids 검색은 자기 자신을 제외하므로 하나 더 조회
+                        limit=limit + 1 if query_ids else limit,
+                        output_fields=resolved_fields
+                    )
+                self.logger.debug(f"✅ [SEARCH] Milvus 검색 실행 성공 - 결과 개수: {len(results) if results else 0}")
             except Exception as e:
-                print(f"❌ [SEARCH] Milvus 검색 실행 실패: {str(e)}")
-                import traceback
-                print(f"❌ [SEARCH] 상세 에러: {traceback.format_exc()}")
+                self.logger.error(f"❌ [SEARCH] Milvus 검색 실행 실패: {str(e)}", exc_info=True)
+                # 컬렉션이 외부에서 삭제/해제되었을 수 있으므로 캐시된 메타데이터 제거
+                self.collection_cache.invalidate(collection_name)
                 return {"success": False, "message": f"Milvus 검색 실행 실패: {str(e)}"}
             
             # 10단계: 결과 포맷팅
-            print(f"📋 [SEARCH] 10단계: 결과 포맷팅")
+            self.logger.debug(f"📋 [SEARCH] 10단계: 결과 포맷팅")
             try:
-                formatted_results = []
-                for hits in results:
-                    for hit in hits:
-                        formatted_results.append(convert_milvus_hit_entity(hit))
-                print(f"✅ [SEARCH] 결과 포맷팅 완료 - 포맷된 결과 개수: {len(formatted_results)}")
+                with stage("format"):
+                    formatted_results = []
+                    for query_index, hits in enumerate(encode_search_result(results, resolved_fields)):
+                        if query_ids:
+                            query_id = query_ids[query_index]
+                            query_hits = [hit for hit in hits if hit["id"] != query_id][:limit]
+                            formatted_results.extend({"query_id": query_id, **hit} for hit in query_hits)
+                        else:
+                            formatted_results.extend(hits)
+                self.logger.debug(f"✅ [SEARCH] 결과 포맷팅 완료 - 포맷된 결과 개수: {len(formatted_results)}")
             except Exception as e:
-                print(f"❌ [SEARCH] 결과 포맷팅 실패: {str(e)}")
+                self.logger.error(f"❌ [SEARCH] 결과 포맷팅 실패: {str(e)}")
                 return {"success": False, "message": f"결과 포맷팅 실패: {str(e)}"}
             
             # 사용자 행위 성공 로깅
-            self.user_logger.info(f"✅ [USER_SUCCESS] 벡터 검색 완료 - 컬렉션: {collection_name}, 쿼리: '{query_text}', 결과 개수: {len(formatted_results)}")
+            self.user_logger.info(f"✅ [USER_SUCCESS] 벡터 검색 완료 - 컬렉션: {collection_name}, 쿼리: {query_desc}, 결과 개수: {len(formatted_results)}")
             
-            self.logger.info(f"🎉 [SEARCH] 검색 완료 성공! - 결과 개수: {len(formatted_results)}")
+            self.logger.info(f"🎉 [SEARCH] 검색 완료 성공! - 결과 개수: {len(formatted_results)}", extra=HOT_PATH)
             return {"success": True, "results": formatted_results}
             
         except Exception as e:
@@ -940,9 +1240,10 @@ class MilvusService:
             error_traceback = traceback.format_exc()
             
             # 사용자 행위 실패 로깅
-            self.user_logger.error(f"❌ [USER_FAILURE] 벡터 검색 실패 - 컬렉션: {collection_name}, 쿼리: '{query_text}', 오류: {error_message}")
+            self.user_logger.error(f"❌ [USER_FAILURE] 벡터 검색 실패 - 컬렉션: {collection_name}, 쿼리: {query_desc}, 오류: {error_message}")
             
             self.logger.error(f"💥 [SEARCH] 예상치 못한 오류 발생: {error_message}")
+            self.collection_cache.invalidate(collection_name)
             self.logger.error(f"💥 [SEARCH] 상세 에러: {error_traceback}")
             
             if "metric type not match" in error_message.lower():
@@ -961,6 +1262,98 @@ class MilvusService:
                     "error_traceback": error_traceback
                 }
 
+    
+    async def search_vectors_batch(self, collection_name: str, query_texts: Optional[List[str]],
+                                   search_params: Dict, limit: int = 10,
+                                   query_vectors: Optional[List[List[float]]] = None,
+                                   output_fields: Optional[List[str]] = None,
+                                   include_vectors: bool = False) -> Dict[str, Any]:
+        """여러 쿼리(텍스트 및/또는 벡터)를 한 번의 배치 임베딩과 한 번의 검색(nq>1)으로 처리
+
+        결과는 query_texts 순서, 이어서 query_vectors 순서로 쿼리별로 그룹화하여 반환
+        """
+        query_texts = query_texts or []
+        query_vectors = query_vectors or []
+        query_count = len(query_texts) + len(query_vectors)
+        try:
+            self.user_logger.info(f"🔍 [USER_ACTION] 다중 벡터 검색 요청 - 컬렉션: {collection_name}, "
+                                  f"텍스트 쿼리: {len(query_texts)}, 벡터 쿼리: {len(query_vectors)}, limit: {limit}")
+            
+            if not query_count:
+                return {"success": False, "message": "검색할 쿼리가 지정되지 않았습니다."}
+            
+            annotate("collection", collection_name)
+            annotate("query_count", query_count)
+            metadata = await self.collection_cache.get(collection_name)
+            if metadata is None:
+                self.logger.error(f"❌ [SEARCH_BATCH] 컬렉션 '{collection_name}'이 존재하지 않음")
+                return {"success": False, "message": f"컬렉션 '{collection_name}'이 존재하지 않습니다."}
+            collection = metadata.collection
+            
+            # metric_type 검증
+            collection_metric_type = metadata.metric_type
+            requested_metric_type = search_params.get("metric_type", "L2")
+            if collection_metric_type and requested_metric_type.upper() != collection_metric_type.upper():
+                return {
+                    "success": False,
+                    "message": f"Metric type 불일치: 컬렉션 '{collection_name}'은 '{collection_metric_type}' 방식으로 생성되었습니다. "
+                              f"현재 요청된 방식: '{requested_metric_type}'",
+                    "collection_metric_type": collection_metric_type,
+                    "requested_metric_type": requested_metric_type,
+                    "available_metric_types": ["L2", "IP", "COSINE"]
+                }
+            
+            vector_dimension = metadata.dimension
+            query_matrix = np.empty((query_count, vector_dimension), dtype=np.float32)
+            # 원시 벡터 쿼리는 차원 검증 후 그대로 사용
+            if query_vectors:
+                raw_vectors = np.asarray(query_vectors, dtype=np.float32)
+                if raw_vectors.ndim != 2 or raw_vectors.shape[1] != vector_dimension:
+                    return {"success": False,
+                            "message": f"쿼리 벡터 차원 불일치: {raw_vectors.shape}, 컬렉션 차원: {vector_dimension}"}
+                query_matrix[len(query_texts):] = raw_vectors
+            # 텍스트 쿼리는 한 번의 배치 임베딩으로 변환
+            if query_texts:
+                with stage("embed"):
+                    query_matrix[:len(query_texts)] = await self.texts_to_vectors(query_texts, target_dimension=vector_dimension)
+            
+            search_params_final = {
+                "metric_type": requested_metric_type.upper(),
+                "params": search_params.get("params", {"nprobe": 10})
+            }
+            resolved_fields = self._resolve_output_fields(metadata, output_fields, include_vectors)
+            with stage("search"):
+                results = await asyncio.to_thread(
+                    collection.search,
+                    data=query_matrix,
+                    anns_field="vector",
+                    param=search_params_final,
+                    limit=limit,
+                    output_fields=resolved_fields
+                )
+            
+            # 쿼리별로 결과 그룹화
+            with stage("format"):
+                grouped_results = []
+                for query_index, hits in enumerate(encode_search_result(results, resolved_fields)):
+                    group = {"query_index": query_index}
+                    if query_index < len(query_texts):
+                        group["query_text"] = query_texts[query_index]
+                    else:
+                        group["query_vector_index"] = query_index - len(query_texts)
+                    group["results"] = hits
+                    grouped_results.append(group)
+            
+            self.user_logger.info(f"✅ [USER_SUCCESS] 다중 벡터 검색 완료 - 컬렉션: {collection_name}, 쿼리 개수: {query_count}")
+            self.logger.info(f"🎉 [SEARCH_BATCH] 다중 검색 완료 - 쿼리 개수: {len(grouped_results)}", extra=HOT_PATH)
+            return {"success": True, "results": grouped_results}
+            
+        except Exception as e:
+            self.user_logger.error(f"❌ [USER_FAILURE] 다중 벡터 검색 실패 - 컬렉션: {collection_name}, 오류: {str(e)}")
+            self.logger.error(f"💥 [SEARCH_BATCH] 다중 검색 중 예외 발생: {str(e)}")
+            self.collection_cache.invalidate(collection_name)
+            return {"success": False, "message": f"다중 벡터 검색 실패: {str(e)}"}
+
 
 # 싱글톤 인스턴스
 milvus_service = MilvusService() 
\ No newline at end of file
@@ -0,0 +1,98 @@
+import asyncio
+import os
+from typing import AsyncIterator, Optional
+
+
+class LineTooLongError(ValueError):
+    """NDJSON 한 줄이 최대 길이(NDJSON_MAX_LINE_BYTES)를 넘을 때 발생"""
+
+    def __init__(self, line_number: int, max_line_bytes: int):
+        super().__init__(f"{line_number}번째 줄이 최대 길이 {max_line_bytes}바이트를 초과합니다.")
+        self.line_number = line_number
+        self.max_line_bytes = max_line_bytes
+
+
+def _max_line_bytes() -> int:
+    return int(os.getenv('NDJSON_MAX_LINE_BYTES', str(8 * 1024 * 1024)))
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: Optional[int] = None) -> AsyncIterator[bytes]:
+    """바이트 청크 스트림을 줄 단위로 분리
+
+    줄바꿈은 새로 들어온 청크에서만 찾으므로 전체 처리량은 업로드 크기에 비례(O(n))하고,
+    아직 끝나지 않은 줄이 max_line_bytes를 넘으면 LineTooLongError를 발생시켜 버퍼가 무한정 커지지 않음
+    """
+    max_line_bytes = max_line_bytes or _max_line_bytes()
+    pending = bytearray()
+    line_number = 0
+    async for chunk in chunks:
+        view = memoryview(chunk)
+        start = 0
+        while True:
+            newline = chunk.find(b"\n", start)
+            if newline < 0:
+                break
+            line_number += 1
+            if len(pending) + newline - start > max_line_bytes:
+                raise LineTooLongError(line_number, max_line_bytes)
+            pending += view[start:newline]
+            yield bytes(pending)
+            pending.clear()
+            start = newline + 1
+        if len(pending) + len(chunk) - start > max_line_bytes:
+            raise LineTooLongError(line_number + 1, max_line_bytes)
+        pending += view[start:]
+    if pending:
+        yield bytes(pending)
+
+
+class BufferedChunkReader:
+    """비동기 청크 소스(요청 본문 등)를 생산자 태스크에서 읽어 제한된 asyncio.Queue로 전달
+
+    StreamingResponse의 본문 생성기 안에서 request.stream()을 직접 읽으면, Starlette의
+    listen_for_disconnect가 같은 receive 채널의 http.request 메시지를 가로채 본문 청크가 유실됨.
+    본문은 이 리더의 생산자 태스크만 읽고, 응답은 done 이벤트 이후에만 연결 종료를 감시해야 함.
+    큐는 STREAM_BODY_QUEUE_CHUNKS개로 제한되어 소비가 늦으면 본문 읽기도 대기(backpressure).
+    """
+
+    def __init__(self, source: AsyncIterator[bytes], max_chunks: Optional[int] = None):
+        self.source = source
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_chunks or int(os.getenv('STREAM_BODY_QUEUE_CHUNKS', '16')))
+        # 본문을 끝까지 읽었거나(또는 실패/취소) 더 이상 receive 채널을 읽지 않음
+        self.done = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._produce())
+
+    async def _produce(self):
+        try:
+            async for chunk in self.source:
+                if chunk:
+                    await self.queue.put(chunk)
+            await self.queue.put(None)
+        except Exception as e:
+            await self.queue.put(e)
+        finally:
+            self.done.set()
+
+    async def _iterate(self) -> AsyncIterator[bytes]:
+        self.start()
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iterate()
+
+    async def aclose(self):
+        """생산자 태스크 중단 (소비자가 먼저 끝난 경우 큐 대기에서 풀어줌)"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self.done.set()
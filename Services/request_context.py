@@ -0,0 +1,94 @@
+import contextvars
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+import orjson
+from Services.logger_config import format_korea_time, get_request_logger
+
+
+class RequestTimings:
+    """요청 하나의 단계별 소요 시간(ms)과 부가 정보
+
+    단계 이름: exists(컬렉션 존재 확인), load(컬렉션 로드), metadata(스키마/인덱스 조회),
+    embed(쿼리 임베딩), fetch_vectors(ids 검색용 벡터 조회), search, query, format, serialize 등.
+    같은 단계가 여러 번 실행되면 소요 시간을 합산.
+    """
+
+    def __init__(self, request_id: str, method: str, path: str):
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.started_at = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.fields: Dict[str, Any] = {}
+
+    def add(self, stage: str, elapsed_ms: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + elapsed_ms
+
+    def to_record(self, status_code: int) -> Dict[str, Any]:
+        total_ms = (time.perf_counter() - self.started_at) * 1000
+        return {
+            "timestamp": format_korea_time(),
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "status": status_code,
+            "total_ms": round(total_ms, 3),
+            "stages": {stage: round(elapsed_ms, 3) for stage, elapsed_ms in self.stages.items()},
+            **self.fields
+        }
+
+
+# asyncio 태스크와 asyncio.to_thread로 실행되는 스레드에 자동으로 전달됨
+_current_request: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar(
+    "current_request", default=None
+)
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+def start_request(request_id: str, method: str, path: str) -> contextvars.Token:
+    """요청 타이밍 컨텍스트 시작 - 반환된 토큰은 end_request()에 전달"""
+    return _current_request.set(RequestTimings(request_id, method, path))
+
+
+def current_request() -> Optional[RequestTimings]:
+    return _current_request.get()
+
+
+def end_request(token: contextvars.Token, status_code: int) -> Optional[Dict[str, Any]]:
+    """요청 타이밍 컨텍스트 종료 후 구조화된 JSON 로그 한 줄 기록"""
+    timings = _current_request.get()
+    _current_request.reset(token)
+    if timings is None:
+        return None
+    record = timings.to_record(status_code)
+    get_request_logger().info(orjson.dumps(record).decode())
+    return record
+
+
+def record_stage(name: str, elapsed_ms: float):
+    """현재 요청에 단계 소요 시간 추가 - 요청 컨텍스트 밖(백그라운드 작업 등)이면 무시"""
+    timings = _current_request.get()
+    if timings is not None:
+        timings.add(name, elapsed_ms)
+
+
+def annotate(key: str, value: Any):
+    """현재 요청 로그에 부가 정보 추가 (예: collection, collection_cache)"""
+    timings = _current_request.get()
+    if timings is not None:
+        timings.fields[key] = value
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """with stage("search"): ... 구간의 소요 시간을 현재 요청에 기록 (await를 포함해도 됨)"""
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, (time.perf_counter() - started_at) * 1000)
@@ -0,0 +1,35 @@
+import numpy as np
+import orjson
+from typing import Any
+from fastapi.responses import JSONResponse
+from Services.request_context import stage
+
+
+# numpy 배열/스칼라는 변환 없이 orjson이 직접 직렬화, dict의 정수 키 허용
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """orjson이 직접 처리하지 못하는 타입 변환"""
+    if isinstance(obj, np.ndarray):
+        # 연속 배열이 아니거나 지원하지 않는 dtype인 경우
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """orjson + numpy 직렬화"""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class NumpyORJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 - numpy float32 배열과 np.int64 ID를 Python 객체로 변환하지 않고 바로 인코딩
+
+    라우터에서 이 응답 객체를 직접 반환하면 FastAPI의 jsonable_encoder 단계도 건너뜀
+    """
+
+    def render(self, content: Any) -> bytes:
+        with stage("serialize"):
+            return dumps(content)
@@ -0,0 +1,61 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def _hit_entity(hit: Any) -> Any:
+    if isinstance(hit, dict):
+        return hit.get("entity")
+    return getattr(hit, "entity", None)
+
+
+def _entity_value(entity: Any, field: str) -> Any:
+    if entity is None:
+        return None
+    if hasattr(entity, "get"):
+        return entity.get(field)
+    return getattr(entity, field, None)
+
+
+def _hits_columns(hits: Any):
+    """Hits에서 id/distance 열 추출 - pymilvus가 열 단위 접근(ids/distances)을 제공하면 그대로 사용
+
+    numpy 값은 변환하지 않고 그대로 두며, 직렬화는 응답 클래스(NumpyORJSONResponse)가 담당
+    """
+    ids = getattr(hits, "ids", None)
+    distances = getattr(hits, "distances", None)
+    if ids is None or distances is None:
+        ids = [hit["id"] if isinstance(hit, dict) else hit.id for hit in hits]
+        distances = [hit["distance"] if isinstance(hit, dict) else hit.distance for hit in hits]
+    return ids, distances
+
+
+def encode_hits(hits: Any, output_fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """한 쿼리의 Hits를 [{"id", "distance", "entity"?}] 목록으로 변환
+
+    - id/distance는 열 단위로 읽음
+    - output_fields가 있으면 필드별 열을 모음 (값 변환 없음 - numpy 값은 응답 직렬화 단계에서 바로 인코딩)
+    - 핫 패스이므로 로깅하지 않음
+    """
+    ids, distances = _hits_columns(hits)
+    fields = list(output_fields or [])
+    if not fields:
+        return [{"id": id_value, "distance": distance} for id_value, distance in zip(ids, distances)]
+
+    entities = [_hit_entity(hit) for hit in hits]
+    columns = {}
+    for field in fields:
+        columns[field] = [_entity_value(entity, field) for entity in entities]
+
+    encoded = []
+    for row, (id_value, distance) in enumerate(zip(ids, distances)):
+        encoded.append({
+            "id": id_value,
+            "distance": distance,
+            "entity": {field: columns[field][row] for field in fields}
+        })
+    return encoded
+
+
+def encode_search_result(results: Any, output_fields: Optional[Iterable[str]] = None) -> List[List[Dict[str, Any]]]:
+    """SearchResult(쿼리별 Hits 목록)를 쿼리별 결과 목록으로 변환"""
+    fields = list(output_fields or [])
+    return [encode_hits(hits, fields) for hits in results]
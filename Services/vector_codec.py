@@ -0,0 +1,29 @@
+import io
+import numpy as np
+from typing import Optional
+
+
+def decode_float32_buffer(buffer: bytes, dimension: Optional[int] = None) -> np.ndarray:
+    """little-endian float32 원시 버퍼를 복사 없이 (N, dim) 배열로 해석"""
+    if len(buffer) % 4:
+        raise ValueError(f"float32 버퍼 길이가 4의 배수가 아닙니다: {len(buffer)} bytes")
+    vectors = np.frombuffer(buffer, dtype="<f4")
+    if dimension is None:
+        return vectors
+    if vectors.size % dimension:
+        raise ValueError(f"벡터 개수를 계산할 수 없습니다: 원소 {vectors.size}개, 차원 {dimension}")
+    return vectors.reshape(-1, dimension)
+
+
+def decode_npy_buffer(buffer: bytes) -> np.ndarray:
+    """.npy 바이트를 헤더만 파싱하고 데이터 영역은 복사 없이 배열로 해석"""
+    stream = io.BytesIO(buffer)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject:
+        raise ValueError("object dtype의 .npy는 지원하지 않습니다.")
+    array = np.frombuffer(buffer, dtype=dtype, count=int(np.prod(shape)), offset=stream.tell())
+    return array.reshape(shape, order="F" if fortran_order else "C")
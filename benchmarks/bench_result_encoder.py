@@ -0,0 +1,167 @@
+"""검색 결과 인코딩 벤치마크 - 기존 hit 단위 변환(convert_milvus_hit_entity) 대비 결과 인코더의 hit당 비용 비교
+
+인코딩만 비교한 뒤, 응답 직렬화까지 포함한 비용(기존: 변환 + 표준 json, 현재: 인코더 + orjson numpy 직렬화)도 비교
+
+Milvus 없이 pymilvus SearchResult와 같은 모양의 가짜 결과를 만들어 측정
+(Hit: entity를 가진 dict, Hits: ids/distances 열 접근을 제공하는 list)
+
+    python benchmarks/bench_result_encoder.py --queries 10 --limit 100 --dim 384
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Services.result_encoder import encode_search_result  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FakeHit(dict):
+    @property
+    def id(self):
+        return self["id"]
+
+    @property
+    def distance(self):
+        return self["distance"]
+
+    @property
+    def entity(self):
+        return self["entity"]
+
+
+class FakeHits(list):
+    @property
+    def ids(self):
+        return [hit["id"] for hit in self]
+
+    @property
+    def distances(self):
+        return [hit["distance"] for hit in self]
+
+
+def make_results(queries: int, limit: int, dim: int, numpy_vectors: bool = False):
+    rng = np.random.default_rng(0)
+    results = []
+    for query in range(queries):
+        hits = FakeHits()
+        for rank in range(limit):
+            vector = rng.random(dim, dtype=np.float32)
+            id_value = query * limit + rank
+            hits.append(FakeHit(
+                id=id_value,
+                distance=np.float32(rng.random()),
+                entity={"id": np.int64(id_value), "vector": vector if numpy_vectors else vector.tolist()}
+            ))
+        results.append(hits)
+    return results
+
+
+def make_legacy_logger(path: str) -> logging.Logger:
+    """기존 MilvusService 로거와 같은 구성 (콘솔 대신 파일만 - 출력이 벤치마크 결과를 가리지 않도록)"""
+    logger = logging.getLogger("bench.legacy")
+    logger.setLevel(logging.INFO)
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s'))
+    logger.addHandler(handler)
+    return logger
+
+
+def legacy_convert_numpy_types(obj):
+    if isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        return float(obj)
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, dict):
+        return {key: legacy_convert_numpy_types(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [legacy_convert_numpy_types(item) for item in obj]
+    return obj
+
+
+def legacy_convert_hit(hit, logger):
+    """기존 convert_milvus_hit_entity의 hit당 처리 (로깅 + 재귀 변환)"""
+    entity_dict = {}
+    if hasattr(hit, 'entity') and hit.entity:
+        logger.info(f"📋 [ENTITY] hit.entity 타입: {type(hit.entity)}")
+        if isinstance(hit.entity, dict):
+            logger.info(f"📋 [ENTITY] hit.entity 키들: {list(hit.entity.keys())}")
+            for key, value in hit.entity.items():
+                entity_dict[key] = legacy_convert_numpy_types(value)
+    return {
+        "id": hit.id,
+        "distance": legacy_convert_numpy_types(hit.distance),
+        "entity": entity_dict
+    }
+
+
+def measure(label: str, func, total_hits: int, repeat: int):
+    func()  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+    best = min(timings)
+    print(f"{label:<40} {best * 1000:9.2f} ms/검색  {best / total_hits * 1e6:8.2f} us/hit")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=1, help="검색당 쿼리 수 (nq)")
+    parser.add_argument("--limit", type=int, default=100, help="쿼리당 hit 수")
+    parser.add_argument("--dim", type=int, default=384, help="벡터 차원")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (최솟값 보고)")
+    parser.add_argument("--numpy-vectors", action="store_true", help="벡터를 float32 numpy 배열로 생성")
+    args = parser.parse_args()
+
+    results = make_results(args.queries, args.limit, args.dim, args.numpy_vectors)
+    total_hits = args.queries * args.limit
+    print(f"nq={args.queries}, limit={args.limit}, dim={args.dim}, hits={total_hits}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        logger = make_legacy_logger(os.path.join(tmp_dir, "legacy.log"))
+        legacy = measure("기존 (hit별 로깅 + 재귀 변환, 벡터 포함)",
+                         lambda: [[legacy_convert_hit(hit, logger) for hit in hits] for hits in results],
+                         total_hits, args.repeat)
+        legacy_serialized = measure("기존 + 표준 json 직렬화",
+                                    lambda: json.dumps([[legacy_convert_hit(hit, logger) for hit in hits]
+                                                        for hits in results]).encode(),
+                                    total_hits, args.repeat)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+    with_vectors = measure("결과 인코더 (벡터 포함)",
+                           lambda: encode_search_result(results, ["id", "vector"]),
+                           total_hits, args.repeat)
+    id_distance = measure("결과 인코더 (id/distance만)",
+                          lambda: encode_search_result(results),
+                          total_hits, args.repeat)
+    print(f"속도 향상: 벡터 포함 {legacy / with_vectors:.1f}x, id/distance만 {legacy / id_distance:.1f}x")
+
+    if orjson is None:
+        print("orjson이 설치되어 있지 않아 직렬화 비교는 건너뜀")
+        return
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    serialized = measure("결과 인코더 + orjson 직렬화 (벡터 포함)",
+                         lambda: orjson.dumps(encode_search_result(results, ["id", "vector"]), option=options),
+                         total_hits, args.repeat)
+    print(f"직렬화 포함 속도 향상: {legacy_serialized / serialized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,34 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from Routers import collection_router, vector_router
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from Routers import collection_router, vector_router, job_router, logging_router
+from Services.lifecycle import lifecycle
+from Services.logger_config import shutdown_logging, start_logging
+from Services.metrics import get_metrics_snapshot
+from Services.request_context import end_request, new_request_id, start_request
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """모델 로드와 Milvus 연결은 백그라운드에서 진행 - 서버는 즉시 요청을 받기 시작"""
+    # 이전 lifespan의 shutdown_logging()으로 떼어 낸 큐 핸들러를 다시 설정 (reload, 앱 재사용)
+    start_logging()
+    lifecycle.start()
+    yield
+    await lifecycle.shutdown()
+    # 로그 큐에 남은 레코드 기록 후 리스너 스레드 종료
+    shutdown_logging()
+
 
 app = FastAPI(
     title="Milvus Vector DB API",
     description="Milvus Vector Database CRUD API with FastAPI",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -17,9 +40,54 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 타이밍 로그에서 제외할 경로 (헬스 체크/지표 수집 프로브)
+REQUEST_LOG_EXCLUDE_PATHS = set(
+    path.strip() for path in os.getenv('REQUEST_LOG_EXCLUDE_PATHS', '/health,/health/live,/health/ready,/metrics').split(',')
+    if path.strip()
+)
+
+
+class RequestTimingMiddleware:
+    """요청별 타이밍 컨텍스트 - 단계별 소요 시간을 모아 요청당 JSON 로그 한 줄(logs/request_timing.log) 기록
+
+    요청 ID는 X-Request-ID 헤더를 따르고, 없으면 새로 발급해 응답 헤더로 돌려줌.
+    BaseHTTPMiddleware(@app.middleware)는 본문 생성 전에 반환되고 자체 StreamingResponse로 receive 채널을
+    읽어 스트리밍 업로드 본문을 가로채므로, 순수 ASGI 미들웨어로 앱 호출(스트리밍 본문 전송 포함)이
+    끝난 뒤에 기록
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in REQUEST_LOG_EXCLUDE_PATHS:
+            await self.app(scope, receive, send)
+            return
+        request_id = Headers(scope=scope).get("x-request-id") or new_request_id()
+        token = start_request(request_id, scope["method"], scope["path"])
+        status_code = 500
+
+        async def send_with_request_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            end_request(token, status_code)
+
+
+app.add_middleware(RequestTimingMiddleware)
+
+
 # 라우터 등록
 app.include_router(collection_router.router)
 app.include_router(vector_router.router)
+app.include_router(job_router.router)
+app.include_router(logging_router.router)
 
 # 디버깅용 엔드포인트
 @app.get("/debug/routes")
@@ -53,6 +121,28 @@ async def health_check():
     return {"status": "healthy", "message": "API 서버가 정상적으로 실행 중입니다."}
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness 프로브 - 프로세스가 요청을 처리할 수 있으면 항상 200"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness 프로브 - 모델 로드와 Milvus 연결이 모두 끝나야 200, 그 전에는 503"""
+    status = lifecycle.status()
+    if status["ready"]:
+        return {"status": "ready", **status}
+    return JSONResponse(status_code=503, content={"status": "not_ready", **status})
+
+
+
+@app.get("/metrics")
+async def metrics():
+    """성능 지표 조회 엔드포인트 (임베딩 배치 크기, 대기 시간 히스토그램 등)"""
+    return {"status": "success", "metrics": get_metrics_snapshot()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -176,7 +176,8 @@ class MilvusAPI:
         """벡터 데이터 조회"""
         try:
             response = self.session.get(f"{self.base_url}/vector/vectors", 
-                                      params={"collection_name": collection_name, "limit": limit}, timeout=15)
+                                      params={"collection_name": collection_name, "limit": limit,
+                                              "include_vectors": True}, timeout=15)
             return {"success": True, "data": response.json()}
         except Exception as e:
             return {"success": False, "error": str(e)}